@@ -8,7 +8,7 @@ such as database sessions, current user, settings, etc.
 from collections.abc import Generator
 from uuid import UUID
 
-from fastapi import Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -33,11 +33,15 @@ def get_db() -> Generator[Session, None, None]:
     """
     Database session dependency.
 
-    Yields a SQLAlchemy session that is closed after the request ends.
+    Yields a SQLAlchemy session that is closed when the route function returns.
     Use in route signatures as:
 
-        def endpoint(db: Session = Depends(get_db)):
+        def endpoint(db: Session = Depends(get_db, scope="function")):
             ...
+
+    `scope="function"` closes the session, returning its pooled connection,
+    before the response is sent and background tasks run; the default request
+    scope would hold the connection for the whole response cycle.
     """
 
     db = SessionLocal()
@@ -107,9 +111,15 @@ def get_current_request_context(
 
 
 def require_admin(
-    context: CurrentRequestContext = Header(None, include_in_schema=False),
+    context: CurrentRequestContext = Depends(get_current_request_context),
 ) -> CurrentRequestContext:
-    """Guard that requires ADMIN role."""
+    """
+    Guard that requires ADMIN role.
+
+    Declared as a router dependency so it runs before per-route dependencies;
+    non-admin requests get 403 without opening a DB session or building
+    services.
+    """
 
     if context.role != "ADMIN":
         raise HTTPException(
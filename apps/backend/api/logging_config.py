@@ -16,12 +16,13 @@ This keeps logging provider-agnostic while making it plug-and-play.
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from api.config import Settings
 
 
@@ -77,14 +78,24 @@ class JsonLogFormatter(logging.Formatter):
         if extra_fields:
             payload["fields"] = extra_fields
 
-        return json.dumps(payload, ensure_ascii=False)
+        # orjson emits UTF-8 natively and serializes UUID/datetime extras; any
+        # other unsupported value falls back to `str`. Non-string dict keys
+        # (e.g. int or UUID keys in an extra) are stringified like `json.dumps`.
+        return orjson.dumps(
+            payload, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
 
+def configure_logging(settings: Settings, logger: logging.Logger | None = None) -> None:
+    """Configure application logging.
 
-def configure_logging(settings: Settings) -> None:
-    """Configure root logging for the application."""
+    Handlers are installed on `logger`, the root logger by default. Uvicorn's
+    loggers are only rerouted when configuring the root logger, since that is
+    where they propagate to.
+    """
 
-    root_logger = logging.getLogger()
-    root_logger.setLevel(settings.log_level)
+    target_logger = logger if logger is not None else logging.getLogger()
+    target_logger.setLevel(settings.log_level)
 
     base_handler = logging.StreamHandler(stream=sys.stdout)
     if settings.log_json:
@@ -100,10 +111,13 @@ def configure_logging(settings: Settings) -> None:
         base_handler.setFormatter(formatter)
 
     # Replace existing handlers to avoid duplicate logs under Uvicorn.
-    root_logger.handlers.clear()
-    root_logger.addHandler(base_handler)
+    target_logger.handlers.clear()
+    target_logger.addHandler(base_handler)
 
-    _configure_optional_providers(settings, root_logger, formatter)
+    _configure_optional_providers(settings, target_logger, formatter)
+
+    if logger is not None:
+        return
 
     # Ensure Uvicorn loggers propagate through the root handler.
     for uvicorn_logger_name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
@@ -1,7 +1,10 @@
 """FastAPI application factory and router wiring."""
 
+from functools import lru_cache
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from api.config import get_settings
 from api.logging_config import configure_logging
@@ -23,6 +26,7 @@ from .routers import (
 )
 
 
+@lru_cache(maxsize=1)
 def create_app() -> FastAPI:
     """
     Application factory for the FastAPI app.
@@ -30,6 +34,10 @@ def create_app() -> FastAPI:
     This keeps app creation centralized so we can
     attach middleware, event handlers, and shared
     configuration in one place.
+
+    Memoized: the module-level `app`, the uvicorn factory and tests all share
+    one instance. Call `create_app.cache_clear()` to rebuild it, e.g. after
+    changing settings.
     """
     app = FastAPI(
         title="LocalBizIntel Backend API",
@@ -41,6 +49,10 @@ def create_app() -> FastAPI:
 
     settings = get_settings()
     configure_logging(settings)
+    # Listing payloads repeat the same keys per row and compress several-fold;
+    # tiny responses are not worth the CPU. Registered before (inside) request
+    # logging so it sees route responses with their real Content-Length.
+    app.add_middleware(GZipMiddleware, minimum_size=512)
     app.add_middleware(RequestLoggingMiddleware, settings=settings)
     if settings.cors_allowed_origins:
         app.add_middleware(
@@ -73,9 +73,13 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         if self._settings.log_request_body:
             extra["request_body"] = request_body_repr
         if self._settings.log_response_body:
-            extra["response_body"] = self._body_bytes_to_repr(
-                response_body_bytes or b"", response.media_type
-            )
+            if "content-encoding" in response.headers:
+                # Compressed (e.g. gzip) bodies are not parseable; log size only.
+                extra["response_body"] = {"_bytes": len(response_body_bytes or b"")}
+            else:
+                extra["response_body"] = self._body_bytes_to_repr(
+                    response_body_bytes or b"", response.media_type
+                )
 
         logger.info("Request completed", extra=extra)
         response.headers["X-Request-Id"] = request_id
@@ -1,13 +1,16 @@
 """Admin API routes for privileged listing and operational views."""
 
+from functools import lru_cache
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import status as http_status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_request_context, get_db
+from api.dependencies import get_db, require_admin
 from api.schemas.admin import (
+    AdminDashboardResponse,
     AdminDatasetsListResponse,
     AdminReportJobsListResponse,
     AdminTenantsListResponse,
@@ -16,28 +19,87 @@ from api.schemas.admin import (
 )
 from api.schemas.core import TenantRead, UserRead
 from api.schemas.reports import ReportJobRead
+from repositories.admin_dashboard_repository import AdminDashboardRepository
 from repositories.data_freshness_repository import DataFreshnessRepository
+from repositories.pagination import Cursor, decode_cursor, encode_cursor
 from repositories.report_jobs_repository import ReportJobsRepository
 from repositories.tenant_repository import TenantRepository
 from repositories.user_repository import UserRepository
 from services.admin_service import AdminService
 from services.dependencies import AdminServiceDependencies
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_admin)])
 
+# Whole-page validators: one call converts a page of ORM rows instead of a
+# per-row `model_validate` loop.
+_USERS_ADAPTER = TypeAdapter(list[UserRead])
+_TENANTS_ADAPTER = TypeAdapter(list[TenantRead])
+_REPORT_JOBS_ADAPTER = TypeAdapter(list[ReportJobRead])
+_DATASETS_ADAPTER = TypeAdapter(list[DataFreshnessRead])
 
+
+def _parse_cursor(cursor: str | None) -> Cursor | None:
+    """Decode the `cursor` query param, rejecting malformed tokens with 400."""
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from exc
+
+
+def _format_cursor(cursor: Cursor | None) -> str | None:
+    return encode_cursor(cursor) if cursor is not None else None
+
+
+@lru_cache(maxsize=1)
 def get_admin_service() -> AdminService:
-    """Construct an `AdminService` with concrete repositories for request DI."""
+    """
+    Return the process-wide `AdminService` for request DI.
+
+    The service and its repositories are stateless (the DB session is passed
+    per call), so one instance is built and shared across requests.
+    """
     return AdminService(
         AdminServiceDependencies(
             user_repository=UserRepository(),
             tenant_repository=TenantRepository(),
             data_freshness_repository=DataFreshnessRepository(),
             report_jobs_repository=ReportJobsRepository(),
+            admin_dashboard_repository=AdminDashboardRepository(),
         )
     )
 
 
+@router.get(
+    "/dashboard",
+    summary="Admin dashboard summary",
+)
+def get_dashboard(
+    db: Session = Depends(get_db, scope="function"),
+    admin_service: AdminService = Depends(get_admin_service),
+) -> AdminDashboardResponse:
+    """
+    Return entity totals and dataset freshness for the admin dashboard.
+
+    Replaces separate users/tenants/report-jobs/datasets calls on dashboard
+    load; all totals are fetched in one query.
+
+    Example:
+        `GET /admin/dashboard`
+    """
+    dashboard = admin_service.get_dashboard(db)
+    return AdminDashboardResponse(
+        counts=dashboard["counts"],
+        datasets=_DATASETS_ADAPTER.validate_python(
+            dashboard["datasets"], from_attributes=True
+        ),
+    )
+
+
 @router.get(
     "/users",
     summary="List users (admin)",
@@ -48,8 +110,8 @@ def list_users(
     tenant_id: UUID | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
-    context=Depends(get_current_request_context),
+    cursor: str | None = Query(default=None),
+    db: Session = Depends(get_db, scope="function"),
     admin_service: AdminService = Depends(get_admin_service),
 ) -> AdminUsersListResponse:
     """
@@ -60,18 +122,21 @@ def list_users(
     - `role`: role string (e.g., "ADMIN", "USER")
     - `tenant_id`: UUID of tenant
     - `limit`/`offset`: pagination
+    - `cursor`: `next_cursor` from a previous page (keyset pagination; takes
+      precedence over `offset`)
+
+    Offset pages include `total`, the number of users matching the filters.
 
     Example:
         `GET /admin/users?role=ADMIN&limit=50`
     """
-    if context.role != "ADMIN":
-        raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Admin role required",
-        )
-    users = admin_service.list_users(db, email, role, tenant_id, limit, offset)
+    result = admin_service.list_users(
+        db, email, role, tenant_id, limit, offset, cursor=_parse_cursor(cursor)
+    )
     return AdminUsersListResponse(
-        users=[UserRead.model_validate(user) for user in users]
+        users=_USERS_ADAPTER.validate_python(result["items"], from_attributes=True),
+        total=result["total"],
+        next_cursor=_format_cursor(result["next_cursor"]),
     )
 
 
@@ -84,8 +149,8 @@ def list_tenants(
     plan: str | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
-    context=Depends(get_current_request_context),
+    cursor: str | None = Query(default=None),
+    db: Session = Depends(get_db, scope="function"),
     admin_service: AdminService = Depends(get_admin_service),
 ) -> AdminTenantsListResponse:
     """
@@ -94,18 +159,18 @@ def list_tenants(
     Optional filters:
     - `name`: partial name match
     - `plan`: plan code (e.g., "starter", "pro")
+    - `cursor`: `next_cursor` from a previous page (keyset pagination)
 
     Example:
         `GET /admin/tenants?plan=starter`
     """
-    if context.role != "ADMIN":
-        raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Admin role required",
-        )
-    tenants = admin_service.list_tenants(db, name, plan, limit, offset)
+    result = admin_service.list_tenants(
+        db, name, plan, limit, offset, cursor=_parse_cursor(cursor)
+    )
     return AdminTenantsListResponse(
-        tenants=[TenantRead.model_validate(tenant) for tenant in tenants]
+        tenants=_TENANTS_ADAPTER.validate_python(result["items"], from_attributes=True),
+        total=result["total"],
+        next_cursor=_format_cursor(result["next_cursor"]),
     )
 
 
@@ -114,8 +179,7 @@ def list_tenants(
     summary="List dataset freshness (admin)",
 )
 def list_datasets(
-    db: Session = Depends(get_db),
-    context=Depends(get_current_request_context),
+    db: Session = Depends(get_db, scope="function"),
     admin_service: AdminService = Depends(get_admin_service),
 ) -> AdminDatasetsListResponse:
     """
@@ -124,15 +188,9 @@ def list_datasets(
     Example:
         `GET /admin/datasets`
     """
-    if context.role != "ADMIN":
-        raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Admin role required",
-        )
-
     datasets = admin_service.list_dataset_freshness(db)
     return AdminDatasetsListResponse(
-        datasets=[DataFreshnessRead.model_validate(ds) for ds in datasets]
+        datasets=_DATASETS_ADAPTER.validate_python(datasets, from_attributes=True)
     )
 
 
@@ -148,8 +206,8 @@ def list_report_jobs(
     business_type: str | None = Query(default=None),
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
-    context=Depends(get_current_request_context),
+    cursor: str | None = Query(default=None),
+    db: Session = Depends(get_db, scope="function"),
     admin_service: AdminService = Depends(get_admin_service),
 ) -> AdminReportJobsListResponse:
     """
@@ -157,18 +215,13 @@ def list_report_jobs(
 
     Optional filters mirror `ReportJob` fields:
     - `tenant_id`, `status`, `city`, `country`, `business_type`
-    - `limit`/`offset` for pagination
+    - `limit`/`offset` for pagination, or `cursor` (a previous page's
+      `next_cursor`) for keyset pagination
 
     Example:
         `GET /admin/jobs/reports?status=PENDING&country=CA`
     """
-    if context.role != "ADMIN":
-        raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Admin role required",
-        )
-
-    jobs = admin_service.list_report_jobs(
+    result = admin_service.list_report_jobs(
         db,
         tenant_id=tenant_id,
         status=status,
@@ -177,9 +230,14 @@ def list_report_jobs(
         business_type=business_type,
         limit=limit,
         offset=offset,
+        cursor=_parse_cursor(cursor),
     )
     return AdminReportJobsListResponse(
-        report_jobs=[ReportJobRead.model_validate(job) for job in jobs]
+        report_jobs=_REPORT_JOBS_ADAPTER.validate_python(
+            result["items"], from_attributes=True
+        ),
+        total=result["total"],
+        next_cursor=_format_cursor(result["next_cursor"]),
     )
 
 
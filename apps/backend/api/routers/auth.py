@@ -1,5 +1,7 @@
 """Authentication routes (dev login + current user profile)."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
@@ -15,8 +17,14 @@ from services.dependencies import AuthServiceDependencies
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_auth_service() -> AuthService:
-    """Construct an `AuthService` with concrete repositories for request DI."""
+    """
+    Return the process-wide `AuthService` for request DI.
+
+    The service and its repositories are stateless, so one instance is built
+    and shared across requests.
+    """
     return AuthService(
         AuthServiceDependencies(
             user_repository=UserRepository(),
@@ -66,7 +74,7 @@ def login(
     summary="Get current user context",
 )
 def get_current_user(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> dict:
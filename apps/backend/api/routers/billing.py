@@ -1,5 +1,7 @@
 """Billing routes for plan/usage lookup and (stubbed) checkout flows."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
@@ -18,8 +20,14 @@ from services.stripe_client import StripeClient
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_billing_service() -> BillingService:
-    """Construct a `BillingService` with repositories and Stripe client for DI."""
+    """
+    Return the process-wide `BillingService` for request DI.
+
+    The service, its repositories and the Stripe client hold no per-request
+    state, so one instance is built and shared across requests.
+    """
     return BillingService(
         BillingServiceDependencies(
             billing_repository=BillingRepository(),
@@ -34,7 +42,7 @@ def get_billing_service() -> BillingService:
     summary="Get current plan and usage",
 )
 def get_plan(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     billing_service: BillingService = Depends(get_billing_service),
 ) -> BillingPlanResponse:
@@ -54,7 +62,7 @@ def get_plan(
 )
 def create_checkout_session(
     request: CheckoutSessionRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     billing_service: BillingService = Depends(get_billing_service),
 ) -> CheckoutSessionResponse:
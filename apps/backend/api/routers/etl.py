@@ -1,20 +1,23 @@
 """ETL orchestration routes for triggering ingestion runs (admin-only)."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi import status as http_status
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Response
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_request_context, get_db
+from api.dependencies import get_current_request_context, get_db, require_admin
 from api.schemas.etl import EtlRunRequest, EtlRunResponse
 from services.dependencies import EtlOrchestrationServiceDependencies
 from services.etl_orchestration_service import ETLOrchestrationService
 from services.pubsub_client import PubSubClient
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_admin)])
 
 
+@lru_cache(maxsize=1)
 def get_etl_service() -> ETLOrchestrationService:
-    """Construct an `ETLOrchestrationService` with a PubSub client."""
+    """Return the process-wide `ETLOrchestrationService` with a PubSub client."""
     return ETLOrchestrationService(
         EtlOrchestrationServiceDependencies(pubsub_client=PubSubClient())
     )
@@ -23,16 +26,22 @@ def get_etl_service() -> ETLOrchestrationService:
 @router.post(
     "/run",
     summary="Trigger ETL run",
+    response_model=EtlRunResponse,
 )
 def trigger_etl_run(
     request: EtlRunRequest,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db, scope="function"),
     context=Depends(get_current_request_context),
     etl_service: ETLOrchestrationService = Depends(get_etl_service),
-) -> EtlRunResponse:
+) -> Response:
     """
     Admin endpoint to trigger an ETL workflow.
 
+    The response embeds the payload bytes already encoded for Pub/Sub rather
+    than serializing the payload a second time; the publish itself runs as a
+    background task after the response is sent.
+
     Example request:
 
         POST /etl/run
@@ -43,12 +52,6 @@ def trigger_etl_run(
           "options": { "full_refresh": true }
         }
     """
-    if context.role != "ADMIN":
-        raise HTTPException(
-            status_code=http_status.HTTP_403_FORBIDDEN,
-            detail="Admin role required",
-        )
-
     result = etl_service.trigger_adhoc_etl(
         db_session=db,
         dataset=request.dataset,
@@ -57,5 +60,13 @@ def trigger_etl_run(
         options=request.options,
         triggered_by_user_id=context.user_id,
         triggered_by_tenant_id=context.tenant_id,
+        background_tasks=background_tasks,
+    )
+    body = (
+        b'{"status":'
+        + orjson.dumps(result["status"])
+        + b',"payload":'
+        + result["payload_json"]
+        + b"}"
     )
-    return EtlRunResponse.model_validate(result)
+    return Response(content=body, media_type="application/json")
@@ -1,5 +1,7 @@
 """Insight-generation routes (market summary and opportunity finder)."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
@@ -15,16 +17,17 @@ from repositories.demographics_repository import DemographicsRepository
 from repositories.labour_stats_repository import LabourStatsRepository
 from repositories.opportunity_scores_repository import OpportunityScoresRepository
 from repositories.spending_repository import SpendingRepository
-from services.ai_engine_client import AiEngineClient
+from services.ai_engine_client import create_ai_engine_client
 from services.dependencies import InsightServiceDependencies
 from services.insight_service import InsightService
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_insight_service() -> InsightService:
-    """Construct an `InsightService` with concrete repositories and AI client."""
-    ai_engine_client = AiEngineClient(get_settings())
+    """Return the process-wide `InsightService` with repositories and AI client."""
+    ai_engine_client = create_ai_engine_client(get_settings())
     return InsightService(
         InsightServiceDependencies(
             demographics_repository=DemographicsRepository(),
@@ -42,7 +45,7 @@ def get_insight_service() -> InsightService:
 )
 def generate_market_summary(
     request: MarketSummaryRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     insight_service: InsightService = Depends(get_insight_service),
 ) -> MarketSummaryResponse:
@@ -74,7 +77,7 @@ def generate_market_summary(
 )
 def generate_opportunities(
     request: OpportunitiesRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     insight_service: InsightService = Depends(get_insight_service),
 ) -> OpportunitiesResponse:
@@ -88,7 +91,8 @@ def generate_opportunities(
           "city": "Toronto",
           "country": "CA",
           "business_type": "restaurant",
-          "constraints": { "min_composite_score": 0.6 }
+          "constraints": { "min_composite_score": 0.6 },
+          "top_k": 10
         }
     """
     result = insight_service.find_opportunities(
@@ -98,5 +102,6 @@ def generate_opportunities(
         constraints=request.constraints,
         country=request.country,
         tenant_id=context.tenant_id,
+        top_k=request.top_k,
     )
     return OpportunitiesResponse.model_validate(result)
@@ -1,5 +1,7 @@
 """Market data routes for cities, demographics, and business density."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
@@ -14,8 +16,9 @@ from services.market_service import MarketService
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_market_service() -> MarketService:
-    """Construct a `MarketService` with concrete repositories for request DI."""
+    """Return the process-wide `MarketService` (stateless repositories) for DI."""
     return MarketService(
         MarketServiceDependencies(
             demographics_repository=DemographicsRepository(),
@@ -32,7 +35,7 @@ def get_market_service() -> MarketService:
 )
 def list_cities(
     country: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     market_service: MarketService = Depends(get_market_service),
 ) -> dict:
     """
@@ -55,7 +58,7 @@ def list_cities(
 def get_market_overview(
     city: str,
     country: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     market_service: MarketService = Depends(get_market_service),
 ) -> dict:
@@ -79,7 +82,7 @@ def get_market_overview(
 def get_market_demographics(
     city: str,
     country: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     market_service: MarketService = Depends(get_market_service),
 ) -> dict:
     """
@@ -100,7 +103,7 @@ def get_business_density(
     city: str,
     country: str | None = Query(default=None),
     business_type: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     market_service: MarketService = Depends(get_market_service),
 ) -> dict:
     """
@@ -127,7 +130,7 @@ def get_spending(
     city: str,
     country: str | None = Query(default=None),
     category: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     market_service: MarketService = Depends(get_market_service),
 ) -> dict:
     """
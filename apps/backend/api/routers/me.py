@@ -1,5 +1,7 @@
 """User-context routes for the authenticated caller."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
@@ -12,8 +14,14 @@ from services.dependencies import AuthServiceDependencies
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_auth_service() -> AuthService:
-    """Construct an `AuthService` with concrete repositories for request DI."""
+    """
+    Return the process-wide `AuthService` for request DI.
+
+    The service and its repositories are stateless, so one instance is built
+    and shared across requests.
+    """
     return AuthService(
         AuthServiceDependencies(
             user_repository=UserRepository(),
@@ -27,7 +35,7 @@ def get_auth_service() -> AuthService:
     summary="Get current user profile and tenant context",
 )
 def get_me(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     auth_service: AuthService = Depends(get_auth_service),
 ) -> dict:
@@ -1,5 +1,7 @@
 """Persona routes for AI-generated customer archetypes."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
@@ -9,16 +11,17 @@ from api.schemas.personas import PersonaGenerateRequest, PersonaGenerateResponse
 from repositories.demographics_repository import DemographicsRepository
 from repositories.labour_stats_repository import LabourStatsRepository
 from repositories.spending_repository import SpendingRepository
-from services.ai_engine_client import AiEngineClient
+from services.ai_engine_client import create_ai_engine_client
 from services.dependencies import PersonaServiceDependencies
 from services.persona_service import PersonaService
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_persona_service() -> PersonaService:
-    """Construct a `PersonaService` with repositories and AI client."""
-    ai_engine_client = AiEngineClient(get_settings())
+    """Return the process-wide `PersonaService` with repositories and AI client."""
+    ai_engine_client = create_ai_engine_client(get_settings())
     return PersonaService(
         PersonaServiceDependencies(
             demographics_repository=DemographicsRepository(),
@@ -35,7 +38,7 @@ def get_persona_service() -> PersonaService:
 )
 def generate_personas(
     request: PersonaGenerateRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     persona_service: PersonaService = Depends(get_persona_service),
 ) -> PersonaGenerateResponse:
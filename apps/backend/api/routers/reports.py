@@ -1,11 +1,13 @@
 """Reports routes for feasibility jobs and report retrieval."""
 
+from functools import lru_cache
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from sqlalchemy.orm import Session
 
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
+from api.routers.billing import get_billing_service
 from api.schemas.reports import (
     FeasibilityReportRequest,
     FeasibilityReportResponse,
@@ -13,31 +15,21 @@ from api.schemas.reports import (
     ReportJobRead,
     ReportsListResponse,
 )
-from repositories.billing_repository import BillingRepository
 from repositories.report_jobs_repository import ReportJobsRepository
-from repositories.usage_repository import UsageRepository
-from services.billing_service import BillingService
-from services.dependencies import BillingServiceDependencies, ReportServiceDependencies
+from services.dependencies import ReportServiceDependencies
 from services.pubsub_client import PubSubClient
 from services.report_service import ReportService
-from services.stripe_client import StripeClient
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_report_service() -> ReportService:
-    """Construct a `ReportService` and its dependency graph for request DI."""
-    billing_service = BillingService(
-        BillingServiceDependencies(
-            billing_repository=BillingRepository(),
-            usage_repository=UsageRepository(),
-            stripe_client=StripeClient(),
-        )
-    )
+    """Return the process-wide `ReportService` and its dependency graph for DI."""
     return ReportService(
         ReportServiceDependencies(
             report_jobs_repository=ReportJobsRepository(),
-            billing_service=billing_service,
+            billing_service=get_billing_service(),
             pubsub_client=PubSubClient(),
         )
     )
@@ -49,13 +41,17 @@ def get_report_service() -> ReportService:
 )
 def create_feasibility_report(
     request: FeasibilityReportRequest,
-    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     report_service: ReportService = Depends(get_report_service),
 ) -> FeasibilityReportResponse:
     """
     Create a new feasibility report job and enqueue processing.
 
+    The job is committed before the response; its Pub/Sub message is
+    published after the response has been sent.
+
     Example request:
 
         POST /reports/feasibility
@@ -71,6 +67,7 @@ def create_feasibility_report(
         request=request,
         tenant_id=context.tenant_id,
         user_id=context.user_id,
+        background_tasks=background_tasks,
     )
     return FeasibilityReportResponse.model_validate(result)
 
@@ -80,17 +77,24 @@ def create_feasibility_report(
     summary="List report jobs for tenant",
 )
 def list_reports(
-    db: Session = Depends(get_db),
+    limit: int = Query(default=100, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     report_service: ReportService = Depends(get_report_service),
 ) -> ReportsListResponse:
     """
-    List report jobs for the current tenant.
+    List report jobs for the current tenant, newest-first.
+
+    Query params:
+    - `limit`/`offset`: pagination
 
     Example:
-        `GET /reports`
+        `GET /reports?limit=20`
     """
-    jobs = report_service.list_reports(db, context.tenant_id)
+    jobs = report_service.list_reports(
+        db, context.tenant_id, limit=limit, offset=offset
+    )
     return ReportsListResponse(
         reports=[ReportJobRead.model_validate(job) for job in jobs]
     )
@@ -102,7 +106,7 @@ def list_reports(
 )
 def get_report_status(
     report_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     report_service: ReportService = Depends(get_report_service),
 ) -> ReportGetResponse:
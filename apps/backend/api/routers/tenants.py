@@ -1,9 +1,12 @@
 """Tenant routes for current tenant lookup and (stubbed) tenant CRUD."""
 
+from functools import lru_cache
+
 from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
+from api.schemas.core import TenantRead
 from repositories.tenant_repository import TenantRepository
 from services.dependencies import TenantServiceDependencies
 from services.tenant_service import TenantService
@@ -11,8 +14,9 @@ from services.tenant_service import TenantService
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
 def get_tenant_service() -> TenantService:
-    """Construct a `TenantService` with a concrete tenant repository."""
+    """Return the process-wide `TenantService` with its tenant repository."""
     return TenantService(
         TenantServiceDependencies(tenant_repository=TenantRepository())
     )
@@ -59,14 +63,14 @@ def create_tenant(
     summary="Get current tenant",
 )
 def get_current_tenant(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
     context: CurrentRequestContext = Depends(get_current_request_context),
     tenant_service: TenantService = Depends(get_tenant_service),
-) -> dict:
+) -> TenantRead:
     """
     Return the current tenant based on auth context.
 
     Example:
         `GET /tenants/current`
     """
-    return tenant_service.get_current_tenant(db, context.tenant_id).model_dump()
+    return tenant_service.get_current_tenant(db, context.tenant_id)
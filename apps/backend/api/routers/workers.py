@@ -9,6 +9,7 @@ from __future__ import annotations
 import base64
 import json
 import logging
+from functools import lru_cache
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -48,13 +49,25 @@ def _decode_pubsub_data(data_b64: str) -> dict[str, Any]:
         ) from exc
 
 
+@lru_cache(maxsize=1)
+def get_ingestion_worker() -> IngestionWorker:
+    """Return the process-wide `IngestionWorker` (jobs hold no per-run state)."""
+    return IngestionWorker.create_default()
+
+
+@lru_cache(maxsize=1)
+def get_embedding_worker() -> EmbeddingWorker:
+    """Return the process-wide `EmbeddingWorker` (jobs hold no per-run state)."""
+    return EmbeddingWorker.create_default()
+
+
 @router.post("/ingestion", summary="Consume ingestion job (Pub/Sub push)")
 def consume_ingestion_job(
     envelope: PubSubPushEnvelope,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
+    worker: IngestionWorker = Depends(get_ingestion_worker),
 ) -> dict[str, Any]:
     payload = _decode_pubsub_data(envelope.message.data)
-    worker = IngestionWorker.create_default()
     result = worker.consume(db_session=db, payload=payload)
     return {"status": "OK", "result": result}
 
@@ -62,9 +75,9 @@ def consume_ingestion_job(
 @router.post("/embeddings", summary="Consume embedding job (Pub/Sub push)")
 def consume_embedding_job(
     envelope: PubSubPushEnvelope,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db, scope="function"),
+    worker: EmbeddingWorker = Depends(get_embedding_worker),
 ) -> dict[str, Any]:
     payload = _decode_pubsub_data(envelope.message.data)
-    worker = EmbeddingWorker.create_default()
     result = worker.consume(db_session=db, payload=payload)
     return {"status": "OK", "result": result}
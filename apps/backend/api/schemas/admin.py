@@ -14,12 +14,16 @@ class AdminUsersListResponse(BaseModel):
     """Admin response schema for listing users."""
 
     users: list[UserRead]
+    total: int | None = None
+    next_cursor: str | None = None
 
 
 class AdminTenantsListResponse(BaseModel):
     """Admin response schema for listing tenants."""
 
     tenants: list[TenantRead]
+    total: int | None = None
+    next_cursor: str | None = None
 
 
 class DataFreshnessRead(BaseModel):
@@ -44,3 +48,20 @@ class AdminReportJobsListResponse(BaseModel):
     """Admin response schema for listing report jobs."""
 
     report_jobs: list[ReportJobRead]
+    total: int | None = None
+    next_cursor: str | None = None
+
+
+class AdminEntityCounts(BaseModel):
+    """Total row counts shown on the admin dashboard."""
+
+    users: int
+    tenants: int
+    report_jobs: int
+
+
+class AdminDashboardResponse(BaseModel):
+    """Admin response schema for the dashboard landing view."""
+
+    counts: AdminEntityCounts
+    datasets: list[DataFreshnessRead]
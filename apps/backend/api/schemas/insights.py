@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class MarketSummaryRequest(BaseModel):
@@ -13,8 +13,19 @@ class MarketSummaryRequest(BaseModel):
     regions: list[str] | None = None
 
 
+def _columns_to_rows(columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Zip a column-oriented section (`{field: [values...]}`) into row dicts."""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
 class MarketSummaryResponse(BaseModel):
-    """Response payload for market summary insights."""
+    """
+    Response payload for market summary insights.
+
+    `stats` and the stat sections of `stats_used` arrive column-oriented from
+    `InsightService` and are returned as lists of row objects.
+    """
 
     city: str
     country: str | None
@@ -22,6 +33,15 @@ class MarketSummaryResponse(BaseModel):
     stats_used: dict[str, Any]
     ai_summary: dict[str, Any]
 
+    @field_validator("stats", "stats_used")
+    @classmethod
+    def _stats_sections_as_rows(cls, stats: dict[str, Any]) -> dict[str, Any]:
+        # Non-dict entries (`city`, `country` in `stats_used`) pass through.
+        return {
+            name: _columns_to_rows(section) if isinstance(section, dict) else section
+            for name, section in stats.items()
+        }
+
 
 class OpportunitiesRequest(BaseModel):
     """Request payload for `/insights/opportunities`."""
@@ -30,6 +50,7 @@ class OpportunitiesRequest(BaseModel):
     country: str | None = None
     business_type: str | None = None
     constraints: dict[str, Any] | None = None
+    top_k: int | None = Field(default=None, ge=1)
 
 
 class OpportunitiesResponse(BaseModel):
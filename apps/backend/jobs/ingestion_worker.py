@@ -16,6 +16,7 @@ from jobs.business_density_etl_job import BusinessDensityEtlJob
 from jobs.demographics_etl_job import DemographicsEtlJob
 from jobs.labour_stats_etl_job import LabourStatsEtlJob
 from jobs.spending_etl_job import SpendingEtlJob
+from services.market_service import MarketService
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +125,7 @@ class IngestionWorker:
             city=message.city,
             options=message.options,
         )
+        MarketService.invalidate_market_caches()
         output = result.__dict__
         logger.info(
             "Ingestion message processed",
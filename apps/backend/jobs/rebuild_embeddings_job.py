@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Protocol, TypeVar
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from api.config import Settings, get_settings
@@ -71,7 +72,7 @@ class VectorInsightsRepositoryProtocol(Protocol):
 
 
 class EmbeddingClientProtocol(Protocol):
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
         raise NotImplementedError
 
 
@@ -196,12 +197,8 @@ class RebuildEmbeddingsJob:
                     }
                 )
 
+            # `embed_texts` raises on missing or mis-sized embeddings.
             embeddings = self._embedding_client.embed_texts(documents)
-            if any(
-                len(vec) != self._settings.openai_embedding_dimensions
-                for vec in embeddings
-            ):
-                raise ValueError("Embedding dimensions mismatch with configured schema")
 
             upsert_rows: list[dict[str, Any]] = []
             for idx, geo_id in enumerate(ordered_geo_ids):
@@ -0,0 +1,49 @@
+"""add trigram indexes for admin substring filters
+
+Revision ID: 21fd5c5e828e
+Revises: 820dadebee68
+Create Date: 2026-10-16 10:15:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "21fd5c5e828e"
+down_revision = "820dadebee68"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Admin listings filter with unanchored `ILIKE '%value%'`, which cannot use a
+    # B-tree index. GIN trigram indexes let Postgres serve these as index scans.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "users_email_trgm",
+        "users",
+        ["email"],
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "tenants_name_trgm",
+        "tenants",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "report_jobs_city_trgm",
+        "report_jobs",
+        ["city"],
+        postgresql_using="gin",
+        postgresql_ops={"city": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("report_jobs_city_trgm", table_name="report_jobs")
+    op.drop_index("tenants_name_trgm", table_name="tenants")
+    op.drop_index("users_email_trgm", table_name="users")
+    # The pg_trgm extension is left installed; other objects may depend on it.
@@ -0,0 +1,32 @@
+"""add (created_at, id) indexes for admin keyset pagination
+
+Revision ID: 5b0d3c9e7a41
+Revises: 21fd5c5e828e
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b0d3c9e7a41"
+down_revision = "21fd5c5e828e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Admin listings page newest first with `(created_at, id) < cursor`; a
+    # matching composite index lets each page be read as a bounded index range.
+    for table in ("users", "tenants", "report_jobs"):
+        op.create_index(
+            f"{table}_created_at_id_idx",
+            table,
+            [sa.text("created_at DESC"), sa.text("id DESC")],
+        )
+
+
+def downgrade() -> None:
+    for table in ("report_jobs", "tenants", "users"):
+        op.drop_index(f"{table}_created_at_id_idx", table_name=table)
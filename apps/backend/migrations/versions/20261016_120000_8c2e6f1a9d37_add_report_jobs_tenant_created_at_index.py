@@ -0,0 +1,28 @@
+"""add report_jobs (tenant_id, created_at) index
+
+Revision ID: 8c2e6f1a9d37
+Revises: 5b0d3c9e7a41
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8c2e6f1a9d37"
+down_revision = "5b0d3c9e7a41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the monthly report quota COUNT and per-tenant report listings.
+    op.create_index(
+        "report_jobs_tenant_id_created_at_idx",
+        "report_jobs",
+        ["tenant_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("report_jobs_tenant_id_created_at_idx", table_name="report_jobs")
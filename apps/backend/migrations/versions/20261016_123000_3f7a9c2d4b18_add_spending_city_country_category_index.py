@@ -0,0 +1,28 @@
+"""add spending (city, country, category) index
+
+Revision ID: 3f7a9c2d4b18
+Revises: 8c2e6f1a9d37
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f7a9c2d4b18"
+down_revision = "8c2e6f1a9d37"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves per-city spending reads, including the category-filtered listing.
+    op.create_index(
+        "spending_city_country_category_idx",
+        "spending",
+        ["city", "country", "category"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("spending_city_country_category_idx", table_name="spending")
@@ -2,6 +2,7 @@
 
 import uuid
 
+import numpy as np
 from pgvector.sqlalchemy import Vector  # type: ignore[import-untyped]
 from sqlalchemy import JSON
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
@@ -22,7 +23,10 @@ class VectorInsight(Base):
         UUID(as_uuid=True), nullable=True
     )
     geo_id: Mapped[str] = mapped_column(nullable=False)
-    embedding: Mapped[list[float]] = mapped_column(Vector(768), nullable=False)
+    # Loaded as a list; writes also accept the float32 arrays from `EmbeddingClient`.
+    embedding: Mapped[list[float] | np.ndarray] = mapped_column(
+        Vector(768), nullable=False
+    )
     metadata_json: Mapped[dict | None] = mapped_column(
         "metadata",
         JSON,
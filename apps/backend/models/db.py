@@ -5,23 +5,105 @@ Defines the SQLAlchemy engine, session factory, and declarative base
 for ORM models. All ORM models should inherit from `Base`.
 """
 
-from sqlalchemy import create_engine
+import logging
+import os
+import time
+import uuid
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from api.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+_QUERY_START_TIMES_KEY = "query_start_times"
+_SLOW_QUERY_PARAMS_MAX_CHARS = 1000
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Return a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds and the rest is
+    random, so keys generated later sort later. Used as a primary-key default
+    for append-heavy tables: inserts land at the right edge of the B-tree
+    instead of splitting random pages as with `uuid4`.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value &= ~(0xF << 76) & ~(0x3 << 62)
+    value |= (0x7 << 76) | (0x2 << 62)  # version 7, RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def install_slow_query_logging(target_engine: Engine, threshold_ms: float) -> None:
+    """
+    Log statements on `target_engine` that take longer than `threshold_ms`.
+
+    Slow statements are logged at WARNING with their duration and (truncated)
+    bound parameters, so slow filter combinations can be traced back to the
+    request that issued them. A threshold <= 0 disables the listeners.
+    """
+    if threshold_ms <= 0:
+        return
+
+    @event.listens_for(target_engine, "before_cursor_execute")
+    def _record_query_start(
+        conn: Any,
+        _cursor: Any,
+        _statement: str,
+        _parameters: Any,
+        _context: Any,
+        _executemany: bool,
+    ) -> None:
+        conn.info.setdefault(_QUERY_START_TIMES_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _log_slow_query(
+        conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        executemany: bool,
+    ) -> None:
+        start_times = conn.info.get(_QUERY_START_TIMES_KEY)
+        if not start_times:
+            return
+        duration_ms = (time.perf_counter() - start_times.pop()) * 1000
+        if duration_ms < threshold_ms:
+            return
+        logger.warning(
+            "Slow SQL query",
+            extra={
+                "duration_ms": round(duration_ms, 2),
+                "statement": statement,
+                "parameters": str(parameters)[:_SLOW_QUERY_PARAMS_MAX_CHARS],
+                "executemany": executemany,
+            },
+        )
+
+
 settings = get_settings()
 
 engine = create_engine(
     settings.sqlalchemy_database_uri,
     echo=settings.debug,
     future=True,
+    pool_size=settings.pg_pool_size,
+    max_overflow=settings.pg_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.pg_pool_recycle_s,
 )
+install_slow_query_logging(engine, settings.db_slow_query_ms)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -2,12 +2,17 @@
 
 import uuid
 
-from sqlalchemy import JSON, ForeignKey, Integer, Numeric, String
+from sqlalchemy import JSON, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .db import Base
 
+# Market metrics are stored as NUMERIC but only ever consumed as floats (JSON
+# payloads, scoring), so numeric columns are read as `float` rather than
+# `Decimal` at result-processing time.
+_FLOAT_NUMERIC = Numeric(asdecimal=False)
+
 
 class Demographics(Base):
     """Demographics ORM model for a geographic region within a city."""
@@ -24,11 +29,15 @@ class Demographics(Base):
     country: Mapped[str] = mapped_column(String, nullable=False)
     city: Mapped[str] = mapped_column(String, nullable=False)
     population_total: Mapped[int] = mapped_column(Integer)
-    median_income: Mapped[Numeric] = mapped_column(Numeric)
+    median_income: Mapped[float] = mapped_column(_FLOAT_NUMERIC)
     age_distribution: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     education_levels: Mapped[dict | None] = mapped_column(JSON, nullable=True)
-    household_size_avg: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
-    immigration_ratio: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
+    household_size_avg: Mapped[float | None] = mapped_column(
+        _FLOAT_NUMERIC, nullable=True
+    )
+    immigration_ratio: Mapped[float | None] = mapped_column(
+        _FLOAT_NUMERIC, nullable=True
+    )
     # coordinates stored as geometry in DB; represented as generic JSON here for ORM
     coordinates: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     last_updated: Mapped[str | None] = mapped_column(
@@ -40,6 +49,9 @@ class Spending(Base):
     """Spending ORM model capturing category spend metrics per region."""
 
     __tablename__ = "spending"
+    __table_args__ = (
+        Index("spending_city_country_category_idx", "city", "country", "category"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -51,8 +63,10 @@ class Spending(Base):
     country: Mapped[str] = mapped_column(String, nullable=False)
     city: Mapped[str] = mapped_column(String, nullable=False)
     category: Mapped[str] = mapped_column(String, nullable=False)
-    avg_monthly_spend: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
-    spend_index: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
+    avg_monthly_spend: Mapped[float | None] = mapped_column(
+        _FLOAT_NUMERIC, nullable=True
+    )
+    spend_index: Mapped[float | None] = mapped_column(_FLOAT_NUMERIC, nullable=True)
     last_updated: Mapped[str | None] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
     )
@@ -72,11 +86,13 @@ class LabourStats(Base):
     geo_id: Mapped[str] = mapped_column(String, nullable=False)
     country: Mapped[str] = mapped_column(String, nullable=False)
     city: Mapped[str] = mapped_column(String, nullable=False)
-    unemployment_rate: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
+    unemployment_rate: Mapped[float | None] = mapped_column(
+        _FLOAT_NUMERIC, nullable=True
+    )
     job_openings: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    median_salary: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
-    labour_force_participation: Mapped[Numeric | None] = mapped_column(
-        Numeric, nullable=True
+    median_salary: Mapped[float | None] = mapped_column(_FLOAT_NUMERIC, nullable=True)
+    labour_force_participation: Mapped[float | None] = mapped_column(
+        _FLOAT_NUMERIC, nullable=True
     )
     last_updated: Mapped[str | None] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
@@ -99,7 +115,7 @@ class BusinessDensity(Base):
     city: Mapped[str] = mapped_column(String, nullable=False)
     business_type: Mapped[str] = mapped_column(String, nullable=False)
     count: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    density_score: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
+    density_score: Mapped[float | None] = mapped_column(_FLOAT_NUMERIC, nullable=True)
     # coordinates stored as geometry in DB; represented as generic JSON here
     coordinates: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     last_updated: Mapped[str | None] = mapped_column(
@@ -122,10 +138,12 @@ class OpportunityScore(Base):
     country: Mapped[str] = mapped_column(String, nullable=False)
     city: Mapped[str] = mapped_column(String, nullable=False)
     business_type: Mapped[str] = mapped_column(String, nullable=False)
-    demand_score: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
-    supply_score: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
-    competition_score: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
-    composite_score: Mapped[Numeric | None] = mapped_column(Numeric, nullable=True)
+    demand_score: Mapped[float | None] = mapped_column(_FLOAT_NUMERIC, nullable=True)
+    supply_score: Mapped[float | None] = mapped_column(_FLOAT_NUMERIC, nullable=True)
+    competition_score: Mapped[float | None] = mapped_column(
+        _FLOAT_NUMERIC, nullable=True
+    )
+    composite_score: Mapped[float | None] = mapped_column(_FLOAT_NUMERIC, nullable=True)
     calculated_at: Mapped[str | None] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
     )
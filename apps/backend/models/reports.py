@@ -2,20 +2,35 @@
 
 import uuid
 
-from sqlalchemy import JSON, ForeignKey, String, Text
+from sqlalchemy import JSON, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from .db import Base
+from .db import Base, uuid7
 
 
 class ReportJob(Base):
     """Report job ORM model that tracks feasibility report generation."""
 
     __tablename__ = "report_jobs"
+    __table_args__ = (
+        Index(
+            "report_jobs_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+        Index(
+            "report_jobs_created_at_id_idx",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index("report_jobs_tenant_id_created_at_idx", "tenant_id", "created_at"),
+    )
 
+    # Time-ordered ids keep inserts appending to the primary-key index.
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False
@@ -5,6 +5,7 @@ Repositories encapsulate all persistence logic and should not contain
 business rules. Services depend on repositories.
 """
 
+from .admin_dashboard_repository import AdminDashboardRepository  # noqa: F401
 from .billing_repository import BillingRepository  # noqa: F401
 from .business_density_repository import BusinessDensityRepository  # noqa: F401
 from .data_freshness_repository import DataFreshnessRepository  # noqa: F401
@@ -31,4 +32,5 @@ __all__ = [
     "BillingRepository",
     "DataFreshnessRepository",
     "EtlLogsRepository",
+    "AdminDashboardRepository",
 ]
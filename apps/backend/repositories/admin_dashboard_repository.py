@@ -0,0 +1,29 @@
+"""Admin dashboard repository implementation."""
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from models.core import Tenant, User
+from models.reports import ReportJob
+
+
+class AdminDashboardRepository:
+    """Cross-table aggregate reads for the admin dashboard."""
+
+    def get_entity_counts(self, db_session: Session) -> dict[str, int]:
+        """
+        Count users, tenants and report jobs in a single round-trip.
+
+        Each count is a scalar subquery of one SELECT, so the dashboard needs
+        one query instead of one per table.
+        """
+        query = select(
+            select(func.count()).select_from(User).scalar_subquery().label("users"),
+            select(func.count()).select_from(Tenant).scalar_subquery().label("tenants"),
+            select(func.count())
+            .select_from(ReportJob)
+            .scalar_subquery()
+            .label("report_jobs"),
+        )
+        row = db_session.execute(query).one()
+        return {key: int(value) for key, value in row._mapping.items()}
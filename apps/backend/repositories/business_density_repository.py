@@ -1,9 +1,10 @@
 """Business density repository implementation."""
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any, cast
 
-from sqlalchemy import Select, distinct, func, select
+from sqlalchemy import Row, Select, distinct, func, select
 from sqlalchemy.orm import Session
 
 from models.market import BusinessDensity
@@ -41,6 +42,30 @@ class BusinessDensityRepository:
         result = db_session.execute(query).scalars().all()
         return cast(list[BusinessDensity], list(result))
 
+    def list_columns_by_city_and_type(
+        self,
+        db_session: Session,
+        city: str,
+        country: str | None,
+        business_type: str | None,
+        columns: Sequence[str],
+    ) -> Sequence[Row[Any]]:
+        """
+        List only `columns` of a city's business density rows (optionally by type).
+
+        Read-only projection for API listings: returns Core `Row`s (keyed by
+        column name) without hydrating ORM entities.
+        """
+        query: Select = select(
+            *(getattr(BusinessDensity, column) for column in columns)
+        ).where(BusinessDensity.city == city)
+        if country:
+            query = query.where(BusinessDensity.country == country)
+        if business_type:
+            query = query.where(BusinessDensity.business_type == business_type)
+        query = query.order_by(BusinessDensity.business_type)
+        return db_session.execute(query).all()
+
     def get_summary(self, db_session: Session, city: str, country: str | None) -> dict:
         """Compute city-level density summary (counts and average scores)."""
         query: Select = select(
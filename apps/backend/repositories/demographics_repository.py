@@ -1,12 +1,13 @@
 """Demographics repository implementation."""
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any, cast
 
-from sqlalchemy import Select, distinct, func, select
+from sqlalchemy import Row, Select, distinct, func, or_, select
 from sqlalchemy.orm import Session
 
-from models.market import Demographics
+from models.market import BusinessDensity, Demographics
 
 
 class DemographicsRepository:
@@ -20,6 +21,39 @@ class DemographicsRepository:
         result = db_session.execute(query).scalars().all()
         return [city for city in result if city]
 
+    def list_cities_with_business_density(
+        self, db_session: Session, country: str | None
+    ) -> list[str]:
+        """
+        Return demographics cities that also have business density rows.
+
+        Computes the intersection in SQL. When there are no business density
+        rows (for `country`, if given), every demographics city is returned
+        instead. Both cases use one query; density cities are deduplicated once
+        in a CTE that both the membership and the emptiness checks read.
+        """
+        density_query: Select = select(BusinessDensity.city).distinct()
+        if country:
+            density_query = density_query.where(BusinessDensity.country == country)
+        density_cities = density_query.cte("density_cities")
+
+        query: Select = (
+            select(Demographics.city)
+            .distinct()
+            .where(
+                Demographics.city.is_not(None),
+                or_(
+                    ~select(density_cities.c.city).exists(),
+                    Demographics.city.in_(select(density_cities.c.city)),
+                ),
+            )
+            .order_by(Demographics.city)
+        )
+        if country:
+            query = query.where(Demographics.country == country)
+        result = db_session.execute(query).scalars().all()
+        return [city for city in result if city]
+
     def list_by_city(
         self, db_session: Session, city: str, country: str | None
     ) -> list[Demographics]:
@@ -31,11 +65,49 @@ class DemographicsRepository:
         result = db_session.execute(query).scalars().all()
         return cast(list[Demographics], list(result))
 
+    def list_columns_by_city(
+        self,
+        db_session: Session,
+        city: str,
+        country: str | None,
+        columns: Sequence[str],
+    ) -> Sequence[Row[Any]]:
+        """
+        List only `columns` of the demographics rows in a city, ordered by geo_id.
+
+        Read-only projection for API listings: returns Core `Row`s (keyed by
+        column name) without hydrating ORM entities.
+        """
+        query: Select = select(
+            *(getattr(Demographics, column) for column in columns)
+        ).where(Demographics.city == city)
+        if country:
+            query = query.where(Demographics.country == country)
+        query = query.order_by(Demographics.geo_id)
+        return db_session.execute(query).all()
+
     def get_for_regions(
-        self, db_session: Session, city: str, country: str | None
+        self,
+        db_session: Session,
+        city: str,
+        country: str | None,
+        geo_ids: Sequence[str] | None = None,
     ) -> list[Demographics]:
-        """Alias for `list_by_city`; services may filter by `geo_id` downstream."""
-        return self.list_by_city(db_session, city, country)
+        """
+        List demographics rows for a city, optionally limited to `geo_ids`.
+
+        Without `geo_ids` this is equivalent to `list_by_city`.
+        """
+        if not geo_ids:
+            return self.list_by_city(db_session, city, country)
+        query: Select = select(Demographics).where(
+            Demographics.city == city, Demographics.geo_id.in_(geo_ids)
+        )
+        if country:
+            query = query.where(Demographics.country == country)
+        query = query.order_by(Demographics.geo_id)
+        result = db_session.execute(query).scalars().all()
+        return cast(list[Demographics], list(result))
 
     def get_city_aggregates(
         self, db_session: Session, city: str, country: str | None
@@ -1,5 +1,6 @@
 """Labour stats repository implementation."""
 
+from collections.abc import Sequence
 from datetime import datetime
 from typing import cast
 
@@ -36,12 +37,18 @@ class LabourStatsRepository:
         }
 
     def get_for_regions(
-        self, db_session: Session, city: str, country: str | None
+        self,
+        db_session: Session,
+        city: str,
+        country: str | None,
+        geo_ids: Sequence[str] | None = None,
     ) -> list[LabourStats]:
-        """List labour stats rows for all regions in a city."""
+        """List labour stats rows for a city, optionally only `geo_ids`."""
         query: Select = select(LabourStats).where(LabourStats.city == city)
         if country:
             query = query.where(LabourStats.country == country)
+        if geo_ids:
+            query = query.where(LabourStats.geo_id.in_(geo_ids))
         query = query.order_by(LabourStats.geo_id)
         result = db_session.execute(query).scalars().all()
         return cast(list[LabourStats], list(result))
@@ -0,0 +1,123 @@
+"""Shared pagination helpers for repository list queries."""
+
+import base64
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+# Keyset position of a row in `(created_at DESC, id DESC)` order.
+Cursor = tuple[datetime, UUID]
+
+
+class Page(NamedTuple):
+    """One page of admin list results."""
+
+    items: list[Any]
+    total: int | None
+    next_cursor: Cursor | None
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a keyset cursor as an opaque URL-safe token."""
+    created_at, row_id = cursor
+    raw = f"{created_at.isoformat()}|{row_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """
+    Decode a token produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+
+def fetch_page_with_total(
+    db_session: Session,
+    query: Select,
+    limit: int,
+    offset: int,
+) -> tuple[list[Any], int]:
+    """
+    Execute a filtered/ordered query for one page and its unpaginated total.
+
+    The total is folded into the same SELECT via `count(*) OVER ()`, so a page
+    and its count come back in a single round-trip. A separate COUNT query is
+    only issued when the requested page is past the end of the result set.
+
+    Args:
+        query: Filtered and ordered `select(Model)` statement (no limit/offset).
+        limit: Max number of results.
+        offset: Pagination offset.
+
+    Returns:
+        Tuple of (page items, total matching rows).
+    """
+    paged_query = (
+        query.add_columns(func.count().over().label("_total"))
+        .limit(limit)
+        .offset(offset)
+    )
+    rows = db_session.execute(paged_query).all()
+    if rows:
+        return [row[0] for row in rows], int(rows[0][1])
+    if offset == 0:
+        return [], 0
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return [], int(db_session.execute(count_query).scalar_one())
+
+
+def fetch_admin_page(
+    db_session: Session,
+    query: Select,
+    model: Any,
+    limit: int,
+    offset: int = 0,
+    cursor: Cursor | None = None,
+) -> Page:
+    """
+    Fetch one page of a filtered admin listing ordered newest first.
+
+    Rows are ordered by `(created_at DESC, id DESC)`. With a `cursor`, the page
+    starts strictly after that position (keyset pagination), so deep pages
+    cost O(limit) via the composite `(created_at, id)` index instead of
+    scanning and discarding `offset` rows; `offset` is ignored and `total` is
+    None. Without a cursor, the legacy offset path is used and `total` is
+    included.
+
+    Args:
+        query: Filtered `select(model)` statement (no ordering or paging).
+        model: ORM model with `created_at` and `id` columns.
+        limit: Max number of results.
+        offset: Pagination offset (only used when `cursor` is None).
+        cursor: Keyset position returned as `next_cursor` by a previous page.
+
+    Returns:
+        `Page` with the items, the total (offset path only), and the cursor
+        for the next page (None on the last page).
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    total: int | None = None
+    if cursor is None:
+        items, total = fetch_page_with_total(db_session, query, limit, offset)
+        has_more = offset + len(items) < total
+    else:
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(*cursor))
+        items = list(db_session.execute(query.limit(limit + 1)).scalars().all())
+        has_more = len(items) > limit
+        items = items[:limit]
+
+    next_cursor = (items[-1].created_at, items[-1].id) if has_more else None
+    return Page(items=items, total=total, next_cursor=next_cursor)
@@ -1,24 +1,46 @@
 """Report jobs repository implementation."""
 
 from datetime import datetime, timezone
-from typing import cast
+from typing import Any, NamedTuple, cast
 from uuid import UUID
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, func, insert, literal, select
 from sqlalchemy.orm import Session
 
+from models.db import uuid7
 from models.reports import ReportJob
+from repositories.pagination import Cursor, Page, fetch_admin_page
+
+
+class QueuedJob(NamedTuple):
+    """Id and status of a job inserted by the quota-guarded insert."""
+
+    id: UUID
+    status: str
 
 
 class ReportJobsRepository:
     """Data access for `report_jobs` and `report_sections` tables."""
 
-    def list_by_tenant(self, db_session: Session, tenant_id: UUID) -> list[ReportJob]:
-        """List report jobs for a tenant, ordered by creation time desc."""
+    def list_by_tenant(
+        self,
+        db_session: Session,
+        tenant_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[ReportJob]:
+        """
+        List one page of report jobs for a tenant, ordered by creation time desc.
+
+        `ReportJob` has no relationships, so the page is loaded in a single
+        query served by the `(tenant_id, created_at)` index.
+        """
         query: Select = (
             select(ReportJob)
             .where(ReportJob.tenant_id == tenant_id)
             .order_by(ReportJob.created_at.desc())
+            .limit(limit)
+            .offset(offset)
         )
         result = db_session.execute(query).scalars().all()
         return cast(list[ReportJob], list(result))
@@ -26,11 +48,16 @@ class ReportJobsRepository:
     def get_for_tenant(
         self, db_session: Session, report_id: UUID, tenant_id: UUID
     ) -> ReportJob | None:
-        """Get a report job by id, scoped to tenant; returns None if not found."""
+        """
+        Get a report job by id, scoped to tenant; returns None if not found.
+
+        The primary-key index finds the row by `id`; the tenant filter is then
+        checked on that single row, so at most one row matches.
+        """
         query: Select = select(ReportJob).where(
-            ReportJob.id == report_id, ReportJob.tenant_id == tenant_id
+            ReportJob.tenant_id == tenant_id, ReportJob.id == report_id
         )
-        return db_session.execute(query).scalars().first()
+        return db_session.execute(query).scalar_one_or_none()
 
     def create_pending_job(
         self,
@@ -58,6 +85,60 @@ class ReportJobsRepository:
         db_session.refresh(job)
         return job
 
+    def create_pending_job_within_quota(
+        self,
+        db_session: Session,
+        tenant_id: UUID,
+        city: str,
+        country: str,
+        business_type: str,
+        report_limit: int,
+        since: datetime,
+    ) -> QueuedJob | None:
+        """
+        Insert a PENDING job only if the tenant is under `report_limit`.
+
+        Counting the tenant's jobs created at or after `since` and inserting
+        happen in one `INSERT ... SELECT ... WHERE count < limit RETURNING`
+        statement. On PostgreSQL a transaction-scoped advisory lock keyed on
+        the tenant is taken first, so concurrent requests for one tenant
+        cannot both pass the count before either insert is visible. Returns
+        the new job's id and status, or None when the quota is used up.
+        """
+        if db_session.get_bind().dialect.name == "postgresql":
+            # Released on commit/rollback of the caller's transaction.
+            db_session.execute(
+                select(func.pg_advisory_xact_lock(func.hashtext(str(tenant_id))))
+            )
+        now = datetime.now(timezone.utc)
+        columns = ReportJob.__table__.c
+        values: dict[str, Any] = {
+            # Python-side column defaults do not apply to INSERT ... SELECT.
+            "id": uuid7(),
+            "tenant_id": tenant_id,
+            "city": city,
+            "country": country,
+            "business_type": business_type,
+            "status": "PENDING",
+            "created_at": now,
+            "updated_at": now,
+        }
+        reports_used = (
+            select(func.count())
+            .where(ReportJob.tenant_id == tenant_id, ReportJob.created_at >= since)
+            .scalar_subquery()
+        )
+        rows = select(
+            *(literal(value, columns[name].type) for name, value in values.items())
+        ).where(reports_used < report_limit)
+        query = (
+            insert(ReportJob)
+            .from_select(list(values), rows)
+            .returning(ReportJob.id, ReportJob.status)
+        )
+        row = db_session.execute(query).first()
+        return None if row is None else QueuedJob(row.id, row.status)
+
     def admin_list(
         self,
         db_session: Session,
@@ -68,8 +149,20 @@ class ReportJobsRepository:
         business_type: str | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[ReportJob]:
-        """Admin listing for report jobs with optional filters and pagination."""
+        cursor: Cursor | None = None,
+    ) -> Page:
+        """
+        Admin listing for report jobs with optional filters and pagination.
+
+        Returns a `Page` ordered newest first. Pass the previous page's
+        `next_cursor` as `cursor` for keyset pagination; `offset` is kept for
+        backwards compatibility and only then is the total of matching
+        jobs included.
+
+        Filter values, `limit` and `offset` are bound parameters, so each
+        combination of active filters is compiled once and then served from
+        the engine's compiled-statement cache.
+        """
         query: Select = select(ReportJob)
         if tenant_id is not None:
             query = query.where(ReportJob.tenant_id == tenant_id)
@@ -82,6 +175,4 @@ class ReportJobsRepository:
         if business_type:
             query = query.where(ReportJob.business_type.ilike(f"%{business_type}%"))
 
-        query = query.order_by(ReportJob.created_at.desc()).limit(limit).offset(offset)
-        result = db_session.execute(query).scalars().all()
-        return cast(list[ReportJob], list(result))
+        return fetch_admin_page(db_session, query, ReportJob, limit, offset, cursor)
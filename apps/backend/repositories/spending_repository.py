@@ -1,9 +1,10 @@
 """Spending repository implementation."""
 
+from collections.abc import Sequence
 from datetime import datetime
-from typing import cast
+from typing import Any, cast
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Row, Select, func, select
 from sqlalchemy.orm import Session
 
 from models.market import Spending
@@ -30,16 +31,46 @@ class SpendingRepository:
         }
 
     def get_for_regions(
-        self, db_session: Session, city: str, country: str | None
+        self,
+        db_session: Session,
+        city: str,
+        country: str | None,
+        geo_ids: Sequence[str] | None = None,
     ) -> list[Spending]:
-        """List spending rows by category for all regions in a city."""
+        """List spending rows by category for a city, optionally only `geo_ids`."""
         query: Select = select(Spending).where(Spending.city == city)
         if country:
             query = query.where(Spending.country == country)
+        if geo_ids:
+            query = query.where(Spending.geo_id.in_(geo_ids))
         query = query.order_by(Spending.category)
         result = db_session.execute(query).scalars().all()
         return cast(list[Spending], list(result))
 
+    def list_columns_for_city(
+        self,
+        db_session: Session,
+        city: str,
+        country: str | None,
+        columns: Sequence[str],
+        category: str | None = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        List only `columns` of a city's spending rows, optionally one `category`.
+
+        Read-only projection for API listings: returns Core `Row`s (keyed by
+        column name) without hydrating ORM entities.
+        """
+        query: Select = select(
+            *(getattr(Spending, column) for column in columns)
+        ).where(Spending.city == city)
+        if country:
+            query = query.where(Spending.country == country)
+        if category:
+            query = query.where(Spending.category == category)
+        query = query.order_by(Spending.category)
+        return db_session.execute(query).all()
+
     def upsert_many(
         self,
         db_session: Session,
@@ -1,12 +1,12 @@
 """Tenant repository implementation."""
 
-from typing import cast
 from uuid import UUID
 
 from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
 from models.core import Tenant
+from repositories.pagination import Cursor, Page, fetch_admin_page
 
 
 class TenantRepository:
@@ -23,21 +23,26 @@ class TenantRepository:
         plan: str | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[Tenant]:
+        cursor: Cursor | None = None,
+    ) -> Page:
         """
         Admin listing of tenants with optional filters and pagination.
 
+        Returns a `Page` ordered newest first. Pass the previous page's
+        `next_cursor` as `cursor` for keyset pagination; `offset` is kept for
+        backwards compatibility and only then is the total of matching
+        tenants included.
+
         Args:
             name_contains: Optional substring match for tenant name.
             plan: Optional plan filter.
             limit: Max number of results.
-            offset: Pagination offset.
+            offset: Pagination offset (ignored when `cursor` is given).
+            cursor: Keyset position of the last row of the previous page.
         """
         query: Select = select(Tenant)
         if plan:
             query = query.where(Tenant.plan == plan)
         if name_contains:
             query = query.where(Tenant.name.ilike(f"%{name_contains}%"))
-        query = query.order_by(Tenant.created_at.desc()).limit(limit).offset(offset)
-        result = db_session.execute(query).scalars().all()
-        return cast(list[Tenant], list(result))
+        return fetch_admin_page(db_session, query, Tenant, limit, offset, cursor)
@@ -1,5 +1,6 @@
 """Usage repository implementation."""
 
+from datetime import datetime
 from typing import Any, Iterable, cast
 from uuid import UUID
 
@@ -7,6 +8,7 @@ from sqlalchemy import Select, func, select
 from sqlalchemy.orm import Session
 
 from models.billing import UsageRecord
+from models.reports import ReportJob
 
 
 class UsageRepository:
@@ -26,3 +28,12 @@ class UsageRepository:
         rows = db_session.execute(query).all()
         typed_rows = cast(Iterable[tuple[str, Any]], rows)
         return dict(typed_rows)
+
+    def count_report_jobs_since(
+        self, db_session: Session, tenant_id: UUID, since: datetime
+    ) -> int:
+        """Count report jobs a tenant created at or after `since`."""
+        query: Select = select(func.count()).where(
+            ReportJob.tenant_id == tenant_id, ReportJob.created_at >= since
+        )
+        return int(db_session.execute(query).scalar_one())
@@ -1,12 +1,12 @@
 """User repository implementation."""
 
-from typing import cast
 from uuid import UUID
 
 from sqlalchemy import Select, select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from models.core import User
+from repositories.pagination import Cursor, Page, fetch_admin_page
 
 
 class UserRepository:
@@ -16,6 +16,18 @@ class UserRepository:
         """Get a user by id, returning None if it does not exist."""
         return db_session.get(User, user_id)
 
+    def get_by_id_with_tenant(self, db_session: Session, user_id: UUID) -> User | None:
+        """
+        Get a user by id with its tenant eagerly loaded in the same query.
+
+        Returns None if the user does not exist; `user.tenant` is populated via
+        a JOIN so callers do not need a second round-trip for the tenant row.
+        """
+        query: Select = (
+            select(User).options(joinedload(User.tenant)).where(User.id == user_id)
+        )
+        return db_session.execute(query).scalars().first()
+
     def admin_list(
         self,
         db_session: Session,
@@ -24,16 +36,23 @@ class UserRepository:
         tenant_id: UUID | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[User]:
+        cursor: Cursor | None = None,
+    ) -> Page:
         """
         Admin listing of users with optional filters and pagination.
 
+        Returns a `Page` ordered newest first. Pass the previous page's
+        `next_cursor` as `cursor` for keyset pagination; `offset` is kept for
+        backwards compatibility and only then is the total of matching
+        users included.
+
         Args:
             email_contains: Optional substring match for email.
             role: Optional role filter.
             tenant_id: Optional tenant UUID filter.
             limit: Max number of results.
-            offset: Pagination offset.
+            offset: Pagination offset (ignored when `cursor` is given).
+            cursor: Keyset position of the last row of the previous page.
         """
         query: Select = select(User)
         if tenant_id is not None:
@@ -42,6 +61,4 @@ class UserRepository:
             query = query.where(User.role == role)
         if email_contains:
             query = query.where(User.email.ilike(f"%{email_contains}%"))
-        query = query.order_by(User.created_at.desc()).limit(limit).offset(offset)
-        result = db_session.execute(query).scalars().all()
-        return cast(list[User], list(result))
+        return fetch_admin_page(db_session, query, User, limit, offset, cursor)
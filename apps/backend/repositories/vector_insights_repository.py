@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, cast
 
+import numpy as np
 from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
@@ -40,7 +41,7 @@ class VectorInsightsRepository:
 
             existing = db_session.execute(query).scalars().first()
             if existing:
-                existing.embedding = cast(list[float], input_row["embedding"])
+                existing.embedding = cast(np.ndarray, input_row["embedding"])
                 existing.metadata_json = cast(dict | None, input_row.get("metadata"))
                 existing.created_at = created_at_value
             else:
@@ -48,7 +49,7 @@ class VectorInsightsRepository:
                     VectorInsight(
                         tenant_id=tenant_id,
                         geo_id=geo_id,
-                        embedding=cast(list[float], input_row["embedding"]),
+                        embedding=cast(np.ndarray, input_row["embedding"]),
                         metadata_json=cast(dict | None, input_row.get("metadata")),
                         created_at=created_at_value,
                     )
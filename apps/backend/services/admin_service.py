@@ -1,9 +1,11 @@
 """Admin operations service."""
 
+from typing import Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from repositories.pagination import Cursor
 from services.dependencies import AdminServiceDependencies
 
 
@@ -18,6 +20,7 @@ class AdminService:
         self._tenant_repository = dependencies.tenant_repository
         self._data_freshness_repository = dependencies.data_freshness_repository
         self._report_jobs_repository = dependencies.report_jobs_repository
+        self._admin_dashboard_repository = dependencies.admin_dashboard_repository
 
     def list_users(
         self,
@@ -27,7 +30,8 @@ class AdminService:
         tenant_id: UUID | None,
         limit: int,
         offset: int,
-    ) -> list:
+        cursor: Cursor | None = None,
+    ) -> dict[str, Any]:
         """
         List users across tenants with optional filters (admin use).
 
@@ -36,16 +40,27 @@ class AdminService:
             role: Optional role filter (e.g., "ADMIN", "USER").
             tenant_id: Optional tenant UUID filter.
             limit: Max number of results.
-            offset: Pagination offset.
+            offset: Pagination offset (ignored when `cursor` is given).
+            cursor: Keyset position from a previous page's `next_cursor`.
+
+        Returns:
+            Dict with the page of users under `items`, the unpaginated match
+            count under `total` (offset pages only), and `next_cursor`.
         """
-        return self._user_repository.admin_list(
+        page = self._user_repository.admin_list(
             db_session,
             email_contains=email_contains,
             role=role,
             tenant_id=tenant_id,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
+        return {
+            "items": page.items,
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+        }
 
     def list_tenants(
         self,
@@ -54,7 +69,8 @@ class AdminService:
         plan: str | None,
         limit: int,
         offset: int,
-    ) -> list:
+        cursor: Cursor | None = None,
+    ) -> dict[str, Any]:
         """
         List tenants with optional filters (admin use).
 
@@ -62,15 +78,26 @@ class AdminService:
             name_contains: Optional substring match for tenant name.
             plan: Optional plan filter (e.g., "starter", "pro").
             limit: Max number of results.
-            offset: Pagination offset.
+            offset: Pagination offset (ignored when `cursor` is given).
+            cursor: Keyset position from a previous page's `next_cursor`.
+
+        Returns:
+            Dict with the page of tenants under `items`, the unpaginated match
+            count under `total` (offset pages only), and `next_cursor`.
         """
-        return self._tenant_repository.admin_list(
+        page = self._tenant_repository.admin_list(
             db_session,
             name_contains=name_contains,
             plan=plan,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
+        return {
+            "items": page.items,
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+        }
 
     def list_dataset_freshness(self, db_session: Session) -> list:
         """List all dataset freshness records for operational monitoring."""
@@ -86,13 +113,17 @@ class AdminService:
         business_type: str | None,
         limit: int,
         offset: int,
-    ) -> list:
+        cursor: Cursor | None = None,
+    ) -> dict[str, Any]:
         """
         List report jobs across tenants with optional filters (admin use).
 
-        Args mirror `ReportJob` fields plus pagination.
+        Args mirror `ReportJob` fields plus pagination (`offset`, or a keyset
+        `cursor`). Returns a dict with the page of jobs under `items`, the
+        unpaginated match count under `total` (offset pages only), and
+        `next_cursor`.
         """
-        return self._report_jobs_repository.admin_list(
+        page = self._report_jobs_repository.admin_list(
             db_session,
             tenant_id=tenant_id,
             status=status,
@@ -101,4 +132,25 @@ class AdminService:
             business_type=business_type,
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
+        return {
+            "items": page.items,
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+        }
+
+    def get_dashboard(self, db_session: Session) -> dict[str, Any]:
+        """
+        Return the data for the admin dashboard landing view.
+
+        Entity totals come back from one aggregate query and dataset freshness
+        from a second, instead of separate list/count calls per table.
+
+        Returns:
+            Dict with `counts` (users, tenants, report_jobs) and `datasets`.
+        """
+        return {
+            "counts": self._admin_dashboard_repository.get_entity_counts(db_session),
+            "datasets": self._data_freshness_repository.list_all(db_session),
+        }
@@ -1,29 +1,164 @@
 """AI-engine client for generating LLM-backed insights.
 
 In local/dev:
-- If `OPENAI_API_KEY` is set, calls OpenAI Chat Completions.
-- If not set (or OpenAI is not installed), falls back to simple stub outputs.
+- If `OPENAI_API_KEY` is set, calls OpenAI Chat Completions
+  (`OpenAiEngineClient`).
+- If not set (or OpenAI is not installed), falls back to simple stub outputs
+  (`StubAiEngineClient`).
+
+`create_ai_engine_client(settings)` picks the implementation once, so the
+`generate_*` methods never re-check whether OpenAI is configured.
 
 This keeps the interface stable while allowing a real vertical slice to ship.
 """
 
-import json
+import hashlib
 import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from api.config import Settings
+from services.openai_client import (
+    OPENAI_CLIENT_CLASS,
+    get_shared_openai_client,
+)
+from services.ttl_cache import TTLCache
 
-try:
-    from openai import OpenAI as OPENAI_CLIENT_CLASS  # type: ignore[import-untyped]
-except ModuleNotFoundError:  # pragma: no cover
-    OPENAI_CLIENT_CLASS = None  # type: ignore[assignment,misc]
+logger = logging.getLogger(__name__)
 
+# Sanitized LLM responses, stored as compact orjson bytes and keyed by a hash of
+# (model, system prompt, payload). Grounded payloads repeat for the same
+# city/business type, so identical requests within a day are served without
+# another OpenAI call. Bytes keep entries small and give each hit a fresh dict.
+_LLM_RESPONSE_CACHE: TTLCache[bytes] = TTLCache(maxsize=1024, ttl_s=86400)
+
+# System prompts for each generation call.
+_MARKET_SUMMARY_SYSTEM_PROMPT = (
+    "You are an analyst generating a concise market summary. "
+    'Return JSON like {"summary": "...", "highlights": ["..."], '
+    '"risks": ["..."]}. Use the provided stats only.'
+)
+_OPPORTUNITY_COMMENTARY_SYSTEM_PROMPT = (
+    "You are an expert market strategist. Given ranked regions with demand, "
+    "supply, competition, and composite scores, write a short commentary "
+    "explaining why the top regions are attractive/weak. "
+    'Return JSON like {"commentary": "...", '
+    '"region_rationales": [{"geo_id": "...", "rationale": "..."}]}. '
+    "Be factual and grounded in the scores. Keep it brief."
+)
+_PERSONAS_SYSTEM_PROMPT = (
+    "You generate customer personas for a business. "
+    'Return JSON like {"headline": "...", "personas": '
+    '[{"name": "...", "description": "..."}]}. '
+    "Use the provided stats only."
+)
+
+# Stub/fallback response text, formatted with request values when needed.
+_UNKNOWN_CITY = "unknown city"
+_MARKET_SUMMARY_STUB_TEMPLATE = "Market summary for {city}."
+_MARKET_SUMMARY_FALLBACK_TEMPLATE = (
+    "Market summary for {city} is unavailable currently."
+)
+_PERSONAS_HEADLINE_TEMPLATE = "Personas for {city}"
+_PERSONAS_HEADLINE_WITH_TYPE_TEMPLATE = "Personas for {city} ({business_type})"
+_PERSONAS_FALLBACK_HEADLINE_TEMPLATE = "Personas for {city} unavailable currently."
+_OPPORTUNITY_STUB_COMMENTARY = "Opportunities generated."
+_OPPORTUNITY_DEFAULT_COMMENTARY = "AI commentary generated."
+_OPPORTUNITY_FALLBACK_COMMENTARY = "AI commentary unavailable at the moment."
+_REGION_RATIONALE = "Ranked based on composite opportunity score."
+
+
+# Stub/fallback text depends only on the city (and business type), so each
+# distinct string is formatted once and reused.
+
+
+@lru_cache(maxsize=4096)
+def _stub_market_summary_text(city: str) -> str:
+    return _MARKET_SUMMARY_STUB_TEMPLATE.format(city=city)
+
+
+@lru_cache(maxsize=4096)
+def _market_summary_unavailable_text(city: str) -> str:
+    return _MARKET_SUMMARY_FALLBACK_TEMPLATE.format(city=city)
+
+
+@lru_cache(maxsize=4096)
+def _stub_personas_headline(city: str, business_type: str | None) -> str:
+    if business_type:
+        return _PERSONAS_HEADLINE_WITH_TYPE_TEMPLATE.format(
+            city=city, business_type=business_type
+        )
+    return _PERSONAS_HEADLINE_TEMPLATE.format(city=city)
+
+
+@lru_cache(maxsize=4096)
+def _personas_unavailable_headline(city: str) -> str:
+    return _PERSONAS_FALLBACK_HEADLINE_TEMPLATE.format(city=city)
 
-logger = logging.getLogger(__name__)
 
+class _JsonObjectAccumulator:
+    """
+    Collect streamed completion text until the outer JSON object closes.
 
-class AiEngineClient:
-    """Client for generating AI-powered insights via an LLM."""
+    Tracks brace depth outside of string literals so the caller can stop
+    reading the stream as soon as a complete object has arrived.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+        self.complete = False
+
+    def feed(self, text: str) -> bool:
+        """Append a streamed chunk; return True once the object is complete."""
+        for index, char in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._started = True
+                self._depth += 1
+            elif char == "}" and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(text[: index + 1])
+                    self.complete = True
+                    return True
+        self._parts.append(text)
+        return False
+
+    @property
+    def content(self) -> str:
+        """Text received so far (up to the closing brace once complete)."""
+        return "".join(self._parts) or "{}"
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Return the content delta carried by a streamed chat-completion chunk."""
+    if not chunk.choices:
+        return ""
+    return chunk.choices[0].delta.content or ""
+
+
+class AiEngineClient(ABC):
+    """
+    Client for generating AI-powered insights via an LLM.
+
+    Use `create_ai_engine_client` to build the implementation matching the
+    configured OpenAI access.
+    """
 
     def __init__(
         self,
@@ -42,6 +177,10 @@ class AiEngineClient:
             model: Optional override for model name.
             timeout_s: Optional override for request timeout seconds.
             openai_client: Optional injected OpenAI client for tests.
+
+        When no client is injected, a process-wide pooled OpenAI client is
+        reused so per-request service construction does not open new
+        connections.
         """
         self._settings = settings
         self._api_key = api_key or settings.openai_api_key
@@ -52,35 +191,209 @@ class AiEngineClient:
             self._openai_client = openai_client
         else:
             self._openai_client = None
-            if self._api_key and OPENAI_CLIENT_CLASS is not None:
-                self._openai_client = OPENAI_CLIENT_CLASS(
+            if self._api_key:
+                self._openai_client = get_shared_openai_client(
                     api_key=self._api_key,
-                    timeout=self._timeout_s,
-                    max_retries=1,
+                    timeout_s=self._timeout_s,
+                    max_connections=settings.openai_max_connections,
+                    max_keepalive_connections=(
+                        settings.openai_max_keepalive_connections
+                    ),
                 )
 
+    @staticmethod
+    def _parse_llm_content(content: str) -> dict[str, Any]:
+        """Parse raw LLM content into a sanitized JSON object (or `{}`)."""
+        parsed = orjson.loads(content)
+        if not isinstance(parsed, dict):
+            return {}
+        return AiEngineClient._strip_numeric_values(parsed)
+
+    @staticmethod
+    def _is_numeric_leaf(value: Any) -> bool:
+        """Return True for int/float leaves; booleans are narrative, not stats."""
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+    @staticmethod
+    def _strip_numeric_values(value: Any) -> Any:
+        """
+        Ensure LLM outputs do not introduce new numeric facts.
+
+        We allow numbers only from our DB outputs. Since the LLM response
+        is constrained to narrative JSON (strings + lists), any numeric leaf
+        value is replaced with None to avoid hallucinated stats.
+
+        Nested dicts/lists are walked iteratively and mutated in place, so
+        deep responses neither reallocate containers nor grow the call stack.
+        """
+        if AiEngineClient._is_numeric_leaf(value):
+            return None
+
+        is_numeric_leaf = AiEngineClient._is_numeric_leaf
+        stack = [value]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                items: Any = node.items()
+            elif isinstance(node, list):
+                items = enumerate(node)
+            else:
+                continue
+            for key, item in items:
+                if is_numeric_leaf(item):
+                    node[key] = None
+                elif isinstance(item, (dict, list)):
+                    stack.append(item)
+        return value
+
+    @staticmethod
+    def _market_summary_fallback(city: str) -> dict[str, Any]:
+        return {"summary": _market_summary_unavailable_text(city)}
+
+    @staticmethod
+    def _opportunity_commentary_fallback(
+        ranked_regions: list[dict[str, Any]], commentary: str
+    ) -> dict[str, Any]:
+        rationale = _REGION_RATIONALE
+        return {
+            "commentary": commentary,
+            "region_rationales": [
+                {"geo_id": region.get("geo_id"), "rationale": rationale}
+                for region in ranked_regions
+            ],
+        }
+
+    @staticmethod
+    def _personas_fallback(city: str) -> dict[str, Any]:
+        return {"headline": _personas_unavailable_headline(city), "personas": []}
+
+    @abstractmethod
+    def generate_market_summary(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Generate a narrative market summary JSON from grounded market stats."""
+
+    @abstractmethod
+    def generate_opportunity_commentary(
+        self, ranked_regions: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """
+        Generate short AI commentary and rationales for ranked opportunity regions.
+        """
+
+    @abstractmethod
+    def generate_personas(self, input_payload: dict[str, Any]) -> dict[str, Any]:
+        """Generate customer personas JSON using grounded market stats."""
+
+
+class StubAiEngineClient(AiEngineClient):
+    """Deterministic stub outputs used when OpenAI is not configured."""
+
+    def generate_market_summary(self, payload: dict[str, Any]) -> dict[str, Any]:
+        city = payload.get("city", _UNKNOWN_CITY)
+        logger.info(
+            "OpenAI client not configured; using stub market summary",
+            extra={"city": city},
+        )
+        return {"summary": _stub_market_summary_text(city)}
+
+    def generate_opportunity_commentary(
+        self, ranked_regions: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        logger.info(
+            "OpenAI client not configured; using stub opportunity commentary",
+            extra={"region_count": len(ranked_regions)},
+        )
+        return self._opportunity_commentary_fallback(
+            ranked_regions, _OPPORTUNITY_STUB_COMMENTARY
+        )
+
+    def generate_personas(self, input_payload: dict[str, Any]) -> dict[str, Any]:
+        city = input_payload.get("city", _UNKNOWN_CITY)
+        business_type = input_payload.get("business_type")
+        logger.info(
+            "OpenAI client not configured; using stub personas",
+            extra={"city": city, "business_type": business_type},
+        )
+        return {
+            "headline": _stub_personas_headline(city, business_type),
+            "personas": [],
+        }
+
+
+class OpenAiEngineClient(AiEngineClient):
+    """LLM-backed client calling OpenAI Chat Completions."""
+
+    def _llm_cache_key(self, system_prompt: str, user_content: str) -> str:
+        """Build a content-addressed cache key for an LLM request."""
+        digest = hashlib.blake2b(
+            f"{self._model}|{system_prompt}|{user_content}".encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        return f"v1:llm:{digest}"
+
+    @staticmethod
+    def _read_json_stream(stream: Any) -> str:
+        """
+        Read streamed completion chunks until the JSON object is complete.
+
+        The HTTP stream is closed as soon as the outer object closes instead of
+        waiting for the server to finish the response.
+        """
+        accumulator = _JsonObjectAccumulator()
+        try:
+            for chunk in stream:
+                if accumulator.feed(_chunk_text(chunk)):
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        return accumulator.content
+
     def _call_llm_json(
         self,
         system_prompt: str,
         user_payload: dict[str, Any],
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Call the LLM and parse a JSON object response.
 
+        The completion is streamed and read only until the outer JSON object
+        closes (see `_read_json_stream`). Responses are cached in-process by
+        request content (see `_LLM_RESPONSE_CACHE`) unless `use_cache` is False
+        or the `LLM_CACHE_ENABLED` setting is off.
+
         Args:
             system_prompt: System prompt describing the task and output shape.
             user_payload: Grounded payload (DB-derived) serialized to JSON.
+            use_cache: Whether to read/write the response cache.
 
         Returns:
             Parsed and sanitized JSON object from the model.
 
         Raises:
             RuntimeError: If no OpenAI client is configured.
-            json.JSONDecodeError: If the model returns invalid JSON.
+            json.JSONDecodeError: If the model returns invalid JSON
+                (`orjson.JSONDecodeError` subclasses it).
         """
         if self._openai_client is None:
             raise RuntimeError("OpenAI client not configured")
 
+        user_content = orjson.dumps(
+            user_payload, default=str, option=orjson.OPT_SORT_KEYS
+        ).decode("utf-8")
+        cache_key: str | None = None
+        if use_cache and self._settings.llm_cache_enabled:
+            cache_key = self._llm_cache_key(system_prompt, user_content)
+            cached_content = _LLM_RESPONSE_CACHE.get(cache_key)
+            if cached_content is not None:
+                logger.info(
+                    "LLM response served from cache",
+                    extra={"model": self._model},
+                )
+                # Cached entries were sanitized before being stored.
+                return orjson.loads(cached_content)
+
         logger.info(
             "Calling LLM for JSON response",
             extra={
@@ -89,19 +402,18 @@ class AiEngineClient:
             },
         )
         try:
-            response = self._openai_client.chat.completions.create(
+            stream = self._openai_client.chat.completions.create(
                 # type: ignore[call-overload]
                 model=self._model,
                 messages=[
                     {"role": "system", "content": system_prompt},
-                    {
-                        "role": "user",
-                        "content": json.dumps(user_payload, default=str),
-                    },
+                    {"role": "user", "content": user_content},
                 ],
                 temperature=0.3,
                 response_format={"type": "json_object"},
+                stream=True,
             )
+            content = self._read_json_stream(stream)
         except Exception:
             logger.error(
                 "LLM call failed",
@@ -110,102 +422,37 @@ class AiEngineClient:
             )
             raise
 
-        content = response.choices[0].message.content or "{}"
-        parsed = json.loads(content)
-        if not isinstance(parsed, dict):
-            return {}
-
-        sanitized = self._strip_numeric_values(parsed)
+        sanitized = self._parse_llm_content(content)
+        if cache_key is not None:
+            _LLM_RESPONSE_CACHE.set(cache_key, orjson.dumps(sanitized))
         logger.info(
             "LLM call succeeded",
             extra={"model": self._model},
         )
         return sanitized
 
-    @staticmethod
-    def _strip_numeric_values(value: Any) -> Any:
-        """
-        Ensure LLM outputs do not introduce new numeric facts.
-
-        We allow numbers only from our DB outputs. Since the LLM response
-        is constrained to narrative JSON (strings + lists), any numeric leaf
-        value is removed to avoid hallucinated stats.
-        """
-
-        if isinstance(value, dict):
-            return {
-                key: AiEngineClient._strip_numeric_values(item)
-                for key, item in value.items()
-            }
-        if isinstance(value, list):
-            return [AiEngineClient._strip_numeric_values(item) for item in value]
-        if isinstance(value, (int, float)):
-            return None
-        return value
-
     def generate_market_summary(self, payload: dict[str, Any]) -> dict[str, Any]:
-        """Generate a narrative market summary JSON from grounded market stats."""
-        if self._openai_client is None:
-            city = payload.get("city", "unknown city")
-            logger.info(
-                "OpenAI client not configured; using stub market summary",
-                extra={"city": city},
-            )
-            return {"summary": f"Market summary for {city}."}
-
-        system_prompt = (
-            "You are an analyst generating a concise market summary. "
-            'Return JSON like {"summary": "...", "highlights": ["..."], '
-            '"risks": ["..."]}. Use the provided stats only.'
-        )
         try:
-            return self._call_llm_json(system_prompt, payload)
+            return self._call_llm_json(_MARKET_SUMMARY_SYSTEM_PROMPT, payload)
         except Exception:
-            city = payload.get("city", "unknown city")
+            city = payload.get("city", _UNKNOWN_CITY)
             logger.warning(
                 "Falling back to stub market summary due to LLM error",
                 exc_info=True,
                 extra={"city": city},
             )
-            return {"summary": f"Market summary for {city} is unavailable currently."}
+            return self._market_summary_fallback(city)
 
     def generate_opportunity_commentary(
         self, ranked_regions: list[dict[str, Any]]
     ) -> dict[str, Any]:
-        """
-        Generate short AI commentary and rationales for ranked opportunity regions.
-        """
-        if self._openai_client is None:
-            logger.info(
-                "OpenAI client not configured; using stub opportunity commentary",
-                extra={"region_count": len(ranked_regions)},
-            )
-            return {
-                "commentary": "Opportunities generated.",
-                "region_rationales": [
-                    {
-                        "geo_id": region.get("geo_id"),
-                        "rationale": "Ranked based on composite opportunity score.",
-                    }
-                    for region in ranked_regions
-                ],
-            }
-
-        system_prompt = (
-            "You are an expert market strategist. Given ranked regions with demand, "
-            "supply, competition, and composite scores, write a short commentary "
-            "explaining why the top regions are attractive/weak. "
-            'Return JSON like {"commentary": "...", '
-            '"region_rationales": [{"geo_id": "...", "rationale": "..."}]}. '
-            "Be factual and grounded in the scores. Keep it brief."
-        )
         try:
             result = self._call_llm_json(
-                system_prompt,
+                _OPPORTUNITY_COMMENTARY_SYSTEM_PROMPT,
                 {"ranked_regions": ranked_regions},
             )
             if "commentary" not in result:
-                result["commentary"] = "AI commentary generated."
+                result["commentary"] = _OPPORTUNITY_DEFAULT_COMMENTARY
             return result
         except Exception:
             logger.warning(
@@ -213,47 +460,47 @@ class AiEngineClient:
                 exc_info=True,
                 extra={"region_count": len(ranked_regions)},
             )
-            return {
-                "commentary": "AI commentary unavailable at the moment.",
-                "region_rationales": [
-                    {
-                        "geo_id": region.get("geo_id"),
-                        "rationale": "Ranked based on composite opportunity score.",
-                    }
-                    for region in ranked_regions
-                ],
-            }
-
-    def generate_personas(self, input_payload: dict[str, Any]) -> dict[str, Any]:
-        """Generate customer personas JSON using grounded market stats."""
-        if self._openai_client is None:
-            city = input_payload.get("city", "unknown city")
-            business_type = input_payload.get("business_type")
-            headline = f"Personas for {city}"
-            if business_type:
-                headline = f"Personas for {city} ({business_type})"
-            logger.info(
-                "OpenAI client not configured; using stub personas",
-                extra={"city": city, "business_type": business_type},
+            return self._opportunity_commentary_fallback(
+                ranked_regions, _OPPORTUNITY_FALLBACK_COMMENTARY
             )
-            return {"headline": headline, "personas": []}
 
-        system_prompt = (
-            "You generate customer personas for a business. "
-            'Return JSON like {"headline": "...", "personas": '
-            '[{"name": "...", "description": "..."}]}. '
-            "Use the provided stats only."
-        )
+    def generate_personas(self, input_payload: dict[str, Any]) -> dict[str, Any]:
         try:
-            return self._call_llm_json(system_prompt, input_payload)
+            return self._call_llm_json(_PERSONAS_SYSTEM_PROMPT, input_payload)
         except Exception:
-            city = input_payload.get("city", "unknown city")
+            city = input_payload.get("city", _UNKNOWN_CITY)
             logger.warning(
                 "Falling back to stub personas due to LLM error",
                 exc_info=True,
                 extra={"city": city},
             )
-            return {
-                "headline": f"Personas for {city} unavailable currently.",
-                "personas": [],
-            }
+            return self._personas_fallback(city)
+
+
+def create_ai_engine_client(
+    settings: Settings,
+    api_key: str | None = None,
+    model: str | None = None,
+    timeout_s: float | None = None,
+    openai_client: Any | None = None,
+) -> AiEngineClient:
+    """
+    Build the AI engine client for `settings`.
+
+    Returns an `OpenAiEngineClient` when an OpenAI client is injected, or when
+    an API key is configured and the `openai` package is installed; otherwise
+    a `StubAiEngineClient`. Arguments are passed through to the client.
+    """
+    uses_openai = openai_client is not None or bool(
+        (api_key or settings.openai_api_key) and OPENAI_CLIENT_CLASS is not None
+    )
+    client_class: type[AiEngineClient] = (
+        OpenAiEngineClient if uses_openai else StubAiEngineClient
+    )
+    return client_class(
+        settings,
+        api_key=api_key,
+        model=model,
+        timeout_s=timeout_s,
+        openai_client=openai_client,
+    )
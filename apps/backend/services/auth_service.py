@@ -7,6 +7,11 @@ from sqlalchemy.orm import Session
 
 from api.schemas.core import TenantRead, UserRead
 from services.dependencies import AuthServiceDependencies
+from services.singleflight import SingleFlight
+
+# Coalesces concurrent `/me` lookups for the same user (e.g. SPA refresh bursts)
+# into one DB round-trip per worker process.
+_PROFILE_LOOKUPS: SingleFlight[dict] = SingleFlight()
 
 
 class AuthService:
@@ -24,15 +29,23 @@ class AuthService:
         Load the current user's profile and tenant from the database.
 
         Used by `/auth/me` and `/me` to hydrate auth context into API responses.
+        The user and tenant rows are fetched together in a single JOIN query;
+        concurrent calls for the same `user_id` share one lookup.
         """
-        user = self._user_repository.get_by_id(db_session, user_id)
+        return _PROFILE_LOOKUPS.do(
+            user_id, lambda: self._load_user_profile(db_session, user_id)
+        )
+
+    def _load_user_profile(self, db_session: Session, user_id: UUID) -> dict:
+        """Fetch the user with its tenant and build the profile payload."""
+        user = self._user_repository.get_by_id_with_tenant(db_session, user_id)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
 
-        tenant = self._tenant_repository.get_by_id(db_session, user.tenant_id)
+        tenant = user.tenant
         if tenant is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
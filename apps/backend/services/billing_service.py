@@ -1,12 +1,28 @@
 """Billing and usage metering service."""
 
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from api.config import Settings, get_settings
 from services.dependencies import BillingServiceDependencies
+from services.ttl_cache import TTLCache
+
+# (plan, status) per tenant; `(None, None)` records a tenant with no billing
+# account. Billing accounts only change on plan changes, so reads on gated
+# requests are served from here for a few minutes.
+_BILLING_ACCOUNT_CACHE: TTLCache[tuple[str | None, str | None]] = TTLCache(
+    maxsize=1000, ttl_s=300
+)
+
+
+def _current_month_start() -> datetime:
+    """Return the start of the current calendar month in UTC."""
+    now = datetime.now(timezone.utc)
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
 class BillingService:
@@ -15,10 +31,34 @@ class BillingService:
     def __init__(
         self,
         dependencies: BillingServiceDependencies,
+        settings: Settings | None = None,
     ) -> None:
         self._billing_repository = dependencies.billing_repository
         self._usage_repository = dependencies.usage_repository
         self._stripe_client = dependencies.stripe_client
+        self._settings = settings or get_settings()
+
+    def get_report_quota(
+        self, db_session: Session, tenant_id: UUID
+    ) -> tuple[int, datetime] | None:
+        """
+        Return the tenant's report limit and the start of the period it covers.
+
+        The limit comes from `REPORT_QUOTA_BY_PLAN` for the tenant's billing
+        plan and applies per calendar month (UTC). Returns None when the tenant
+        is unlimited; no lookups run when no quotas are configured.
+        """
+        quota_by_plan = self._settings.report_quota_by_plan
+        if not quota_by_plan:
+            return None
+
+        plan, _status = self._get_plan_and_status(db_session, tenant_id)
+        if plan is None:
+            return None
+        report_limit = quota_by_plan.get(plan)
+        if report_limit is None:
+            return None
+        return report_limit, _current_month_start()
 
     def check_report_quota(self, db_session: Session, tenant_id: UUID) -> bool:
         """
@@ -28,14 +68,45 @@ class BillingService:
             db_session: SQLAlchemy session.
             tenant_id: Tenant UUID.
 
+        Usage is a single indexed COUNT of report jobs created in the current
+        quota period (see `get_report_quota`).
+
         Returns:
             True if the tenant is allowed to create another report.
-
-        TODO: Replace with real plan/quota lookup + usage metering.
         """
-        _ = db_session
-        _ = tenant_id
-        return True
+        quota = self.get_report_quota(db_session, tenant_id)
+        if quota is None:
+            return True
+
+        report_limit, period_start = quota
+        reports_this_month = self._usage_repository.count_report_jobs_since(
+            db_session, tenant_id, period_start
+        )
+        return reports_this_month < report_limit
+
+    def _get_plan_and_status(
+        self, db_session: Session, tenant_id: UUID
+    ) -> tuple[str | None, str | None]:
+        """Return the tenant's (plan, status), cached for a few minutes."""
+        cached = _BILLING_ACCOUNT_CACHE.get(tenant_id)
+        if cached is not None:
+            return cached
+
+        billing_account = self._billing_repository.get_billing_account(
+            db_session, tenant_id
+        )
+        plan_and_status: tuple[str | None, str | None] = (
+            (None, None)
+            if billing_account is None
+            else (billing_account.plan, billing_account.status)
+        )
+        _BILLING_ACCOUNT_CACHE.set(tenant_id, plan_and_status)
+        return plan_and_status
+
+    @staticmethod
+    def invalidate_billing_account(tenant_id: UUID) -> None:
+        """Drop the cached plan/status for a tenant after a plan change."""
+        _BILLING_ACCOUNT_CACHE.delete(tenant_id)
 
     def get_plan_and_usage(
         self, db_session: Session, tenant_id: UUID
@@ -43,21 +114,16 @@ class BillingService:
         """
         Return current billing plan/status and usage totals for a tenant.
 
+        The plan/status lookup is cached per tenant (see
+        `_BILLING_ACCOUNT_CACHE`); usage is always read fresh.
+
         Args:
             db_session: SQLAlchemy session.
             tenant_id: Tenant UUID.
         """
-        billing_account = self._billing_repository.get_billing_account(
-            db_session, tenant_id
-        )
+        plan, account_status = self._get_plan_and_status(db_session, tenant_id)
         usage = self._usage_repository.get_current_usage(db_session, tenant_id)
-        if billing_account is None:
-            return {"plan": None, "status": None, "usage": usage}
-        return {
-            "plan": billing_account.plan,
-            "status": billing_account.status,
-            "usage": usage,
-        }
+        return {"plan": plan, "status": account_status, "usage": usage}
 
     def create_checkout_session(
         self, db_session: Session, tenant_id: UUID, target_plan: str
@@ -0,0 +1,58 @@
+"""Fan out independent read-only repository queries across worker threads."""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable
+
+from sqlalchemy.orm import Session
+
+from models.db import SessionLocal
+
+# Shared pool for independent reads issued by a single request (market summary,
+# overview, personas). DB drivers release the GIL while waiting on the network.
+# Each worker holds at most one pooled connection, so the worker count stays well
+# below the engine's `pg_pool_size + pg_max_overflow` (10 + 20 by default).
+_READ_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="db-read")
+
+
+class ConcurrentReader:
+    """Runs independent read-only queries concurrently, one session per read."""
+
+    def __init__(
+        self, session_factory: Callable[[], Session], executor: Executor
+    ) -> None:
+        """
+        Create a reader opening sessions from `session_factory`.
+
+        Args:
+            session_factory: Creates the short-lived session for each read.
+            executor: Runs the reads; its worker count bounds the pooled
+                connections held by reads at once.
+        """
+        self._session_factory = session_factory
+        self._executor = executor
+
+    def _read_in_own_session(self, read: Callable[[Session], Any]) -> Any:
+        with self._session_factory() as session:
+            return read(session)
+
+    def run(self, *reads: Callable[[Session], Any]) -> list[Any]:
+        """
+        Run independent `reads` concurrently and return their results in order.
+
+        Every read runs on a worker thread with its own session (a `Session` is
+        not thread-safe). The caller's request session is not used, so the
+        calling thread never holds a pooled connection while it waits on workers
+        that need one from the same pool. Latency is the slowest query rather
+        than the sum.
+        """
+        futures = [
+            self._executor.submit(self._read_in_own_session, read) for read in reads
+        ]
+        return [future.result() for future in futures]
+
+
+@lru_cache(maxsize=1)
+def get_concurrent_reader() -> ConcurrentReader:
+    """Return the process-wide reader bound to the application engine."""
+    return ConcurrentReader(SessionLocal, _READ_EXECUTOR)
@@ -2,11 +2,17 @@
 
 These keep service initialization SOLID and readable by grouping required
 repositories/clients into explicit dataclasses.
+
+Bundles are slotted, keyword-only dataclasses. They are treated as immutable
+once built (services copy the fields they need in `__init__`), but are not
+declared `frozen` to avoid the `object.__setattr__` cost of frozen
+construction.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from repositories.admin_dashboard_repository import AdminDashboardRepository
 from repositories.billing_repository import BillingRepository
 from repositories.business_density_repository import BusinessDensityRepository
 from repositories.data_freshness_repository import DataFreshnessRepository
@@ -19,11 +25,12 @@ from repositories.tenant_repository import TenantRepository
 from repositories.usage_repository import UsageRepository
 from repositories.user_repository import UserRepository
 from services.ai_engine_client import AiEngineClient
+from services.concurrent_reads import ConcurrentReader, get_concurrent_reader
 from services.pubsub_client import PubSubClient
 from services.stripe_client import StripeClient
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class MarketServiceDependencies:
     """Concrete dependencies required by `MarketService`."""
 
@@ -31,9 +38,10 @@ class MarketServiceDependencies:
     business_density_repository: BusinessDensityRepository
     spending_repository: SpendingRepository
     labour_stats_repository: LabourStatsRepository
+    concurrent_reader: ConcurrentReader = field(default_factory=get_concurrent_reader)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class InsightServiceDependencies:
     """Concrete dependencies required by `InsightService`."""
 
@@ -42,9 +50,10 @@ class InsightServiceDependencies:
     labour_stats_repository: LabourStatsRepository
     opportunity_scores_repository: OpportunityScoresRepository
     ai_engine_client: AiEngineClient
+    concurrent_reader: ConcurrentReader = field(default_factory=get_concurrent_reader)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class PersonaServiceDependencies:
     """Concrete dependencies required by `PersonaService`."""
 
@@ -52,9 +61,10 @@ class PersonaServiceDependencies:
     spending_repository: SpendingRepository
     labour_stats_repository: LabourStatsRepository
     ai_engine_client: AiEngineClient
+    concurrent_reader: ConcurrentReader = field(default_factory=get_concurrent_reader)
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class ReportServiceDependencies:
     """Concrete dependencies required by `ReportService`."""
 
@@ -63,7 +73,7 @@ class ReportServiceDependencies:
     pubsub_client: PubSubClient
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class BillingServiceDependencies:
     """Concrete dependencies required by `BillingService`."""
 
@@ -72,7 +82,7 @@ class BillingServiceDependencies:
     stripe_client: StripeClient
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class AdminServiceDependencies:
     """Concrete dependencies required by `AdminService`."""
 
@@ -80,9 +90,10 @@ class AdminServiceDependencies:
     tenant_repository: TenantRepository
     data_freshness_repository: DataFreshnessRepository
     report_jobs_repository: ReportJobsRepository
+    admin_dashboard_repository: AdminDashboardRepository
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class AuthServiceDependencies:
     """Concrete dependencies required by `AuthService`."""
 
@@ -90,14 +101,14 @@ class AuthServiceDependencies:
     tenant_repository: TenantRepository
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class TenantServiceDependencies:
     """Concrete dependencies required by `TenantService`."""
 
     tenant_repository: TenantRepository
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, kw_only=True)
 class EtlOrchestrationServiceDependencies:
     """Concrete dependencies required by `ETLOrchestrationService`."""
 
@@ -8,17 +8,51 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
-from api.config import Settings
+import numpy as np
 
-try:
-    from openai import OpenAI as OPENAI_CLIENT_CLASS  # type: ignore[import-untyped]
-except ModuleNotFoundError:  # pragma: no cover
-    OPENAI_CLIENT_CLASS = None  # type: ignore[assignment,misc]
+from api.config import Settings
+from services.openai_client import get_shared_openai_client
 
 logger = logging.getLogger(__name__)
 
+_SHA256_DIGEST_SIZE = hashlib.sha256().digest_size
+# Scale that maps a digest byte 0..255 onto -1..1.
+_BYTE_SCALE = np.float32(1 / 127.5)
+
+
+@lru_cache(maxsize=16)
+def _stub_byte_indices(dimensions: int) -> np.ndarray:
+    """Digest byte index for each of `dimensions` output values."""
+    return np.arange(dimensions) % _SHA256_DIGEST_SIZE
+
+
+@lru_cache(maxsize=4096)
+def _stub_embedding_cached(text: str, dimensions: int) -> np.ndarray:
+    """
+    Deterministic embedding of fixed dimension, memoized per (text, dimensions).
+
+    This is not semantically meaningful; it's purely for stable tests/dev. The
+    returned array is read-only because it is shared between callers.
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    digest_bytes = np.frombuffer(digest, dtype=np.uint8)
+    values = digest_bytes[_stub_byte_indices(dimensions)].astype(np.float32)
+    values = values * _BYTE_SCALE - 1.0
+    values.flags.writeable = False
+    return values
+
+
+# Texts per embeddings request, and how many requests may be in flight at once.
+_BATCH_SIZE = 128
+_MAX_CONCURRENCY = 4
+_EMBEDDING_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_CONCURRENCY, thread_name_prefix="embeddings"
+)
+
 
 class EmbeddingClient:
     def __init__(
@@ -37,27 +71,45 @@ class EmbeddingClient:
         self._dimensions = dimensions or settings.openai_embedding_dimensions
         self._timeout_s = timeout_s or settings.openai_timeout_s
 
+        # Tests inject `openai_client`; otherwise share the process-wide pooled
+        # client for these settings so connections survive across jobs.
         if openai_client is not None:
             self._openai_client = openai_client
         else:
             self._openai_client = None
-            if self._api_key and OPENAI_CLIENT_CLASS is not None:
-                self._openai_client = OPENAI_CLIENT_CLASS(
+            if self._api_key:
+                self._openai_client = get_shared_openai_client(
                     api_key=self._api_key,
-                    timeout=self._timeout_s,
-                    max_retries=1,
+                    timeout_s=self._timeout_s,
+                    max_connections=settings.openai_max_connections,
+                    max_keepalive_connections=(
+                        settings.openai_max_keepalive_connections
+                    ),
                 )
 
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed `texts` into a float32 array of shape `(len(texts), dimensions)`.
+
+        Callers that need JSON-serializable values should use `.tolist()`.
+        Raises `ValueError` if the provider returns the wrong number of
+        embeddings or vectors of the wrong dimension.
+        """
+        # NaN-filled so a row the provider never wrote cannot pass as data.
+        out = np.full((len(texts), self._dimensions), np.nan, dtype=np.float32)
         if not texts:
-            return []
+            return out
 
         if self._openai_client is None:
             logger.info(
                 "OpenAI client not configured; using deterministic stub embeddings",
                 extra={"text_count": len(texts), "dimensions": self._dimensions},
             )
-            return [self._stub_embedding(text) for text in texts]
+            # Repeated texts in a batch share one computed embedding.
+            unique = {text: self._stub_embedding(text) for text in dict.fromkeys(texts)}
+            for row, text in enumerate(texts):
+                out[row] = unique[text]
+            return out
 
         logger.info(
             "Generating embeddings",
@@ -67,23 +119,53 @@ class EmbeddingClient:
                 "dimensions": self._dimensions,
             },
         )
-        response = self._openai_client.embeddings.create(  # type: ignore[call-overload]
+        if len(texts) <= _BATCH_SIZE:
+            self._embed_batch_into(out, 0, texts)
+            return out
+
+        # Large inputs are split so each request stays under provider limits;
+        # batches run concurrently and fill disjoint row ranges of `out`.
+        futures = [
+            _EMBEDDING_EXECUTOR.submit(
+                self._embed_batch_into, out, start, texts[start : start + _BATCH_SIZE]
+            )
+            for start in range(0, len(texts), _BATCH_SIZE)
+        ]
+        for future in futures:
+            future.result()
+        return out
+
+    def _embed_batch_into(self, out: np.ndarray, start: int, texts: list[str]) -> None:
+        """
+        Embed one request-sized batch into `out[start : start + len(texts)]`.
+
+        Each embedding is placed by its `index` in the request rather than by
+        its position in the response.
+        """
+        response = self._openai_client.embeddings.create(  # type: ignore[union-attr]
             model=self._model,
             input=texts,
             dimensions=self._dimensions,
         )
-        return [item.embedding for item in response.data]
+        if len(response.data) != len(texts):
+            raise ValueError(
+                f"Expected {len(texts)} embeddings, got {len(response.data)}"
+            )
+        batch = out[start : start + len(texts)]
+        for item in response.data:
+            if len(item.embedding) != self._dimensions:
+                raise ValueError(
+                    f"Expected embeddings of dimension {self._dimensions}, "
+                    f"got {len(item.embedding)}"
+                )
+            batch[item.index] = item.embedding
+        if np.isnan(batch[:, 0]).any():
+            raise ValueError("Embeddings response is missing input indices")
 
-    def _stub_embedding(self, text: str) -> list[float]:
+    def _stub_embedding(self, text: str) -> np.ndarray:
         """
         Deterministic embedding of fixed dimension.
 
         This is not semantically meaningful; it's purely for stable tests/dev.
         """
-        digest = hashlib.sha256(text.encode("utf-8")).digest()
-        values: list[float] = []
-        for idx in range(self._dimensions):
-            b = digest[idx % len(digest)]
-            # Map 0..255 to -1..1
-            values.append((b / 127.5) - 1.0)
-        return values
+        return _stub_embedding_cached(text, self._dimensions)
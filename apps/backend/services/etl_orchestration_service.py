@@ -5,10 +5,16 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+import orjson
+from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 
 from services.dependencies import EtlOrchestrationServiceDependencies
 
+logger = logging.getLogger(__name__)
+
+_EMBEDDING_DATASETS = frozenset({"rebuild-embeddings", "vector_insights"})
+
 
 class ETLOrchestrationService:
     """Triggers and monitors ETL workflows from admin endpoints."""
@@ -25,6 +31,7 @@ class ETLOrchestrationService:
         options: dict[str, Any] | None,
         triggered_by_user_id: UUID,
         triggered_by_tenant_id: UUID,
+        background_tasks: BackgroundTasks | None = None,
     ) -> dict[str, Any]:
         """
         Publish a request to run an ad-hoc ETL job.
@@ -36,65 +43,77 @@ class ETLOrchestrationService:
             options: Optional provider/job options.
             triggered_by_user_id: Admin user triggering the run.
             triggered_by_tenant_id: Tenant of the admin user.
+            background_tasks: When given, the publish is deferred until after
+                the HTTP response has been sent instead of running inline.
+
+        Returns:
+            Dict with `status`, the `payload` dict, and `payload_json`: the
+            payload encoded once and shared by the publish and the API response.
         """
-        now = datetime.now(timezone.utc)
+        requested_at = datetime.now(timezone.utc).isoformat()
+        user_id = str(triggered_by_user_id)
+        tenant_id = str(triggered_by_tenant_id)
         resolved_options = options or {}
         normalized_dataset = str(dataset).strip()
 
-        if normalized_dataset in {"rebuild-embeddings", "vector_insights"}:
+        if normalized_dataset in _EMBEDDING_DATASETS:
             job_name = "rebuild-embeddings"
-            regions = resolved_options.get("regions")
             payload: dict[str, Any] = {
                 "job_name": job_name,
                 "country": country,
                 "city": city,
-                "regions": regions,
+                "regions": resolved_options.get("regions"),
                 "options": resolved_options,
-                "requested_at": now.isoformat(),
-                "triggered_by_user_id": str(triggered_by_user_id),
-                "triggered_by_tenant_id": str(triggered_by_tenant_id),
+                "requested_at": requested_at,
+                "triggered_by_user_id": user_id,
+                "triggered_by_tenant_id": tenant_id,
             }
-            self._pubsub_client.publish_embedding_job(
-                topic="embedding-jobs",
-                message=payload,
-            )
+            publish = self._pubsub_client.publish_embedding_job
+            topic = "embedding-jobs"
         else:
             job_name = "adhoc-etl-run"
+            force_full_refresh = bool(
+                resolved_options.get("force_full_refresh")
+                or resolved_options.get("full_refresh")
+            )
             payload = {
                 "job_name": job_name,
                 "dataset": normalized_dataset,
                 "country": country,
                 "city": city,
-                "force_full_refresh": bool(
-                    resolved_options.get("force_full_refresh")
-                    or resolved_options.get("full_refresh")
-                    or False
-                ),
+                "force_full_refresh": force_full_refresh,
                 "options": resolved_options,
-                "requested_at": now.isoformat(),
-                "triggered_by_user_id": str(triggered_by_user_id),
-                "triggered_by_tenant_id": str(triggered_by_tenant_id),
+                "requested_at": requested_at,
+                "triggered_by_user_id": user_id,
+                "triggered_by_tenant_id": tenant_id,
             }
-            self._pubsub_client.publish_ingestion_job(
-                topic="ingestion-jobs",
-                message=payload,
+            publish = self._pubsub_client.publish_ingestion_job
+            topic = "ingestion-jobs"
+
+        payload_json = orjson.dumps(payload)
+        if background_tasks is not None:
+            background_tasks.add_task(
+                publish, topic=topic, message=payload, raw_message=payload_json
             )
+        else:
+            publish(topic=topic, message=payload, raw_message=payload_json)
 
-        logging.getLogger(__name__).info(
-            "Queued background job",
-            extra={
-                "job_name": job_name,
-                "dataset": normalized_dataset,
-                "country": country,
-                "city": city,
-                "requested_at": payload["requested_at"],
-                "triggered_by_user_id": str(triggered_by_user_id),
-                "triggered_by_tenant_id": str(triggered_by_tenant_id),
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Queued background job",
+                extra={
+                    "job_name": job_name,
+                    "dataset": normalized_dataset,
+                    "country": country,
+                    "city": city,
+                    "requested_at": requested_at,
+                    "triggered_by_user_id": user_id,
+                    "triggered_by_tenant_id": tenant_id,
+                },
+            )
 
         # TODO: Optionally persist this request to an `admin_actions` table once
         # the model/migration is introduced.
         _ = db_session
 
-        return {"status": "QUEUED", "payload": payload}
+        return {"status": "QUEUED", "payload": payload, "payload_json": payload_json}
@@ -1,8 +1,8 @@
 """Insight orchestration service."""
 
+import heapq
 import logging
-from decimal import Decimal
-from typing import Any, cast
+from typing import Any, TypedDict
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -11,6 +11,40 @@ from sqlalchemy.orm import Session
 from services.dependencies import InsightServiceDependencies
 
 
+class MarketStats(TypedDict):
+    """Column-oriented market data sections of a market summary."""
+
+    demographics: dict[str, list[Any]]
+    spending: dict[str, list[Any]]
+    labour_stats: dict[str, list[Any]]
+
+
+class MarketSummaryResult(TypedDict):
+    """Result of `InsightService.generate_market_summary`."""
+
+    city: str
+    country: str | None
+    stats: MarketStats
+    stats_used: dict[str, Any]
+    ai_summary: dict[str, Any]
+
+
+class OpportunitiesResult(TypedDict):
+    """Result of `InsightService.find_opportunities`."""
+
+    city: str
+    country: str | None
+    business_type: str | None
+    opportunities: list[dict[str, Any]]
+    stats_used: dict[str, Any]
+    ai_commentary: dict[str, Any]
+
+
+def _composite_rank(region: dict[str, Any]) -> float:
+    """Ranking key for opportunity regions (unscored regions rank last)."""
+    return region["composite_score"] or 0.0
+
+
 class InsightService:
     """Combines market data with AI-engine outputs to produce insights."""
 
@@ -23,12 +57,33 @@ class InsightService:
         self._labour_stats_repository = dependencies.labour_stats_repository
         self._opportunity_scores_repository = dependencies.opportunity_scores_repository
         self._ai_engine_client = dependencies.ai_engine_client
+        self._concurrent_reader = dependencies.concurrent_reader
+
+    def _fetch_market_rows(
+        self,
+        city: str,
+        country: str | None,
+        geo_ids: list[str] | None,
+    ) -> tuple[list[Any], list[Any], list[Any]]:
+        """
+        Fetch demographics, spending and labour rows for a city concurrently.
 
-    @staticmethod
-    def _numeric_to_float(value: Any | None) -> float | None:
-        if value is None:
-            return None
-        return float(cast(Decimal, value))
+        The three reads are independent, so they are fanned out with the
+        `ConcurrentReader`, each on its own session; the summary waits for the
+        slowest query rather than the sum.
+        """
+        demographics_rows, spending_rows, labour_rows = self._concurrent_reader.run(
+            lambda session: self._demographics_repository.get_for_regions(
+                session, city, country, geo_ids=geo_ids
+            ),
+            lambda session: self._spending_repository.get_for_regions(
+                session, city, country, geo_ids=geo_ids
+            ),
+            lambda session: self._labour_stats_repository.get_for_regions(
+                session, city, country, geo_ids=geo_ids
+            ),
+        )
+        return demographics_rows, spending_rows, labour_rows
 
     def generate_market_summary(
         self,
@@ -37,7 +92,7 @@ class InsightService:
         country: str | None,
         tenant_id: UUID,
         regions: list[str] | None = None,
-    ) -> dict:
+    ) -> MarketSummaryResult:
         """
         Generate a market summary for a city/regions by combining stats with AI.
 
@@ -55,17 +110,21 @@ class InsightService:
             },
         )
 
-        demographics_rows = self._demographics_repository.get_for_regions(
-            db_session, city, country
-        )
-        spending_rows = self._spending_repository.get_for_regions(
-            db_session, city, country
-        )
-        labour_rows = self._labour_stats_repository.get_for_regions(
-            db_session, city, country
+        # The reads run on the reader's own sessions, so `db_session` keeps no
+        # connection checked out while they wait on the pool.
+        _ = db_session
+        demographics_rows, spending_rows, labour_rows = self._fetch_market_rows(
+            city, country, geo_ids=regions or None
         )
 
-        if not demographics_rows and not spending_rows and not labour_rows:
+        # Requested regions may match no rows; that is an empty summary, not a
+        # 404, as long as the city itself has market data.
+        if (
+            not demographics_rows
+            and not spending_rows
+            and not labour_rows
+            and not (regions and any(self._fetch_market_rows(city, country, None)))
+        ):
             logger.warning(
                 "No market data found for market summary",
                 extra={"tenant_id": str(tenant_id), "city": city, "country": country},
@@ -75,48 +134,40 @@ class InsightService:
                 detail="No market data found for city",
             )
 
-        region_filter: set[str] = set(regions) if regions else set()
-
-        demographics_payload = [
-            {
-                "geo_id": row.geo_id,
-                "population_total": row.population_total,
-                "median_income": self._numeric_to_float(row.median_income),
-            }
-            for row in demographics_rows
-            if not region_filter or row.geo_id in region_filter
-        ]
+        # Sections are column-oriented (one list per field) rather than one dict
+        # per row, so field names are not repeated for every region in the AI
+        # payload. `MarketSummaryResponse` zips `stats` back into rows.
+        demographics_payload = {
+            "geo_id": [row.geo_id for row in demographics_rows],
+            "population_total": [row.population_total for row in demographics_rows],
+            "median_income": [row.median_income for row in demographics_rows],
+        }
 
-        spending_payload = [
-            {
-                "geo_id": row.geo_id,
-                "category": row.category,
-                "avg_monthly_spend": self._numeric_to_float(row.avg_monthly_spend),
-                "spend_index": self._numeric_to_float(row.spend_index),
-            }
-            for row in spending_rows
-            if not region_filter or row.geo_id in region_filter
-        ]
+        spending_payload = {
+            "geo_id": [row.geo_id for row in spending_rows],
+            "category": [row.category for row in spending_rows],
+            "avg_monthly_spend": [row.avg_monthly_spend for row in spending_rows],
+            "spend_index": [row.spend_index for row in spending_rows],
+        }
 
-        labour_payload = [
-            {
-                "geo_id": row.geo_id,
-                "unemployment_rate": self._numeric_to_float(row.unemployment_rate),
-                "job_openings": row.job_openings,
-                "median_salary": self._numeric_to_float(row.median_salary),
-            }
-            for row in labour_rows
-            if not region_filter or row.geo_id in region_filter
-        ]
+        labour_payload = {
+            "geo_id": [row.geo_id for row in labour_rows],
+            "unemployment_rate": [row.unemployment_rate for row in labour_rows],
+            "job_openings": [row.job_openings for row in labour_rows],
+            "median_salary": [row.median_salary for row in labour_rows],
+        }
 
-        payload = {
-            "tenant_id": str(tenant_id),
-            "city": city,
-            "country": country,
+        stats: MarketStats = {
             "demographics": demographics_payload,
             "spending": spending_payload,
             "labour_stats": labour_payload,
         }
+        payload: dict[str, Any] = {
+            "tenant_id": str(tenant_id),
+            "city": city,
+            "country": country,
+        }
+        payload.update(stats)
 
         try:
             ai_summary = self._ai_engine_client.generate_market_summary(payload)
@@ -131,11 +182,8 @@ class InsightService:
         return {
             "city": city,
             "country": country,
-            "stats": {
-                "demographics": demographics_payload,
-                "spending": spending_payload,
-                "labour_stats": labour_payload,
-            },
+            # `stats` and `stats_used` share the same section objects.
+            "stats": stats,
             "stats_used": payload,
             "ai_summary": ai_summary,
         }
@@ -148,12 +196,14 @@ class InsightService:
         constraints: dict[str, Any] | None,
         country: str | None,
         tenant_id: UUID,
-    ) -> dict:
+        top_k: int | None = None,
+    ) -> OpportunitiesResult:
         """
         Return ranked opportunity regions for a city and optional business type.
 
         Applies optional numeric constraints to DB-sourced scores, sorts by
-        composite score, and augments results with AI commentary.
+        composite score, and augments results with AI commentary. With `top_k`,
+        only the best `top_k` regions are selected (O(N log K) via a heap).
         """
         logger = logging.getLogger(__name__)
         logger.info(
@@ -191,33 +241,36 @@ class InsightService:
             min_composite_score = constraints.get("min_composite_score")
             max_competition_score = constraints.get("max_competition_score")
 
-        ranked_regions: list[dict[str, Any]] = []
-        for row in rows:
-            composite_score = self._numeric_to_float(row.composite_score)
-            competition_score = self._numeric_to_float(row.competition_score)
-
-            if min_composite_score is not None and (
-                composite_score is None or composite_score < min_composite_score
-            ):
-                continue
-            if max_competition_score is not None and (
-                competition_score is None or competition_score > max_competition_score
-            ):
-                continue
-
-            ranked_regions.append(
-                {
-                    "geo_id": row.geo_id,
-                    "country": row.country,
-                    "city": row.city,
-                    "business_type": row.business_type,
-                    "demand_score": self._numeric_to_float(row.demand_score),
-                    "supply_score": self._numeric_to_float(row.supply_score),
-                    "competition_score": competition_score,
-                    "composite_score": composite_score,
-                    "calculated_at": row.calculated_at,
-                }
-            )
+        ranked_regions: list[dict[str, Any]] = [
+            {
+                "geo_id": row.geo_id,
+                "country": row.country,
+                "city": row.city,
+                "business_type": row.business_type,
+                "demand_score": row.demand_score,
+                "supply_score": row.supply_score,
+                "competition_score": row.competition_score,
+                "composite_score": row.composite_score,
+                "calculated_at": row.calculated_at,
+            }
+            for row in rows
+        ]
+
+        # Unconstrained requests (the common case) skip per-row threshold checks.
+        if min_composite_score is not None:
+            ranked_regions = [
+                region
+                for region in ranked_regions
+                if region["composite_score"] is not None
+                and region["composite_score"] >= min_composite_score
+            ]
+        if max_competition_score is not None:
+            ranked_regions = [
+                region
+                for region in ranked_regions
+                if region["competition_score"] is not None
+                and region["competition_score"] <= max_competition_score
+            ]
 
         if not ranked_regions:
             logger.warning(
@@ -234,10 +287,10 @@ class InsightService:
                 detail="No opportunities match constraints",
             )
 
-        ranked_regions.sort(
-            key=lambda region: region.get("composite_score") or 0.0,
-            reverse=True,
-        )
+        if top_k is not None:
+            ranked_regions = heapq.nlargest(top_k, ranked_regions, key=_composite_rank)
+        else:
+            ranked_regions.sort(key=_composite_rank, reverse=True)
 
         try:
             ai_commentary = self._ai_engine_client.generate_opportunity_commentary(
@@ -261,10 +314,12 @@ class InsightService:
             "country": country,
             "business_type": business_type,
             "opportunities": ranked_regions,
+            # `opportunities` is the canonical region list; `stats_used` only
+            # records its size so the regions are not serialized twice.
             "stats_used": {
                 "business_type": business_type,
                 "constraints": constraints,
-                "ranked_regions": ranked_regions,
+                "region_count": len(ranked_regions),
             },
             "ai_commentary": ai_commentary,
         }
@@ -1,24 +1,61 @@
 """Market data access and aggregation service."""
 
-from decimal import Decimal
-from typing import Any, cast
 from uuid import UUID
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from services.dependencies import MarketServiceDependencies
+from services.ttl_cache import TTLCache
+
+# City lists per country filter (`None` key = all countries). Cities only change
+# when an ingestion run lands, so the list is served from here for a few
+# minutes; ingestion also clears it after each successful run.
+_CITY_LIST_CACHE: TTLCache[tuple[str, ...]] = TTLCache(maxsize=64, ttl_s=300)
+# Per-(city, country) overview aggregates, cached and invalidated the same way.
+_OVERVIEW_CACHE: TTLCache[dict] = TTLCache(maxsize=1024, ttl_s=300)
+
+# Response fields per dataset. Listings select only these columns (Core rows, no
+# ORM hydration) and each row becomes a dict via its `_mapping`.
+_DEMOGRAPHICS_FIELDS = (
+    "geo_id",
+    "country",
+    "city",
+    "population_total",
+    "median_income",
+    "age_distribution",
+    "education_levels",
+    "household_size_avg",
+    "immigration_ratio",
+    "coordinates",
+    "last_updated",
+)
+
+_BUSINESS_DENSITY_FIELDS = (
+    "geo_id",
+    "country",
+    "city",
+    "business_type",
+    "count",
+    "density_score",
+    "coordinates",
+    "last_updated",
+)
+
+_SPENDING_FIELDS = (
+    "geo_id",
+    "country",
+    "city",
+    "category",
+    "avg_monthly_spend",
+    "spend_index",
+    "last_updated",
+)
 
 
 class MarketService:
     """Reads normalized market/demographic datasets for API endpoints."""
 
-    @staticmethod
-    def _numeric_to_float(value: Any | None) -> float | None:
-        if value is None:
-            return None
-        return float(cast(Decimal, value))
-
     def __init__(
         self,
         dependencies: MarketServiceDependencies,
@@ -27,25 +64,25 @@ class MarketService:
         self._business_density_repository = dependencies.business_density_repository
         self._spending_repository = dependencies.spending_repository
         self._labour_stats_repository = dependencies.labour_stats_repository
+        self._concurrent_reader = dependencies.concurrent_reader
 
     def list_cities(self, db_session: Session, country: str | None) -> list[str]:
         """List distinct cities with any market data, optionally filtered by country."""
-        demographics_cities = self._demographics_repository.distinct_cities(
-            db_session, country
-        )
-        business_density_cities = self._business_density_repository.distinct_cities(
-            db_session, country
-        )
-
-        if business_density_cities:
-            business_density_city_set = set(business_density_cities)
-            return [
-                city
-                for city in demographics_cities
-                if city in business_density_city_set
-            ]
+        cached = _CITY_LIST_CACHE.get(country)
+        if cached is None:
+            cached = tuple(
+                self._demographics_repository.list_cities_with_business_density(
+                    db_session, country
+                )
+            )
+            _CITY_LIST_CACHE.set(country, cached)
+        return list(cached)
 
-        return demographics_cities
+    @staticmethod
+    def invalidate_market_caches() -> None:
+        """Drop cached city lists and overviews after market data is (re)ingested."""
+        _CITY_LIST_CACHE.clear()
+        _OVERVIEW_CACHE.clear()
 
     def get_overview(
         self,
@@ -57,28 +94,46 @@ class MarketService:
         """
         Aggregate per-city market summaries across datasets.
 
+        The four aggregate queries are independent and run concurrently, each on
+        its own `ConcurrentReader` session. Results are cached per
+        (city, country) until they expire or ingestion runs.
+
         Args:
-            db_session: SQLAlchemy session.
+            db_session: Request session; unused, so it holds no connection while
+                the concurrent reads wait on the pool.
             city: City name (as stored in datasets).
             country: Optional country code.
             tenant_id: Tenant scope (reserved for future RLS).
         """
-        demographics_summary = self._demographics_repository.get_city_aggregates(
-            db_session, city, country
-        )
-        spending_summary = self._spending_repository.get_city_aggregates(
-            db_session, city, country
-        )
-        labour_summary = self._labour_stats_repository.get_city_aggregates(
-            db_session, city, country
-        )
-        business_density_summary = self._business_density_repository.get_summary(
-            db_session, city, country
+        # tenant_id is accepted for future RLS/tenant scoping, unused for now;
+        # it must become part of the cache key once results are tenant-scoped.
+        _ = db_session, tenant_id
+        cache_key = (city, country)
+        cached = _OVERVIEW_CACHE.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        (
+            demographics_summary,
+            spending_summary,
+            labour_summary,
+            business_density_summary,
+        ) = self._concurrent_reader.run(
+            lambda session: self._demographics_repository.get_city_aggregates(
+                session, city, country
+            ),
+            lambda session: self._spending_repository.get_city_aggregates(
+                session, city, country
+            ),
+            lambda session: self._labour_stats_repository.get_city_aggregates(
+                session, city, country
+            ),
+            lambda session: self._business_density_repository.get_summary(
+                session, city, country
+            ),
         )
 
-        # tenant_id is accepted for future RLS/tenant scoping, unused for now.
-        _ = tenant_id
-        return {
+        overview = {
             "city": city,
             "country": country,
             "demographics": demographics_summary,
@@ -86,6 +141,8 @@ class MarketService:
             "labour_stats": labour_summary,
             "business_density": business_density_summary,
         }
+        _OVERVIEW_CACHE.set(cache_key, overview)
+        return dict(overview)
 
     def get_demographics_by_region(
         self, db_session: Session, city: str, country: str | None
@@ -95,8 +152,8 @@ class MarketService:
 
         Raises 404 if no demographics exist for the city/country.
         """
-        demographics_rows = self._demographics_repository.list_by_city(
-            db_session, city, country
+        demographics_rows = self._demographics_repository.list_columns_by_city(
+            db_session, city, country, columns=_DEMOGRAPHICS_FIELDS
         )
         if not demographics_rows:
             raise HTTPException(
@@ -104,22 +161,7 @@ class MarketService:
                 detail="Demographics not found for city",
             )
 
-        return [
-            {
-                "geo_id": row.geo_id,
-                "country": row.country,
-                "city": row.city,
-                "population_total": row.population_total,
-                "median_income": self._numeric_to_float(row.median_income),
-                "age_distribution": row.age_distribution,
-                "education_levels": row.education_levels,
-                "household_size_avg": self._numeric_to_float(row.household_size_avg),
-                "immigration_ratio": self._numeric_to_float(row.immigration_ratio),
-                "coordinates": row.coordinates,
-                "last_updated": row.last_updated,
-            }
-            for row in demographics_rows
-        ]
+        return [dict(row._mapping) for row in demographics_rows]
 
     def get_business_density(
         self,
@@ -133,8 +175,8 @@ class MarketService:
 
         Raises 404 if no density rows exist for the query.
         """
-        density_rows = self._business_density_repository.list_by_city_and_type(
-            db_session, city, country, business_type
+        density_rows = self._business_density_repository.list_columns_by_city_and_type(
+            db_session, city, country, business_type, columns=_BUSINESS_DENSITY_FIELDS
         )
         if not density_rows:
             raise HTTPException(
@@ -142,19 +184,7 @@ class MarketService:
                 detail="Business density not found for city",
             )
 
-        return [
-            {
-                "geo_id": row.geo_id,
-                "country": row.country,
-                "city": row.city,
-                "business_type": row.business_type,
-                "count": row.count,
-                "density_score": self._numeric_to_float(row.density_score),
-                "coordinates": row.coordinates,
-                "last_updated": row.last_updated,
-            }
-            for row in density_rows
-        ]
+        return [dict(row._mapping) for row in density_rows]
 
     def get_spending_by_region(
         self, db_session: Session, city: str, country: str | None, category: str | None
@@ -164,11 +194,9 @@ class MarketService:
 
         Raises 404 if no spending rows exist for the query.
         """
-        spending_rows = self._spending_repository.get_for_regions(
-            db_session, city, country
+        spending_rows = self._spending_repository.list_columns_for_city(
+            db_session, city, country, columns=_SPENDING_FIELDS, category=category
         )
-        if category:
-            spending_rows = [row for row in spending_rows if row.category == category]
 
         if not spending_rows:
             raise HTTPException(
@@ -176,15 +204,4 @@ class MarketService:
                 detail="Spending not found for city",
             )
 
-        return [
-            {
-                "geo_id": row.geo_id,
-                "country": row.country,
-                "city": row.city,
-                "category": row.category,
-                "avg_monthly_spend": self._numeric_to_float(row.avg_monthly_spend),
-                "spend_index": self._numeric_to_float(row.spend_index),
-                "last_updated": row.last_updated,
-            }
-            for row in spending_rows
-        ]
+        return [dict(row._mapping) for row in spending_rows]
@@ -0,0 +1,51 @@
+"""Process-wide OpenAI client construction.
+
+Building an `OpenAI` client per service instance means a fresh HTTP connection
+pool (and TLS handshakes) for every request-scoped service. This module hands
+out one pooled client per configuration so connections are reused across
+requests.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+import httpx
+
+try:
+    from openai import OpenAI as OPENAI_CLIENT_CLASS  # type: ignore[import-untyped]
+except ModuleNotFoundError:  # pragma: no cover
+    OPENAI_CLIENT_CLASS = None  # type: ignore[assignment,misc]
+
+
+@lru_cache(maxsize=8)
+def get_shared_openai_client(
+    api_key: str,
+    timeout_s: float,
+    max_connections: int,
+    max_keepalive_connections: int,
+) -> Any | None:
+    """
+    Return a cached OpenAI client backed by a keep-alive connection pool.
+
+    Clients are cached per argument tuple, so callers sharing the same settings
+    share the same underlying `httpx.Client`.
+
+    Returns:
+        An `OpenAI` client, or None if the SDK is not installed.
+    """
+    if OPENAI_CLIENT_CLASS is None:
+        return None
+
+    http_client = httpx.Client(
+        timeout=timeout_s,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    )
+    return OPENAI_CLIENT_CLASS(
+        api_key=api_key,
+        timeout=timeout_s,
+        max_retries=1,
+        http_client=http_client,
+    )
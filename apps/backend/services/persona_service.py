@@ -1,8 +1,7 @@
 """Persona generation service."""
 
 import logging
-from decimal import Decimal
-from typing import Any, cast
+from operator import attrgetter
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -10,6 +9,31 @@ from sqlalchemy.orm import Session
 
 from services.dependencies import PersonaServiceDependencies
 
+# Payload fields per dataset, built per row with `dict(zip(FIELDS, values(row)))`.
+_DEMOGRAPHICS_FIELDS = (
+    "geo_id",
+    "population_total",
+    "median_income",
+    "age_distribution",
+)
+_demographics_values = attrgetter(*_DEMOGRAPHICS_FIELDS)
+
+_SPENDING_FIELDS = (
+    "geo_id",
+    "category",
+    "avg_monthly_spend",
+    "spend_index",
+)
+_spending_values = attrgetter(*_SPENDING_FIELDS)
+
+_LABOUR_FIELDS = (
+    "geo_id",
+    "unemployment_rate",
+    "median_salary",
+    "job_openings",
+)
+_labour_values = attrgetter(*_LABOUR_FIELDS)
+
 
 class PersonaService:
     """Generates customer personas from demographics and AI-engine."""
@@ -22,12 +46,7 @@ class PersonaService:
         self._spending_repository = dependencies.spending_repository
         self._labour_stats_repository = dependencies.labour_stats_repository
         self._ai_engine_client = dependencies.ai_engine_client
-
-    @staticmethod
-    def _numeric_to_float(value: Any | None) -> float | None:
-        if value is None:
-            return None
-        return float(cast(Decimal, value))
+        self._concurrent_reader = dependencies.concurrent_reader
 
     def generate_personas(
         self,
@@ -60,14 +79,21 @@ class PersonaService:
             },
         )
 
-        demographics_rows = self._demographics_repository.get_for_regions(
-            db_session, city, country
-        )
-        spending_rows = self._spending_repository.get_for_regions(
-            db_session, city, country
-        )
-        labour_rows = self._labour_stats_repository.get_for_regions(
-            db_session, city, country
+        # The reads run on the reader's own sessions, so `db_session` keeps no
+        # connection checked out while they wait on the pool.
+        _ = db_session
+        # Deduplicated once (order kept) and shared by all three `IN` filters.
+        region_filter = tuple(dict.fromkeys(geo_ids)) if geo_ids else None
+        demographics_rows, spending_rows, labour_rows = self._concurrent_reader.run(
+            lambda session: self._demographics_repository.get_for_regions(
+                session, city, country, geo_ids=region_filter
+            ),
+            lambda session: self._spending_repository.get_for_regions(
+                session, city, country, geo_ids=region_filter
+            ),
+            lambda session: self._labour_stats_repository.get_for_regions(
+                session, city, country, geo_ids=region_filter
+            ),
         )
 
         if not demographics_rows and not spending_rows and not labour_rows:
@@ -80,39 +106,17 @@ class PersonaService:
                 detail="No market data found for city",
             )
 
-        region_filter = set(geo_ids) if geo_ids else None
-
         demographics_payload = [
-            {
-                "geo_id": row.geo_id,
-                "population_total": row.population_total,
-                "median_income": self._numeric_to_float(row.median_income),
-                "age_distribution": row.age_distribution,
-            }
+            dict(zip(_DEMOGRAPHICS_FIELDS, _demographics_values(row)))
             for row in demographics_rows
-            if region_filter is None or row.geo_id in region_filter
         ]
 
         spending_payload = [
-            {
-                "geo_id": row.geo_id,
-                "category": row.category,
-                "avg_monthly_spend": self._numeric_to_float(row.avg_monthly_spend),
-                "spend_index": self._numeric_to_float(row.spend_index),
-            }
-            for row in spending_rows
-            if region_filter is None or row.geo_id in region_filter
+            dict(zip(_SPENDING_FIELDS, _spending_values(row))) for row in spending_rows
         ]
 
         labour_payload = [
-            {
-                "geo_id": row.geo_id,
-                "unemployment_rate": self._numeric_to_float(row.unemployment_rate),
-                "median_salary": self._numeric_to_float(row.median_salary),
-                "job_openings": row.job_openings,
-            }
-            for row in labour_rows
-            if region_filter is None or row.geo_id in region_filter
+            dict(zip(_LABOUR_FIELDS, _labour_values(row))) for row in labour_rows
         ]
 
         input_payload = {
@@ -7,23 +7,39 @@ a safe no-op (useful for local/dev and unit tests).
 from __future__ import annotations
 
 import importlib
-import json
 import logging
 import os
+import threading
+from functools import lru_cache, partial
 from typing import Any
 
+import orjson
+
 from api.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
+# Client-side batching for the publisher: flush after 100 messages, 1 MiB or
+# 50 ms, whichever comes first, so bursts of jobs share publish RPCs.
+_BATCH_MAX_MESSAGES = 100
+_BATCH_MAX_BYTES = 1 << 20
+_BATCH_MAX_LATENCY_S = 0.05
+
+# One `PublisherClient` per process: each owns a gRPC channel, a batching thread
+# and credential refresh, so it is built once and shared by all `PubSubClient`s.
+_shared_publisher: Any | None = None
+_shared_publisher_lock = threading.Lock()
+
 
+@lru_cache(maxsize=1)
 def _try_import_pubsub() -> Any | None:
     """
-    Import the GCP Pub/Sub SDK lazily.
+    Import the GCP Pub/Sub SDK lazily, once per process.
 
     We avoid importing at module import time because some environments (sandboxed
     runners, minimal containers) restrict filesystem operations performed by the
-    SDK import machinery. When import fails, we degrade safely to a no-op.
+    SDK import machinery. When import fails, we degrade safely to a no-op; the
+    outcome is memoized so a missing SDK is only logged once.
     """
     try:
         return importlib.import_module("google.cloud.pubsub_v1")
@@ -35,6 +51,35 @@ def _try_import_pubsub() -> Any | None:
         return None
 
 
+def _get_shared_publisher(pubsub_v1: Any) -> Any:
+    """Return the process-wide `PublisherClient`, creating it on first use."""
+    global _shared_publisher
+    if _shared_publisher is None:
+        with _shared_publisher_lock:
+            if _shared_publisher is None:
+                _shared_publisher = pubsub_v1.PublisherClient(
+                    batch_settings=pubsub_v1.types.BatchSettings(
+                        max_messages=_BATCH_MAX_MESSAGES,
+                        max_bytes=_BATCH_MAX_BYTES,
+                        max_latency=_BATCH_MAX_LATENCY_S,
+                    )
+                )
+    return _shared_publisher
+
+
+def _log_publish_outcome(
+    future: Any, *, topic: str, kind: str, topic_path: str
+) -> None:
+    """Done-callback for a publish future: log messages the broker rejected."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error(
+            "Pub/Sub publish was not acknowledged",
+            exc_info=exc,
+            extra={"topic": topic, "kind": kind, "topic_path": topic_path},
+        )
+
+
 class PubSubClient:
     """Publish messages to background worker topics."""
 
@@ -45,18 +90,56 @@ class PubSubClient:
         publisher_client: Any | None = None,
     ) -> None:
         self._settings = settings or get_settings()
+        # Injected publishers (tests) take precedence over the shared one.
         self._publisher_client = publisher_client
+        # Fully-qualified topic paths by topic name, built on first publish.
+        self._topic_paths: dict[str, str] = {}
 
-    def publish_report_job(self, topic: str, message: dict[str, Any]) -> None:
-        self._publish(topic=topic, message=message, kind="report_job")
+    def publish_report_job(
+        self,
+        topic: str,
+        message: dict[str, Any],
+        raw_message: bytes | None = None,
+    ) -> None:
+        self._publish(
+            topic=topic, message=message, kind="report_job", raw_message=raw_message
+        )
 
-    def publish_ingestion_job(self, topic: str, message: dict[str, Any]) -> None:
-        self._publish(topic=topic, message=message, kind="ingestion_job")
+    def publish_ingestion_job(
+        self,
+        topic: str,
+        message: dict[str, Any],
+        raw_message: bytes | None = None,
+    ) -> None:
+        self._publish(
+            topic=topic, message=message, kind="ingestion_job", raw_message=raw_message
+        )
+
+    def publish_embedding_job(
+        self,
+        topic: str,
+        message: dict[str, Any],
+        raw_message: bytes | None = None,
+    ) -> None:
+        self._publish(
+            topic=topic, message=message, kind="embedding_job", raw_message=raw_message
+        )
 
-    def publish_embedding_job(self, topic: str, message: dict[str, Any]) -> None:
-        self._publish(topic=topic, message=message, kind="embedding_job")
+    def _publish(
+        self,
+        *,
+        topic: str,
+        message: dict[str, Any],
+        kind: str,
+        raw_message: bytes | None = None,
+    ) -> None:
+        """
+        Publish `message` to `topic`.
 
-    def _publish(self, *, topic: str, message: dict[str, Any], kind: str) -> None:
+        `raw_message`, when given, must be `message` already encoded as UTF-8
+        JSON; it is sent as-is so callers that serialize the payload anyway do
+        not pay for a second encoding.
+        """
         if not self._settings.pubsub_enabled:
             logger.info(
                 "Pub/Sub disabled; skipping publish",
@@ -80,12 +163,27 @@ class PubSubClient:
             )
             return
 
-        publisher = self._publisher_client or pubsub_v1.PublisherClient()
-        topic_path = publisher.topic_path(project_id, topic)
-        data = json.dumps(message, default=str).encode("utf-8")
+        publisher = self._publisher_client or _get_shared_publisher(pubsub_v1)
+        topic_path = self._topic_paths.get(topic)
+        if topic_path is None:
+            topic_path = publisher.topic_path(project_id, topic)
+            self._topic_paths[topic] = topic_path
+        data = (
+            raw_message
+            if raw_message is not None
+            else orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
+        )
 
         try:
-            publisher.publish(topic_path, data=data)
+            future = publisher.publish(topic_path, data=data)
+            # The broker ack resolves `future` on the publisher's batching
+            # thread; failures are reported from there instead of blocking the
+            # caller on `future.result()`.
+            future.add_done_callback(
+                partial(
+                    _log_publish_outcome, topic=topic, kind=kind, topic_path=topic_path
+                )
+            )
             logger.info(
                 "Published Pub/Sub message",
                 extra={"topic": topic, "kind": kind, "topic_path": topic_path},
@@ -4,7 +4,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from sqlalchemy.orm import Session
 
 from api.schemas.reports import FeasibilityReportRequest
@@ -28,69 +28,107 @@ class ReportService:
         request: FeasibilityReportRequest,
         tenant_id: UUID,
         user_id: UUID,
+        background_tasks: BackgroundTasks | None = None,
     ) -> dict[str, Any]:
         """
         Create a new feasibility `ReportJob` and publish a processing message.
 
-        This enforces report quota through `BillingService` before enqueueing.
+        The tenant's report quota (from `BillingService`) is enforced by the
+        job insert itself. The job row is committed before the message is
+        published so workers never receive an id they cannot load. Publishing
+        does not wait on the broker: the shared Pub/Sub publisher batches
+        messages in the background.
 
         Args:
             request: Validated request payload from `/reports/feasibility`.
             tenant_id: Tenant owning the job.
             user_id: User who triggered job; included in queue message.
+            background_tasks: When given, the publish is deferred until after
+                the HTTP response has been sent instead of running inline.
         """
         logger = logging.getLogger(__name__)
+        # Stringified once; reused by the log records and the queue message.
+        tenant_id_str, user_id_str = str(tenant_id), str(user_id)
         logger.info(
             "Creating feasibility report job",
             extra={
-                "tenant_id": str(tenant_id),
-                "user_id": str(user_id),
+                "tenant_id": tenant_id_str,
+                "user_id": user_id_str,
                 "city": request.city,
                 "country": request.country,
                 "business_type": request.business_type,
             },
         )
 
-        quota_ok = self._billing_service.check_report_quota(db_session, tenant_id)
-        if not quota_ok:
-            logger.warning(
-                "Report quota exceeded",
-                extra={"tenant_id": str(tenant_id), "user_id": str(user_id)},
+        quota = self._billing_service.get_report_quota(db_session, tenant_id)
+        if quota is None:
+            job = self._report_jobs_repository.create_pending_job(
+                db_session,
+                tenant_id=tenant_id,
+                city=request.city,
+                country=request.country,
+                business_type=request.business_type,
             )
-            raise HTTPException(
-                status_code=status.HTTP_402_PAYMENT_REQUIRED,
-                detail="Report quota exceeded",
+            # Read before commit, which would expire the ORM row's attributes.
+            job_id, job_status = str(job.id), job.status
+        else:
+            # The usage count and the insert run as one statement.
+            report_limit, period_start = quota
+            queued = self._report_jobs_repository.create_pending_job_within_quota(
+                db_session,
+                tenant_id=tenant_id,
+                city=request.city,
+                country=request.country,
+                business_type=request.business_type,
+                report_limit=report_limit,
+                since=period_start,
             )
+            if queued is None:
+                logger.warning(
+                    "Report quota exceeded",
+                    extra={"tenant_id": tenant_id_str, "user_id": user_id_str},
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_402_PAYMENT_REQUIRED,
+                    detail="Report quota exceeded",
+                )
+            job_id, job_status = str(queued.id), queued.status
+        db_session.commit()
 
-        job = self._report_jobs_repository.create_pending_job(
-            db_session,
-            tenant_id=tenant_id,
-            city=request.city,
-            country=request.country,
-            business_type=request.business_type,
-        )
-
-        self._pubsub_client.publish_report_job(
-            topic="report-jobs",
-            message={
-                "report_job_id": str(job.id),
-                "tenant_id": str(tenant_id),
-                "user_id": str(user_id),
-                "city": request.city,
-                "country": request.country,
-                "business_type": request.business_type,
-            },
-        )
+        message = {
+            "report_job_id": job_id,
+            "tenant_id": tenant_id_str,
+            "user_id": user_id_str,
+            "city": request.city,
+            "country": request.country,
+            "business_type": request.business_type,
+        }
+        if background_tasks is not None:
+            background_tasks.add_task(
+                self._pubsub_client.publish_report_job,
+                topic="report-jobs",
+                message=message,
+            )
+        else:
+            self._pubsub_client.publish_report_job(topic="report-jobs", message=message)
 
         logger.info(
             "Report job queued",
-            extra={"report_job_id": str(job.id), "tenant_id": str(tenant_id)},
+            extra={"report_job_id": job_id, "tenant_id": tenant_id_str},
         )
-        return {"job_id": str(job.id), "status": job.status}
+        return {"job_id": job_id, "status": job_status}
 
-    def list_reports(self, db_session: Session, tenant_id: UUID) -> list[Any]:
-        """List all report jobs for a tenant, newest-first."""
-        jobs = self._report_jobs_repository.list_by_tenant(db_session, tenant_id)
+    def list_reports(
+        self,
+        db_session: Session,
+        tenant_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[Any]:
+        """List one page of report jobs for a tenant, newest-first."""
+        jobs = self._report_jobs_repository.list_by_tenant(
+            db_session, tenant_id, limit=limit, offset=offset
+        )
         return jobs
 
     def get_report(self, db_session: Session, report_id: UUID, tenant_id: UUID) -> Any:
@@ -0,0 +1,57 @@
+"""In-process request coalescing ("singleflight").
+
+Concurrent callers asking for the same key share one execution of the
+underlying call: the first caller runs it, later callers block on its result.
+Routes here are sync and run in the threadpool, so waiters block on a
+`concurrent.futures.Future` rather than awaiting an asyncio one.
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+
+class SingleFlight(Generic[ValueT]):
+    """Thread-safe coalescing of concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, Future[ValueT]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], ValueT]) -> ValueT:
+        """
+        Return `fn()`, sharing one in-flight execution per `key`.
+
+        The result (or exception) of the leading call is handed to every caller
+        that arrived while it was running. Nothing is cached: once the call
+        completes, the next caller for `key` runs `fn` again.
+        """
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                future: Future[ValueT] = Future()
+                self._in_flight[key] = future
+
+        if in_flight is not None:
+            return in_flight.result()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._finish(key)
+            future.set_exception(exc)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._in_flight)
@@ -3,8 +3,18 @@
 TODO: Replace with real Stripe SDK integration.
 """
 
+from types import MappingProxyType
 from typing import Any
 
+# Read-only fields shared by every stub checkout session; each call splats them
+# into a fresh payload and only fills the tenant/plan fields.
+_CHECKOUT_SESSION_TEMPLATE = MappingProxyType(
+    {
+        "checkout_session_id": "cs_test_123",
+        "url": "https://checkout.stripe.local/session/cs_test_123",
+    }
+)
+
 
 class StripeClient:
     """Client wrapper for Stripe billing flows (stubbed for local dev)."""
@@ -14,8 +24,7 @@ class StripeClient:
     ) -> dict[str, Any]:
         """Create a checkout-session payload for a tenant plan change."""
         return {
-            "checkout_session_id": "cs_test_123",
-            "url": "https://checkout.stripe.local/session/cs_test_123",
+            **_CHECKOUT_SESSION_TEMPLATE,
             "tenant_id": tenant_id,
             "target_plan": target_plan,
         }
@@ -7,6 +7,11 @@ from sqlalchemy.orm import Session
 
 from api.schemas.core import TenantRead
 from services.dependencies import TenantServiceDependencies
+from services.ttl_cache import TTLCache
+
+# Tenant snapshots by id. Tenants change rarely, so a short TTL bounds staleness
+# while sparing a primary-key lookup on every `/tenants/current` request.
+_TENANT_CACHE: TTLCache[TenantRead] = TTLCache(maxsize=10_000, ttl_s=30)
 
 
 class TenantService:
@@ -15,12 +20,26 @@ class TenantService:
     def __init__(self, dependencies: TenantServiceDependencies) -> None:
         self._tenant_repository = dependencies.tenant_repository
 
+    @staticmethod
+    def invalidate_tenant_cache(tenant_id: UUID | None = None) -> None:
+        """Drop the cached snapshot for `tenant_id` (all tenants when None)."""
+        if tenant_id is None:
+            _TENANT_CACHE.clear()
+        else:
+            _TENANT_CACHE.delete(tenant_id)
+
     def get_current_tenant(self, db_session: Session, tenant_id: UUID) -> TenantRead:
         """
         Return the current tenant for the authenticated request context.
 
-        Raises 404 if the tenant is missing.
+        Snapshots are cached per tenant for a short TTL; call
+        `invalidate_tenant_cache` after mutating a tenant. Raises 404 if the
+        tenant is missing (misses are not cached).
         """
+        cached = _TENANT_CACHE.get(tenant_id)
+        if cached is not None:
+            return cached
+
         tenant = self._tenant_repository.get_by_id(db_session, tenant_id)
         if tenant is None:
             raise HTTPException(
@@ -28,4 +47,14 @@ class TenantService:
                 detail="Tenant not found",
             )
 
-        return TenantRead.model_validate(tenant)
+        # The ORM row is authoritative (typed columns), so the snapshot is built
+        # without re-running validation over it.
+        tenant_read = TenantRead.model_construct(
+            id=tenant.id,
+            name=tenant.name,
+            plan=tenant.plan,
+            created_at=tenant.created_at,
+            updated_at=tenant.updated_at,
+        )
+        _TENANT_CACHE.set(tenant_id, tenant_read)
+        return tenant_read
@@ -0,0 +1,71 @@
+"""Small in-process TTL + LRU cache.
+
+Used by services to memoize expensive, slow-changing results (LLM responses,
+reference lookups) within a worker process. Entries expire after `ttl_s`
+seconds and the least recently used entry is evicted once `maxsize` is reached.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+ValueT = TypeVar("ValueT")
+
+
+class TTLCache(Generic[ValueT]):
+    """Thread-safe bounded cache with per-entry expiry."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            maxsize: Maximum number of live entries kept.
+            ttl_s: Seconds an entry stays valid after it is stored.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, ValueT]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> ValueT | None:
+        """Return the cached value for `key`, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: ValueT) -> None:
+        """Store `value` under `key`, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_s, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove `key` if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
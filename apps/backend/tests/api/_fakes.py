@@ -0,0 +1,191 @@
+"""Reusable service fakes for API endpoint tests.
+
+Each fake serves canned results passed to its constructor and records the
+arguments of every call in `calls` as `(method_name, kwargs)` tuples, so tests
+assert on the inputs a route forwarded after the request completes.
+"""
+
+from collections.abc import Callable
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+EMPTY_PAGE: dict[str, Any] = {"items": [], "total": 0, "next_cursor": None}
+
+
+class FakeAdminService:
+    """Admin service fake serving canned pages, datasets and dashboard data."""
+
+    def __init__(
+        self,
+        *,
+        users_page: dict[str, Any] = EMPTY_PAGE,
+        tenants_page: dict[str, Any] = EMPTY_PAGE,
+        report_jobs_page: dict[str, Any] = EMPTY_PAGE,
+        datasets: list[Any] | None = None,
+        dashboard: dict[str, Any] | None = None,
+    ) -> None:
+        self._users_page = users_page
+        self._tenants_page = tenants_page
+        self._report_jobs_page = report_jobs_page
+        self._datasets = datasets or []
+        self._dashboard = dashboard
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def list_users(
+        self, _db_session, email, role, tenant_id, limit, offset, cursor=None
+    ) -> dict[str, Any]:
+        """Record the filters and return the canned users page."""
+        self.calls.append(
+            (
+                "list_users",
+                {
+                    "email": email,
+                    "role": role,
+                    "tenant_id": tenant_id,
+                    "limit": limit,
+                    "offset": offset,
+                    "cursor": cursor,
+                },
+            )
+        )
+        return self._users_page
+
+    def list_tenants(
+        self, _db_session, name, plan, limit, offset, cursor=None
+    ) -> dict[str, Any]:
+        """Record the filters and return the canned tenants page."""
+        self.calls.append(
+            (
+                "list_tenants",
+                {
+                    "name": name,
+                    "plan": plan,
+                    "limit": limit,
+                    "offset": offset,
+                    "cursor": cursor,
+                },
+            )
+        )
+        return self._tenants_page
+
+    def list_report_jobs(
+        self,
+        _db_session,
+        tenant_id,
+        status,
+        city,
+        country,
+        business_type,
+        limit,
+        offset,
+        cursor=None,
+    ) -> dict[str, Any]:
+        """Record the filters and return the canned report jobs page."""
+        self.calls.append(
+            (
+                "list_report_jobs",
+                {
+                    "tenant_id": tenant_id,
+                    "status": status,
+                    "city": city,
+                    "country": country,
+                    "business_type": business_type,
+                    "limit": limit,
+                    "offset": offset,
+                    "cursor": cursor,
+                },
+            )
+        )
+        return self._report_jobs_page
+
+    def list_dataset_freshness(self, _db_session) -> list[Any]:
+        """Return the canned dataset freshness rows."""
+        self.calls.append(("list_dataset_freshness", {}))
+        return self._datasets
+
+    def get_dashboard(self, _db_session) -> dict[str, Any] | None:
+        """Return the canned dashboard data."""
+        self.calls.append(("get_dashboard", {}))
+        return self._dashboard
+
+
+class FakeEtlService:
+    """ETL orchestration fake that queues a deferred publish of the dataset."""
+
+    def __init__(self, publish: Callable[[str], Any] | None = None) -> None:
+        self.published: list[str] = []
+        self._publish = publish or self.published.append
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def trigger_adhoc_etl(
+        self,
+        db_session,
+        dataset,
+        country,
+        city,
+        options,
+        triggered_by_user_id,
+        triggered_by_tenant_id,
+        background_tasks,
+    ) -> dict[str, Any]:
+        """Record the inputs, defer the publish and return a queued response."""
+        _ = db_session
+        self.calls.append(
+            (
+                "trigger_adhoc_etl",
+                {
+                    "dataset": dataset,
+                    "country": country,
+                    "city": city,
+                    "options": options,
+                    "triggered_by_user_id": triggered_by_user_id,
+                    "triggered_by_tenant_id": triggered_by_tenant_id,
+                },
+            )
+        )
+        background_tasks.add_task(self._publish, dataset)
+        payload = {"dataset": dataset, "country": country, "city": city}
+        payload["options"] = options
+        return {
+            "status": "QUEUED",
+            "payload": payload,
+            "payload_json": orjson.dumps(payload),
+        }
+
+
+class FakeAuthService:
+    """Auth service fake returning a canned profile or raising `error`."""
+
+    def __init__(
+        self,
+        profile: dict[str, Any] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self._profile = profile
+        self._error = error
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def get_current_user_profile(self, _db_session, user_id: UUID) -> Any:
+        """Record the user id and return the canned profile."""
+        self.calls.append(("get_current_user_profile", {"user_id": user_id}))
+        if self._error is not None:
+            raise self._error
+        return self._profile
+
+
+class FakeTenantService:
+    """Tenant service fake returning a canned tenant or raising `error`."""
+
+    def __init__(self, tenant: Any = None, error: Exception | None = None) -> None:
+        self._tenant = tenant
+        self._error = error
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def get_current_tenant(self, _db_session, tenant_id: UUID) -> Any:
+        """Record the tenant id and return the canned tenant."""
+        self.calls.append(("get_current_tenant", {"tenant_id": tenant_id}))
+        if self._error is not None:
+            raise self._error
+        return self._tenant
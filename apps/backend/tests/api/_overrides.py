@@ -0,0 +1,18 @@
+"""Dependency-override helpers shared by API endpoint tests."""
+
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import FastAPI
+
+
+class DummySession:
+    """Stub SQLAlchemy session."""
+
+
+DUMMY_SESSION = DummySession()
+
+
+def use_fake(app: FastAPI, dependency: Callable[..., Any], instance: Any) -> None:
+    """Override `dependency` on `app` so every request resolves to `instance`."""
+    app.dependency_overrides[dependency] = lambda: instance
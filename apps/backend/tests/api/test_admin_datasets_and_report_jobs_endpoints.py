@@ -4,113 +4,65 @@ from datetime import datetime, timezone
 from uuid import uuid4
 
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
-from api.main import create_app
 from api.routers import admin as admin_router
 from api.schemas.admin import DataFreshnessRead
 from api.schemas.reports import ReportJobRead
+from repositories.pagination import decode_cursor
+from tests.api._fakes import FakeAdminService
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
-
-
-def test_admin_list_datasets_success():
+def test_admin_list_datasets_success(app, client):
     """`GET /admin/datasets` returns datasets for admin role."""
-    app = create_app()
     expected_tenant_id = uuid4()
 
-    class FakeAdminService:
-        """Fake admin service returning canned datasets."""
-
-        def list_dataset_freshness(self, _db_session):
-            """Return canned freshness list."""
-            return [
-                DataFreshnessRead(
-                    id=uuid4(),
-                    dataset_name="demographics",
-                    last_run=datetime(2025, 1, 1, tzinfo=timezone.utc),
-                    row_count=123,
-                    status="OK",
-                )
-            ]
-
-        def list_report_jobs(
-            self,
-            _db_session,
-            _tenant_id,
-            _status,
-            _city,
-            _country,
-            _business_type,
-            _limit,
-            _offset,
-        ):
-            """Return empty list."""
-            return []
-
     def override_context():
         return CurrentRequestContext(
             user_id=uuid4(), tenant_id=expected_tenant_id, role="ADMIN"
         )
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_admin_service():
-        """Provide the fake admin service."""
-        return FakeAdminService()
-
-    app.dependency_overrides[admin_router.get_admin_service] = override_admin_service
-
-    from fastapi.testclient import TestClient
+    admin_service = FakeAdminService(
+        datasets=[
+            DataFreshnessRead(
+                id=uuid4(),
+                dataset_name="demographics",
+                last_run=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                row_count=123,
+                status="OK",
+            )
+        ]
+    )
+    use_fake(app, admin_router.get_admin_service, admin_service)
 
-    client = TestClient(app)
     response = client.get("/admin/datasets")
 
     assert response.status_code == 200
     body = response.json()
     assert len(body["datasets"]) == 1
     assert body["datasets"][0]["dataset_name"] == "demographics"
+    assert admin_service.calls == [("list_dataset_freshness", {})]
 
 
-def test_admin_list_report_jobs_success_and_filters_passed():
+def test_admin_list_report_jobs_success_and_filters_passed(app, client):
     """`GET /admin/jobs/reports` forwards filters and returns jobs."""
-    app = create_app()
     expected_tenant_id = uuid4()
     requested_tenant_id = uuid4()
+    next_cursor = (datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4())
+
+    def override_context():
+        return CurrentRequestContext(
+            user_id=uuid4(), tenant_id=expected_tenant_id, role="ADMIN"
+        )
+
+    use_fake(app, get_db, DUMMY_SESSION)
+    app.dependency_overrides[get_current_request_context] = override_context
 
-    class FakeAdminService:
-        """Fake admin service returning canned jobs."""
-
-        def list_dataset_freshness(self, _db_session):
-            """Return empty list."""
-            return []
-
-        def list_report_jobs(
-            self,
-            _db_session,
-            tenant_id,
-            status,
-            city,
-            country,
-            business_type,
-            limit,
-            offset,
-        ):
-            """Return canned report jobs after asserting filters."""
-            assert tenant_id == requested_tenant_id
-            assert status == "COMPLETED"
-            assert city == "Accra"
-            assert country is None
-            assert business_type == "restaurant"
-            assert limit == 2
-            assert offset == 1
-            return [
+    admin_service = FakeAdminService(
+        report_jobs_page={
+            "items": [
                 ReportJobRead(
                     id=uuid4(),
                     city="Accra",
@@ -122,25 +74,13 @@ def test_admin_list_report_jobs_success_and_filters_passed():
                     created_at=None,
                     updated_at=None,
                 )
-            ]
-
-    def override_context():
-        return CurrentRequestContext(
-            user_id=uuid4(), tenant_id=expected_tenant_id, role="ADMIN"
-        )
-
-    app.dependency_overrides[get_db] = override_db
-    app.dependency_overrides[get_current_request_context] = override_context
-
-    def override_admin_service():
-        """Provide the fake admin service."""
-        return FakeAdminService()
-
-    app.dependency_overrides[admin_router.get_admin_service] = override_admin_service
-
-    from fastapi.testclient import TestClient
+            ],
+            "total": 2,
+            "next_cursor": next_cursor,
+        }
+    )
+    use_fake(app, admin_router.get_admin_service, admin_service)
 
-    client = TestClient(app)
     response = client.get(
         "/admin/jobs/reports",
         params={
@@ -157,51 +97,94 @@ def test_admin_list_report_jobs_success_and_filters_passed():
     body = response.json()
     assert len(body["report_jobs"]) == 1
     assert body["report_jobs"][0]["status"] == "COMPLETED"
+    assert body["total"] == 2
+    assert decode_cursor(body["next_cursor"]) == next_cursor
+    assert admin_service.calls == [
+        (
+            "list_report_jobs",
+            {
+                "tenant_id": requested_tenant_id,
+                "status": "COMPLETED",
+                "city": "Accra",
+                "country": None,
+                "business_type": "restaurant",
+                "limit": 2,
+                "offset": 1,
+                "cursor": None,
+            },
+        )
+    ]
 
 
-def test_admin_datasets_requires_admin_role():
-    """Non-admin role is forbidden from listing datasets."""
-    app = create_app()
-    expected_tenant_id = uuid4()
-
-    class FakeAdminService:
-        """Fake admin service (unused)."""
-
-        def list_dataset_freshness(self, _db_session):
-            """Return empty list."""
-            return []
-
-        def list_report_jobs(
-            self,
-            _db_session,
-            _tenant_id,
-            _status,
-            _city,
-            _country,
-            _business_type,
-            _limit,
-            _offset,
-        ):
-            """Return empty list."""
-            return []
+def test_admin_datasets_requires_admin_role(app, client):
+    """Non-admins get 403 before a DB session or admin service is built."""
+    resolved = []
 
     def override_context():
-        return CurrentRequestContext(
-            user_id=uuid4(), tenant_id=expected_tenant_id, role="USER"
-        )
+        return CurrentRequestContext(user_id=uuid4(), tenant_id=uuid4(), role="USER")
 
-    app.dependency_overrides[get_db] = override_db
-    app.dependency_overrides[get_current_request_context] = override_context
+    def recording_db():
+        """Record that a DB session was requested."""
+        resolved.append("db")
+        yield DUMMY_SESSION
 
     def override_admin_service():
-        """Provide the fake admin service."""
-        return FakeAdminService()
+        """Record that the admin service was requested."""
+        resolved.append("admin_service")
+        return object()
 
+    app.dependency_overrides[get_db] = recording_db
+    app.dependency_overrides[get_current_request_context] = override_context
     app.dependency_overrides[admin_router.get_admin_service] = override_admin_service
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
     response = client.get("/admin/datasets")
 
     assert response.status_code == 403
+    assert resolved == []
+
+
+def test_admin_dashboard_returns_counts_and_datasets(app, client):
+    """`GET /admin/dashboard` returns entity totals and dataset freshness."""
+
+    admin_service = FakeAdminService(
+        dashboard={
+            "counts": {"users": 4, "tenants": 2, "report_jobs": 9},
+            "datasets": [
+                DataFreshnessRead(
+                    id=uuid4(),
+                    dataset_name="demographics",
+                    last_run=None,
+                    row_count=None,
+                    status="OK",
+                )
+            ],
+        }
+    )
+
+    def override_context():
+        return CurrentRequestContext(user_id=uuid4(), tenant_id=uuid4(), role="ADMIN")
+
+    use_fake(app, get_db, DUMMY_SESSION)
+    app.dependency_overrides[get_current_request_context] = override_context
+    use_fake(app, admin_router.get_admin_service, admin_service)
+
+    response = client.get("/admin/dashboard")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["counts"] == {"users": 4, "tenants": 2, "report_jobs": 9}
+    assert body["datasets"][0]["dataset_name"] == "demographics"
+
+
+def test_admin_dashboard_forbidden_for_non_admin(app, client):
+    """`GET /admin/dashboard` returns 403 for non-admin users."""
+
+    def override_context():
+        return CurrentRequestContext(user_id=uuid4(), tenant_id=uuid4(), role="USER")
+
+    use_fake(app, get_db, DUMMY_SESSION)
+    app.dependency_overrides[get_current_request_context] = override_context
+
+    response = client.get("/admin/dashboard")
+
+    assert response.status_code == 403
@@ -3,74 +3,28 @@
 from uuid import uuid4
 
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
-from api.main import create_app
 from api.routers import etl as etl_router
+from tests.api._fakes import FakeEtlService
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
-
-
-def test_admin_trigger_etl_success_and_payload_passed():
+def test_admin_trigger_etl_success_and_payload_passed(app, client):
     """`POST /admin/etl/run` publishes ETL payload for admin user."""
-    app = create_app()
     expected_tenant_id = uuid4()
     expected_user_id = uuid4()
 
-    class FakeEtlService:
-        """Fake ETL orchestration service asserting inputs."""
-
-        def trigger_adhoc_etl(
-            self,
-            db_session,
-            dataset,
-            country,
-            city,
-            options,
-            triggered_by_user_id,
-            triggered_by_tenant_id,
-        ):
-            """Return a canned queued response."""
-            _ = db_session
-            assert dataset == "demographics"
-            assert country == "GH"
-            assert city == "Accra"
-            assert options == {"force": True}
-            assert triggered_by_user_id == expected_user_id
-            assert triggered_by_tenant_id == expected_tenant_id
-            return {
-                "status": "QUEUED",
-                "payload": {
-                    "dataset": dataset,
-                    "country": country,
-                    "city": city,
-                    "options": options,
-                },
-            }
-
     def override_context():
         """Provide a fake admin request context."""
         return CurrentRequestContext(
             user_id=expected_user_id, tenant_id=expected_tenant_id, role="ADMIN"
         )
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_etl_service():
-        """Provide the fake ETL service."""
-        return FakeEtlService()
-
-    app.dependency_overrides[etl_router.get_etl_service] = override_etl_service
+    etl_service = FakeEtlService()
+    use_fake(app, etl_router.get_etl_service, etl_service)
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
     response = client.post(
         "/admin/etl/run",
         json={
@@ -85,34 +39,60 @@ def test_admin_trigger_etl_success_and_payload_passed():
     body = response.json()
     assert body["status"] == "QUEUED"
     assert body["payload"]["dataset"] == "demographics"
+    assert etl_service.calls == [
+        (
+            "trigger_adhoc_etl",
+            {
+                "dataset": "demographics",
+                "country": "GH",
+                "city": "Accra",
+                "options": {"force": True},
+                "triggered_by_user_id": expected_user_id,
+                "triggered_by_tenant_id": expected_tenant_id,
+            },
+        )
+    ]
+    assert etl_service.published == ["demographics"]
 
 
-def test_admin_trigger_etl_requires_admin_role():
+def test_admin_trigger_etl_requires_admin_role(app, client):
     """Non-admin users are forbidden from triggering ETL."""
-    app = create_app()
-
-    class FakeEtlService:
-        """Fake ETL service used only to satisfy dependency."""
-
-        def trigger_adhoc_etl(self, *_args, **_kwargs):
-            """Return a canned queued response."""
-            return {"status": "QUEUED", "payload": {}}
 
     def override_context():
         """Provide a fake non-admin request context."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=uuid4(), role="USER")
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_etl_service():
-        """Provide the fake ETL service."""
-        return FakeEtlService()
+    use_fake(app, etl_router.get_etl_service, FakeEtlService())
 
-    app.dependency_overrides[etl_router.get_etl_service] = override_etl_service
+    response = client.post("/admin/etl/run", json={"dataset": "demographics"})
+    assert response.status_code == 403
 
-    from fastapi.testclient import TestClient
 
-    client = TestClient(app)
+def test_admin_trigger_etl_releases_db_session_before_background_publish(app, client):
+    """The request DB session is closed before deferred tasks run."""
+    events = []
+
+    def recording_db():
+        """Yield a dummy session and record when it is released."""
+        yield object()
+        events.append("db closed")
+
+    def override_context():
+        """Provide a fake admin request context."""
+        return CurrentRequestContext(user_id=uuid4(), tenant_id=uuid4(), role="ADMIN")
+
+    app.dependency_overrides[get_db] = recording_db
+    app.dependency_overrides[get_current_request_context] = override_context
+    use_fake(
+        app,
+        etl_router.get_etl_service,
+        FakeEtlService(publish=lambda _dataset: events.append("published")),
+    )
+
     response = client.post("/admin/etl/run", json={"dataset": "demographics"})
-    assert response.status_code == 403
+
+    assert response.status_code == 200
+    assert events == ["db closed", "published"]
@@ -1,36 +1,23 @@
 """HTTP endpoint tests for admin user/tenant listing routes."""
 
+from datetime import datetime, timezone
 from uuid import uuid4
 
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
-from api.main import create_app
 from api.routers import admin as admin_router
 from api.schemas.core import TenantRead, UserRead
+from repositories.pagination import encode_cursor
+from tests.api._fakes import FakeAdminService
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
-
-
-def test_admin_list_users_success():
+def test_admin_list_users_success(app, client):
     """`GET /admin/users` returns users for admin role."""
-    app = create_app()
     expected_tenant_id = uuid4()
 
-    class FakeAdminService:
-        """Fake admin service asserting inputs."""
-
-        def list_users(self, _db_session, email, role, tenant_id, _limit, _offset):
-            """Return a canned users list."""
-            assert email is None
-            assert role is None
-            assert tenant_id is None
-            return [
+    admin_service = FakeAdminService(
+        users_page={
+            "items": [
                 UserRead(
                     id=uuid4(),
                     tenant_id=expected_tenant_id,
@@ -38,11 +25,11 @@ def test_admin_list_users_success():
                     name="Admin User",
                     role="ADMIN",
                 )
-            ]
-
-        def list_tenants(self, _db_session, _name, _plan, _limit, _offset):
-            """Return empty tenants list."""
-            return []
+            ],
+            "total": 3,
+            "next_cursor": None,
+        }
+    )
 
     def override_context():
         """Provide a fake admin request context."""
@@ -50,45 +37,49 @@ def test_admin_list_users_success():
             user_id=uuid4(), tenant_id=expected_tenant_id, role="ADMIN"
         )
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_admin_service():
-        """Provide the fake admin service."""
-        return FakeAdminService()
-
-    app.dependency_overrides[admin_router.get_admin_service] = override_admin_service
+    use_fake(app, admin_router.get_admin_service, admin_service)
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
     response = client.get("/admin/users")
 
     assert response.status_code == 200
     assert len(response.json()["users"]) == 1
+    assert response.json()["total"] == 3
+    assert response.json()["next_cursor"] is None
+    assert admin_service.calls == [
+        (
+            "list_users",
+            {
+                "email": None,
+                "role": None,
+                "tenant_id": None,
+                "limit": 100,
+                "offset": 0,
+                "cursor": None,
+            },
+        )
+    ]
 
 
-def test_admin_list_tenants_success():
+def test_admin_list_tenants_success(app, client):
     """`GET /admin/tenants` returns tenants for admin role."""
-    app = create_app()
     expected_tenant_id = uuid4()
 
-    class FakeAdminService:
-        """Fake admin service returning canned tenants."""
-
-        def list_users(self, _db_session, _email, _role, _tenant_id, _limit, _offset):
-            """Return empty users list."""
-            return []
-
-        def list_tenants(self, _db_session, _name, _plan, _limit, _offset):
-            """Return a canned tenants list."""
-            return [
+    admin_service = FakeAdminService(
+        tenants_page={
+            "items": [
                 TenantRead(
                     id=expected_tenant_id,
                     name="Acme",
                     plan="starter",
                 )
-            ]
+            ],
+            "total": 1,
+            "next_cursor": None,
+        }
+    )
 
     def override_context():
         """Provide a fake admin request context."""
@@ -96,32 +87,53 @@ def test_admin_list_tenants_success():
             user_id=uuid4(), tenant_id=expected_tenant_id, role="ADMIN"
         )
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_admin_service():
-        """Provide the fake admin service."""
-        return FakeAdminService()
-
-    app.dependency_overrides[admin_router.get_admin_service] = override_admin_service
-
-    from fastapi.testclient import TestClient
+    use_fake(app, admin_router.get_admin_service, admin_service)
 
-    client = TestClient(app)
     response = client.get("/admin/tenants")
 
     assert response.status_code == 200
     assert len(response.json()["tenants"]) == 1
+    assert response.json()["total"] == 1
 
 
-def test_admin_endpoints_missing_headers_returns_401():
-    """Missing auth headers yields 401 on admin routes."""
-    app = create_app()
-    app.dependency_overrides[get_db] = override_db
+def test_admin_list_users_decodes_cursor(app, client):
+    """`cursor` is decoded and forwarded; malformed cursors are rejected."""
+    expected_cursor = (datetime(2026, 1, 2, tzinfo=timezone.utc), uuid4())
+    admin_service = FakeAdminService(
+        users_page={"items": [], "total": None, "next_cursor": None}
+    )
 
-    from fastapi.testclient import TestClient
+    def override_context():
+        """Provide a fake admin request context."""
+        return CurrentRequestContext(user_id=uuid4(), tenant_id=uuid4(), role="ADMIN")
+
+    use_fake(app, get_db, DUMMY_SESSION)
+    app.dependency_overrides[get_current_request_context] = override_context
+    use_fake(app, admin_router.get_admin_service, admin_service)
+
+    response = client.get(
+        "/admin/users", params={"cursor": encode_cursor(expected_cursor)}
+    )
+    invalid_response = client.get("/admin/users", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 200
+    assert response.json()["total"] is None
+    assert [kwargs["cursor"] for _, kwargs in admin_service.calls] == [expected_cursor]
+    assert invalid_response.status_code == 400
+
+
+def test_admin_endpoints_missing_headers_returns_401(app, client):
+    """Missing auth headers yields 401 on admin routes."""
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    client = TestClient(app)
     response = client.get("/admin/users")
 
     assert response.status_code == 401
+
+
+def test_get_admin_service_returns_shared_instance():
+    """The stateless admin service is built once and reused across requests."""
+    assert admin_router.get_admin_service() is admin_router.get_admin_service()
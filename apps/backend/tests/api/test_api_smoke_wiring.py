@@ -2,18 +2,12 @@
 
 from uuid import uuid4
 
+from fastapi.testclient import TestClient
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
 from api.main import create_app
 from api.routers import markets as markets_router
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_health_and_markets_cities_smoke():
@@ -32,18 +26,10 @@ def test_health_and_markets_cities_smoke():
         """Provide a fake request context."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=uuid4(), role="USER")
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_market_service():
-        """Provide the fake market service."""
-        return FakeMarketService()
-
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, markets_router.get_market_service, FakeMarketService())
 
     client = TestClient(app)
     health = client.get("/health")
@@ -52,3 +38,11 @@ def test_health_and_markets_cities_smoke():
     cities = client.get("/markets/cities?country=CA")
     assert cities.status_code == 200
     assert cities.json()["cities"] == ["Toronto"]
+
+
+def test_create_app_is_memoized():
+    """Repeated factory calls reuse one app; overrides do not outlive a test."""
+    app = create_app()
+
+    assert create_app() is app
+    assert app.dependency_overrides == {}
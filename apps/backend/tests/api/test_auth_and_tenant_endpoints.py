@@ -1,39 +1,16 @@
 """HTTP endpoint tests for `/me` and `/tenants/current` routes."""
 
 from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from uuid import uuid4
 
-import pytest
 from fastapi import HTTPException, status
 
 from api.dependencies import get_current_request_context, get_db
-from api.main import create_app
 from api.routers import me as me_router
 from api.routers import tenants as tenants_router
 from api.schemas.core import TenantRead, UserRead
-
-
-@pytest.fixture()
-def app():
-    """Create a FastAPI app for HTTP tests."""
-    return create_app()
-
-
-@pytest.fixture()
-def client(app):
-    """Create a `TestClient` bound to the FastAPI app."""
-    from fastapi.testclient import TestClient
-
-    return TestClient(app)
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._fakes import FakeAuthService, FakeTenantService
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_get_me_success(app, client):
@@ -42,29 +19,25 @@ def test_get_me_success(app, client):
     tenant_id = uuid4()
     now = datetime.now(timezone.utc)
 
-    class FakeAuthService:
-        """Fake auth service returning canned user profile."""
-
-        def get_current_user_profile(self, _db_session, requested_user_id: UUID):
-            """Return deterministic profile payload."""
-            assert requested_user_id == user_id
-            return {
-                "user": UserRead(
-                    id=user_id,
-                    tenant_id=tenant_id,
-                    email="test@example.com",
-                    name="Test User",
-                    role="USER",
-                    created_at=now,
-                ),
-                "tenant": TenantRead(
-                    id=tenant_id,
-                    name="Acme",
-                    plan="starter",
-                    created_at=now,
-                    updated_at=now,
-                ),
-            }
+    auth_service = FakeAuthService(
+        profile={
+            "user": UserRead(
+                id=user_id,
+                tenant_id=tenant_id,
+                email="test@example.com",
+                name="Test User",
+                role="USER",
+                created_at=now,
+            ),
+            "tenant": TenantRead(
+                id=tenant_id,
+                name="Acme",
+                plan="starter",
+                created_at=now,
+                updated_at=now,
+            ),
+        }
+    )
 
     def override_context():
         """Provide a fake request context with valid ids."""
@@ -72,14 +45,10 @@ def test_get_me_success(app, client):
 
         return CurrentRequestContext(user_id=user_id, tenant_id=tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_auth_service():
-        """Provide the fake auth service."""
-        return FakeAuthService()
-
-    app.dependency_overrides[me_router.get_auth_service] = override_auth_service
+    use_fake(app, me_router.get_auth_service, auth_service)
 
     response = client.get("/me")
 
@@ -87,11 +56,12 @@ def test_get_me_success(app, client):
     payload = response.json()
     assert payload["user"]["id"] == str(user_id)
     assert payload["tenant"]["id"] == str(tenant_id)
+    assert auth_service.calls == [("get_current_user_profile", {"user_id": user_id})]
 
 
 def test_get_me_missing_headers_returns_401(app, client):
     """Missing auth headers yields 401."""
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
 
     response = client.get("/me")
 
@@ -100,7 +70,7 @@ def test_get_me_missing_headers_returns_401(app, client):
 
 def test_get_me_invalid_headers_returns_400(app, client):
     """Invalid auth headers yields 400."""
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
 
     response = client.get(
         "/me",
@@ -118,14 +88,11 @@ def test_get_me_user_not_found_returns_404(app, client):
     user_id = uuid4()
     tenant_id = uuid4()
 
-    class FakeAuthService:
-        """Fake auth service raising 404."""
-
-        def get_current_user_profile(self, _db_session, _requested_user_id: UUID):
-            """Raise 404 for any profile lookup."""
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-            )
+    auth_service = FakeAuthService(
+        error=HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+    )
 
     def override_context():
         """Provide a fake request context with ids."""
@@ -133,14 +100,10 @@ def test_get_me_user_not_found_returns_404(app, client):
 
         return CurrentRequestContext(user_id=user_id, tenant_id=tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_auth_service():
-        """Provide the fake auth service."""
-        return FakeAuthService()
-
-    app.dependency_overrides[me_router.get_auth_service] = override_auth_service
+    use_fake(app, me_router.get_auth_service, auth_service)
 
     response = client.get("/me")
 
@@ -153,19 +116,15 @@ def test_get_current_tenant_success(app, client):
     tenant_id = uuid4()
     now = datetime.now(timezone.utc)
 
-    class FakeTenantService:
-        """Fake tenant service returning canned tenant."""
-
-        def get_current_tenant(self, _db_session, requested_tenant_id: UUID):
-            """Return deterministic tenant read model."""
-            assert requested_tenant_id == tenant_id
-            return TenantRead(
-                id=tenant_id,
-                name="Acme",
-                plan="starter",
-                created_at=now,
-                updated_at=now,
-            )
+    tenant_service = FakeTenantService(
+        tenant=TenantRead(
+            id=tenant_id,
+            name="Acme",
+            plan="starter",
+            created_at=now,
+            updated_at=now,
+        )
+    )
 
     def override_context():
         """Provide a fake request context with ids."""
@@ -173,16 +132,10 @@ def test_get_current_tenant_success(app, client):
 
         return CurrentRequestContext(user_id=user_id, tenant_id=tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_tenant_service():
-        """Provide the fake tenant service."""
-        return FakeTenantService()
-
-    app.dependency_overrides[tenants_router.get_tenant_service] = (
-        override_tenant_service
-    )
+    use_fake(app, tenants_router.get_tenant_service, tenant_service)
 
     response = client.get("/tenants/current")
 
@@ -190,11 +143,12 @@ def test_get_current_tenant_success(app, client):
     payload = response.json()
     assert payload["id"] == str(tenant_id)
     assert payload["name"] == "Acme"
+    assert tenant_service.calls == [("get_current_tenant", {"tenant_id": tenant_id})]
 
 
 def test_get_current_tenant_missing_headers_returns_401(app, client):
     """Missing auth headers yields 401."""
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
 
     response = client.get("/tenants/current")
 
@@ -203,7 +157,7 @@ def test_get_current_tenant_missing_headers_returns_401(app, client):
 
 def test_get_current_tenant_invalid_headers_returns_400(app, client):
     """Invalid auth headers yields 400."""
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
 
     response = client.get(
         "/tenants/current",
@@ -221,14 +175,11 @@ def test_get_current_tenant_not_found_returns_404(app, client):
     user_id = uuid4()
     tenant_id = uuid4()
 
-    class FakeTenantService:
-        """Fake tenant service raising 404."""
-
-        def get_current_tenant(self, _db_session, _requested_tenant_id: UUID):
-            """Raise 404 for any tenant lookup."""
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
-            )
+    tenant_service = FakeTenantService(
+        error=HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
+        )
+    )
 
     def override_context():
         """Provide a fake request context with ids."""
@@ -236,16 +187,10 @@ def test_get_current_tenant_not_found_returns_404(app, client):
 
         return CurrentRequestContext(user_id=user_id, tenant_id=tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_tenant_service():
-        """Provide the fake tenant service."""
-        return FakeTenantService()
-
-    app.dependency_overrides[tenants_router.get_tenant_service] = (
-        override_tenant_service
-    )
+    use_fake(app, tenants_router.get_tenant_service, tenant_service)
 
     response = client.get("/tenants/current")
 
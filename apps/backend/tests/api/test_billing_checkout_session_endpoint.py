@@ -2,18 +2,12 @@
 
 from uuid import UUID, uuid4
 
+from fastapi.testclient import TestClient
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
 from api.main import create_app
 from api.routers import billing as billing_router
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_create_checkout_session_success():
@@ -36,18 +30,10 @@ def test_create_checkout_session_success():
         """Provide a fake request context for auth headers."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_billing_service():
-        """Provide the fake billing service."""
-        return FakeBillingService()
-
-    app.dependency_overrides[billing_router.get_billing_service] = (
-        override_billing_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, billing_router.get_billing_service, FakeBillingService())
 
     client = TestClient(app)
     response = client.post("/billing/checkout-session", json={"target_plan": "pro"})
@@ -59,9 +45,7 @@ def test_create_checkout_session_success():
 def test_create_checkout_session_missing_headers_returns_401():
     """Missing auth headers yields 401."""
     app = create_app()
-    app.dependency_overrides[get_db] = override_db
-
-    from fastapi.testclient import TestClient
+    use_fake(app, get_db, DUMMY_SESSION)
 
     client = TestClient(app)
     response = client.post("/billing/checkout-session", json={"target_plan": "pro"})
@@ -2,10 +2,14 @@
 
 import os
 
+import pytest
+from fastapi.testclient import TestClient
+
 from api.config import get_settings
 from api.main import create_app
 
 
+@pytest.mark.fresh_app
 def test_cors_allows_configured_origin():
     """Configured origin is echoed in CORS preflight response."""
     os.environ["CORS_ALLOWED_ORIGINS"] = "https://example.com"
@@ -13,8 +17,6 @@ def test_cors_allows_configured_origin():
     try:
         app = create_app()
 
-        from fastapi.testclient import TestClient
-
         client = TestClient(app)
         response = client.options(
             "/health/",
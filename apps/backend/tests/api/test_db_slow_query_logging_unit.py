@@ -0,0 +1,38 @@
+"""Unit tests for SQLAlchemy slow-query logging."""
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from models.db import install_slow_query_logging
+
+
+def test_slow_queries_are_logged_with_parameters(caplog: pytest.LogCaptureFixture):
+    """Statements over the threshold are logged with duration and params."""
+    engine = create_engine("sqlite://")
+    install_slow_query_logging(engine, threshold_ms=1e-9)
+
+    with caplog.at_level(logging.WARNING, logger="models.db"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :value"), {"value": 42})
+
+    slow_records = [r for r in caplog.records if r.message == "Slow SQL query"]
+    assert len(slow_records) == 1
+    # `extra` fields are set as record attributes unknown to `LogRecord`.
+    fields = slow_records[0].__dict__
+    assert fields["statement"] == "SELECT ?"
+    assert "42" in fields["parameters"]
+    assert fields["duration_ms"] >= 0
+
+
+def test_fast_queries_are_not_logged(caplog: pytest.LogCaptureFixture):
+    """Statements under the threshold produce no log records."""
+    engine = create_engine("sqlite://")
+    install_slow_query_logging(engine, threshold_ms=60_000)
+
+    with caplog.at_level(logging.WARNING, logger="models.db"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+    assert not [r for r in caplog.records if r.message == "Slow SQL query"]
@@ -0,0 +1,25 @@
+"""Unit tests for the time-ordered `uuid7` primary-key default."""
+
+from models.db import uuid7
+
+
+def test_uuid7_sets_version_variant_and_millisecond_timestamp(monkeypatch):
+    """The top 48 bits carry the Unix time in milliseconds."""
+    monkeypatch.setattr("models.db.time.time_ns", lambda: 1_700_000_000_123_456_789)
+
+    value = uuid7()
+
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+    assert value.int >> 80 == 1_700_000_000_123
+
+
+def test_uuid7_sorts_by_creation_time(monkeypatch):
+    """Ids generated in later milliseconds sort after earlier ones."""
+    ticks = iter(range(1_700_000_000_000_000_000, 1_700_000_000_100_000_000, 1_000_000))
+    monkeypatch.setattr("models.db.time.time_ns", lambda: next(ticks))
+
+    ids = [uuid7() for _ in range(50)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 50
@@ -0,0 +1,26 @@
+"""Integration tests for response compression."""
+
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+
+
+def test_large_responses_are_gzipped_when_accepted():
+    """Responses above the size threshold are gzip-encoded for gzip clients."""
+
+    client = TestClient(create_app())
+    response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == "gzip"
+    assert response.json()["info"]["title"] == "LocalBizIntel Backend API"
+
+
+def test_small_responses_are_not_compressed():
+    """Responses below the size threshold are sent as-is."""
+
+    client = TestClient(create_app())
+    response = client.get("/health/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
@@ -2,18 +2,12 @@
 
 from uuid import UUID, uuid4
 
+from fastapi.testclient import TestClient
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
 from api.main import create_app
 from api.routers import insights as insights_router
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_generate_market_summary_success():
@@ -38,11 +32,18 @@ def test_generate_market_summary_success():
             assert country == "GH"
             assert tenant_id == expected_tenant_id
             assert regions == ["accra-1"]
+            stats = {
+                "demographics": {
+                    "geo_id": ["accra-1"],
+                    "population_total": [1000],
+                    "median_income": [123.45],
+                }
+            }
             return {
                 "city": city,
                 "country": country,
-                "stats": {},
-                "stats_used": {"city": city, "country": country, "regions": regions},
+                "stats": stats,
+                "stats_used": {"city": city, "country": country, **stats},
                 "ai_summary": {"summary": "ok"},
             }
 
@@ -50,18 +51,10 @@ def test_generate_market_summary_success():
         """Provide fake request context with tenant id."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=expected_tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_insight_service():
-        """Provide the fake insight service."""
-        return FakeInsightService()
-
-    app.dependency_overrides[insights_router.get_insight_service] = (
-        override_insight_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, insights_router.get_insight_service, FakeInsightService())
 
     client = TestClient(app)
     response = client.post(
@@ -71,14 +64,21 @@ def test_generate_market_summary_success():
 
     assert response.status_code == 200
     assert response.json()["ai_summary"]["summary"] == "ok"
+    expected_rows = [
+        {"geo_id": "accra-1", "population_total": 1000, "median_income": 123.45}
+    ]
+    assert response.json()["stats"]["demographics"] == expected_rows
+    assert response.json()["stats_used"] == {
+        "city": "Accra",
+        "country": "GH",
+        "demographics": expected_rows,
+    }
 
 
 def test_generate_market_summary_missing_headers_returns_401():
     """Missing auth headers yields 401."""
     app = create_app()
-    app.dependency_overrides[get_db] = override_db
-
-    from fastapi.testclient import TestClient
+    use_fake(app, get_db, DUMMY_SESSION)
 
     client = TestClient(app)
     response = client.post("/insights/market-summary", json={"city": "Accra"})
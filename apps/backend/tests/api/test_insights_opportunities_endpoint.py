@@ -2,18 +2,12 @@
 
 from uuid import UUID, uuid4
 
+from fastapi.testclient import TestClient
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
 from api.main import create_app
 from api.routers import insights as insights_router
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_generate_opportunities_success():
@@ -32,9 +26,11 @@ def test_generate_opportunities_success():
             constraints: dict | None,
             country: str | None,
             tenant_id: UUID,
+            top_k: int | None,
         ):
             """Return canned opportunities response."""
             _ = db_session
+            assert top_k == 5
             assert city == "Accra"
             assert business_type == "retail"
             assert constraints == {"min_composite_score": 0.5}
@@ -56,18 +52,10 @@ def test_generate_opportunities_success():
         """Provide fake request context with tenant id."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=expected_tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_insight_service():
-        """Provide the fake insight service."""
-        return FakeInsightService()
-
-    app.dependency_overrides[insights_router.get_insight_service] = (
-        override_insight_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, insights_router.get_insight_service, FakeInsightService())
 
     client = TestClient(app)
     response = client.post(
@@ -77,6 +65,7 @@ def test_generate_opportunities_success():
             "country": "GH",
             "business_type": "retail",
             "constraints": {"min_composite_score": 0.5},
+            "top_k": 5,
         },
     )
 
@@ -87,9 +76,7 @@ def test_generate_opportunities_success():
 def test_generate_opportunities_missing_headers_returns_401():
     """Missing auth headers yields 401."""
     app = create_app()
-    app.dependency_overrides[get_db] = override_db
-
-    from fastapi.testclient import TestClient
+    use_fake(app, get_db, DUMMY_SESSION)
 
     client = TestClient(app)
     response = client.post("/insights/opportunities", json={"city": "Accra"})
@@ -2,20 +2,14 @@
 
 from uuid import uuid4
 
+from fastapi.testclient import TestClient
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
 from api.main import create_app
 from api.routers import insights as insights_router
 from services.dependencies import InsightServiceDependencies
 from services.insight_service import InsightService
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_opportunities_http_smoke_real_service_orders_and_includes_ai():
@@ -96,14 +90,12 @@ def test_opportunities_http_smoke_real_service_orders_and_includes_ai():
             )
         )
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
     app.dependency_overrides[insights_router.get_insight_service] = (
         override_insight_service
     )
 
-    from fastapi.testclient import TestClient
-
     client = TestClient(app)
     response = client.post(
         "/insights/opportunities",
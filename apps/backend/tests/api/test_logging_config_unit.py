@@ -1,30 +1,19 @@
 """Unit tests for structured logging configuration."""
 
-import json
 import logging
-from contextlib import contextmanager
-from typing import Any
+from datetime import datetime, timezone
+from uuid import uuid4
 
-import pytest
+import orjson
 
 from api.config import Settings
 from api.logging_config import JsonLogFormatter, configure_logging
 
 
-@contextmanager
-def _disable_dotenv_for_settings() -> Any:
-    old_env_file = Settings.model_config.get("env_file")
-    Settings.model_config["env_file"] = None
-    try:
-        yield
-    finally:
-        Settings.model_config["env_file"] = old_env_file
-
-
-def test_json_log_formatter_emits_structured_payload() -> None:
-    with _disable_dotenv_for_settings():
-        settings = Settings()
-    formatter = JsonLogFormatter(service_name=settings.log_service_name)
+def test_json_log_formatter_emits_structured_payload(
+    default_settings: Settings,
+) -> None:
+    formatter = JsonLogFormatter(service_name=default_settings.log_service_name)
     record = logging.LogRecord(
         name="test.logger",
         level=logging.INFO,
@@ -34,14 +23,19 @@ def test_json_log_formatter_emits_structured_payload() -> None:
         args=(),
         exc_info=None,
     )
-    rendered = formatter.format(record)
-    payload = json.loads(rendered)
+    expected = {
+        "timestamp": datetime.fromtimestamp(
+            record.created, tz=timezone.utc
+        ).isoformat(),
+        "level": "INFO",
+        "service": default_settings.log_service_name,
+        "logger": "test.logger",
+        "message": "hello",
+    }
 
-    assert payload["level"] == "INFO"
-    assert payload["service"] == settings.log_service_name
-    assert payload["logger"] == "test.logger"
-    assert payload["message"] == "hello"
-    assert "timestamp" in payload
+    payload = orjson.loads(formatter.format(record))
+    # Subset check: Python 3.12+ also attaches `taskName` under `fields`.
+    assert payload.items() >= expected.items()
 
 
 def test_json_log_formatter_includes_extra_fields() -> None:
@@ -58,32 +52,48 @@ def test_json_log_formatter_includes_extra_fields() -> None:
     record.user_id = "abc"  # type: ignore[attr-defined]
     record.city = "Toronto"  # type: ignore[attr-defined]
 
-    payload = json.loads(formatter.format(record))
-    assert payload["fields"]["user_id"] == "abc"
-    assert payload["fields"]["city"] == "Toronto"
+    payload = orjson.loads(formatter.format(record))
+    assert payload["fields"].items() >= {"user_id": "abc", "city": "Toronto"}.items()
 
 
-def test_configure_logging_with_provider_credentials_does_not_crash(
-    caplog: pytest.LogCaptureFixture,
-) -> None:
+def test_json_log_formatter_serializes_non_string_extra_fields() -> None:
+    formatter = JsonLogFormatter(service_name="svc")
+    record = logging.LogRecord(
+        name="test.logger",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        msg="hello",
+        args=(),
+        exc_info=None,
+    )
+    tenant_id = uuid4()
+    record.tenant_id = tenant_id  # type: ignore[attr-defined]
+    record.client = object()  # type: ignore[attr-defined]
+    record.counts = {1: "a", tenant_id: "b"}  # type: ignore[attr-defined]
+
+    payload = orjson.loads(formatter.format(record))
+    assert payload["fields"]["tenant_id"] == str(tenant_id)
+    assert payload["fields"]["client"].startswith("<object object")
+    assert payload["fields"]["counts"] == {"1": "a", str(tenant_id): "b"}
+
+
+def test_configure_logging_with_provider_credentials_does_not_crash() -> None:
     """Provider auto-wiring should be safe even if SDKs are not installed."""
-    previous_handlers = list(logging.getLogger().handlers)
-    previous_level = logging.getLogger().level
+    settings = Settings(
+        sentry_dsn="https://example@o0.ingest.sentry.io/0",
+        datadog_api_key="dummy",
+        gcp_logging_enabled=True,
+        aws_cloudwatch_enabled=True,
+        aws_cloudwatch_log_group="localbizintel-test",
+    )
+    # Configure a dedicated logger so the root logger (and caplog) is untouched.
+    logger = logging.getLogger("api.test.isolated")
     try:
-        with _disable_dotenv_for_settings():
-            settings = Settings(
-                sentry_dsn="https://example@o0.ingest.sentry.io/0",
-                datadog_api_key="dummy",
-                gcp_logging_enabled=True,
-                aws_cloudwatch_enabled=True,
-                aws_cloudwatch_log_group="localbizintel-test",
-            )
-        # `configure_logging` replaces root handlers, which interferes with caplog's
-        # handler. This test focuses on "does not crash" when credentials are present.
-        configure_logging(settings)
+        configure_logging(settings, logger=logger)
+
+        # The stdout handler comes first; provider handlers follow when installed.
+        assert isinstance(logger.handlers[0].formatter, JsonLogFormatter)
+        assert logger.level == logging.getLevelName(settings.log_level)
     finally:
-        root = logging.getLogger()
-        root.handlers.clear()
-        for h in previous_handlers:
-            root.addHandler(h)
-        root.setLevel(previous_level)
+        logger.handlers.clear()
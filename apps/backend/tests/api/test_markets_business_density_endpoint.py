@@ -1,22 +1,15 @@
 """HTTP endpoint tests for market business density routes."""
 
+import pytest
+
 from api.dependencies import get_db
-from api.main import create_app
 from api.routers import markets as markets_router
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
-
-
-def test_get_business_density_success_with_filter():
+@pytest.mark.anyio
+async def test_get_business_density_success_with_filter(app, async_client):
     """`GET /markets/{city}/business-density` returns density for filter."""
-    app = create_app()
 
     class FakeMarketService:
         """Fake market service returning canned densities."""
@@ -39,20 +32,11 @@ def test_get_business_density_success_with_filter():
                 }
             ]
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    def override_market_service():
-        """Provide the fake market service."""
-        return FakeMarketService()
+    use_fake(app, markets_router.get_market_service, FakeMarketService())
 
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
-
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-    response = client.get(
+    response = await async_client.get(
         "/markets/Accra/business-density?country=GH&business_type=retail"
     )
 
@@ -63,9 +47,9 @@ def test_get_business_density_success_with_filter():
     assert len(data["business_density"]) == 1
 
 
-def test_get_business_density_not_found():
+@pytest.mark.anyio
+async def test_get_business_density_not_found(app, async_client):
     """Missing density yields 404."""
-    app = create_app()
 
     class FakeMarketService:
         """Fake market service raising 404."""
@@ -79,19 +63,10 @@ def test_get_business_density_not_found():
                 detail="Business density not found for city",
             )
 
-    app.dependency_overrides[get_db] = override_db
-
-    def override_market_service():
-        """Provide the fake market service."""
-        return FakeMarketService()
-
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    from fastapi.testclient import TestClient
+    use_fake(app, markets_router.get_market_service, FakeMarketService())
 
-    client = TestClient(app)
-    response = client.get("/markets/Nowhere/business-density")
+    response = await async_client.get("/markets/Nowhere/business-density")
 
     assert response.status_code == 404
@@ -1,106 +1,42 @@
 """HTTP endpoint tests for listing market cities."""
 
+import pytest
+
 from api.dependencies import get_db
-from api.main import create_app
 from api.routers import markets as markets_router
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
-
-
-def test_list_cities_success():
-    """`GET /markets/cities` returns all cities when no country filter."""
-    app = create_app()
-
-    class FakeMarketService:
-        """Fake market service returning canned cities."""
-
-        def list_cities(self, _db_session, country):
-            """Return cities for a country filter."""
-            assert country is None
-            return ["Accra", "Lagos"]
-
-    app.dependency_overrides[get_db] = override_db
-
-    def override_market_service():
-        """Provide fake market service."""
-        return FakeMarketService()
-
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
-
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-    response = client.get("/markets/cities")
-
-    assert response.status_code == 200
-    assert response.json() == {"cities": ["Accra", "Lagos"]}
-
-
-def test_list_cities_with_country_param():
-    """Country param is forwarded to service."""
-    app = create_app()
-
-    class FakeMarketService:
-        """Fake market service returning cities for given country."""
-
-        def list_cities(self, _db_session, country):
-            """Return cities."""
-            assert country == "NG"
-            return ["Lagos"]
-
-    app.dependency_overrides[get_db] = override_db
-
-    def override_market_service():
-        """Provide fake market service."""
-        return FakeMarketService()
-
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
-
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-    response = client.get("/markets/cities?country=NG")
-
-    assert response.status_code == 200
-    assert response.json() == {"cities": ["Lagos"]}
-
-
-def test_list_cities_empty_result():
-    """Empty service results yield empty list."""
-    app = create_app()
-
-    class FakeMarketService:
-        """Fake market service returning no cities."""
-
-        def list_cities(self, _db_session, _country):
-            """Return empty list."""
-            return []
+class FakeMarketService:
+    """Fake market service returning canned cities and recording the filter."""
 
-    app.dependency_overrides[get_db] = override_db
+    def __init__(self, cities: list[str]) -> None:
+        self._cities = cities
+        self.countries: list[str | None] = []
 
-    def override_market_service():
-        """Provide fake market service."""
-        return FakeMarketService()
+    def list_cities(self, _db_session, country):
+        """Record the country filter and return the canned cities."""
+        self.countries.append(country)
+        return self._cities
 
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
 
-    from fastapi.testclient import TestClient
+@pytest.mark.parametrize(
+    ("params", "expected_country", "cities"),
+    [
+        pytest.param({}, None, ["Accra", "Lagos"], id="all-cities"),
+        pytest.param({"country": "NG"}, "NG", ["Lagos"], id="country-filter"),
+        pytest.param({}, None, [], id="empty-result"),
+    ],
+)
+@pytest.mark.anyio
+async def test_list_cities(app, async_client, params, expected_country, cities):
+    """`GET /markets/cities` forwards the country filter and returns cities."""
+    market_service = FakeMarketService(cities)
+    use_fake(app, get_db, DUMMY_SESSION)
+    use_fake(app, markets_router.get_market_service, market_service)
 
-    client = TestClient(app)
-    response = client.get("/markets/cities")
+    response = await async_client.get("/markets/cities", params=params)
 
     assert response.status_code == 200
-    assert response.json() == {"cities": []}
+    assert response.json() == {"cities": cities}
+    assert market_service.countries == [expected_country]
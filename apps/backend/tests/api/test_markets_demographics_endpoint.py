@@ -1,17 +1,11 @@
 """HTTP endpoint tests for market demographics routes."""
 
+from fastapi.testclient import TestClient
+
 from api.dependencies import get_db
 from api.main import create_app
 from api.routers import markets as markets_router
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_get_market_demographics_success():
@@ -41,17 +35,9 @@ def test_get_market_demographics_success():
                 }
             ]
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    def override_market_service():
-        """Provide the fake market service."""
-        return FakeMarketService()
-
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, markets_router.get_market_service, FakeMarketService())
 
     client = TestClient(app)
     response = client.get("/markets/Accra/demographics?country=GH")
@@ -79,17 +65,9 @@ def test_get_market_demographics_not_found():
                 detail="Demographics not found for city",
             )
 
-    app.dependency_overrides[get_db] = override_db
-
-    def override_market_service():
-        """Provide the fake market service."""
-        return FakeMarketService()
-
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    from fastapi.testclient import TestClient
+    use_fake(app, markets_router.get_market_service, FakeMarketService())
 
     client = TestClient(app)
     response = client.get("/markets/Nowhere/demographics")
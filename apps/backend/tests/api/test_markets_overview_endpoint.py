@@ -2,18 +2,12 @@
 
 from uuid import UUID, uuid4
 
+from fastapi.testclient import TestClient
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
 from api.main import create_app
 from api.routers import markets as markets_router
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
 
 def test_get_market_overview_success():
@@ -41,18 +35,10 @@ def test_get_market_overview_success():
         """Provide a fake request context with tenant/user ids."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_market_service():
-        """Provide the fake market service."""
-        return FakeMarketService()
-
-    app.dependency_overrides[markets_router.get_market_service] = (
-        override_market_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, markets_router.get_market_service, FakeMarketService())
 
     client = TestClient(app)
     response = client.get("/markets/Accra/overview?country=GH")
@@ -64,9 +50,7 @@ def test_get_market_overview_success():
 def test_get_market_overview_missing_headers_returns_401():
     """Missing auth headers returns 401."""
     app = create_app()
-    app.dependency_overrides[get_db] = override_db
-
-    from fastapi.testclient import TestClient
+    use_fake(app, get_db, DUMMY_SESSION)
 
     client = TestClient(app)
     response = client.get("/markets/Accra/overview")
@@ -77,9 +61,7 @@ def test_get_market_overview_missing_headers_returns_401():
 def test_get_market_overview_invalid_headers_returns_400():
     """Invalid auth headers returns 400."""
     app = create_app()
-    app.dependency_overrides[get_db] = override_db
-
-    from fastapi.testclient import TestClient
+    use_fake(app, get_db, DUMMY_SESSION)
 
     client = TestClient(app)
     response = client.get(
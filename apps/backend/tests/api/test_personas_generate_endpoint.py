@@ -2,23 +2,28 @@
 
 from uuid import UUID, uuid4
 
+import orjson
+import pytest
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
-from api.main import create_app
 from api.routers import personas as personas_router
-
-
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
-
-
-def test_generate_personas_success():
+from tests.api._overrides import DUMMY_SESSION, use_fake
+
+# Request bodies are encoded once at import and posted as raw bytes.
+_JSON_HEADERS = {"content-type": "application/json"}
+_GENERATE_PAYLOAD = orjson.dumps(
+    {
+        "city": "Accra",
+        "country": "GH",
+        "geo_ids": ["accra-1"],
+        "business_type": "retail",
+    }
+)
+
+
+@pytest.mark.anyio
+async def test_generate_personas_success(app, async_client):
     """`POST /personas/generate` succeeds with valid auth and payload."""
-    app = create_app()
     expected_tenant_id = uuid4()
 
     class FakePersonaService:
@@ -35,11 +40,13 @@ def test_generate_personas_success():
         ):
             """Return deterministic personas payload."""
             _ = db_session
-            assert city == "Accra"
-            assert country == "GH"
-            assert geo_ids == ["accra-1"]
-            assert business_type == "retail"
-            assert tenant_id == expected_tenant_id
+            assert (city, country, geo_ids, business_type, tenant_id) == (
+                "Accra",
+                "GH",
+                ["accra-1"],
+                "retail",
+                expected_tenant_id,
+            )
             return {
                 "city": city,
                 "country": country,
@@ -51,42 +58,26 @@ def test_generate_personas_success():
         """Provide a fake request context with user and tenant ids."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=expected_tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_persona_service():
-        """Provide the fake persona service."""
-        return FakePersonaService()
-
-    app.dependency_overrides[personas_router.get_persona_service] = (
-        override_persona_service
-    )
+    use_fake(app, personas_router.get_persona_service, FakePersonaService())
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-    response = client.post(
-        "/personas/generate",
-        json={
-            "city": "Accra",
-            "country": "GH",
-            "geo_ids": ["accra-1"],
-            "business_type": "retail",
-        },
+    response = await async_client.post(
+        "/personas/generate", content=_GENERATE_PAYLOAD, headers=_JSON_HEADERS
     )
 
     assert response.status_code == 200
     assert response.json()["personas"]["headline"] == "ok"
 
 
-def test_generate_personas_missing_headers_returns_401():
+@pytest.mark.anyio
+async def test_generate_personas_missing_headers_returns_401(app, async_client):
     """Missing auth headers yields 401."""
-    app = create_app()
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-    response = client.post("/personas/generate", json={"city": "Accra"})
+    response = await async_client.post(
+        "/personas/generate", content=_GENERATE_PAYLOAD, headers=_JSON_HEADERS
+    )
 
     assert response.status_code == 401
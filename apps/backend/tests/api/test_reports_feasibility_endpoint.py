@@ -2,25 +2,26 @@
 
 from uuid import UUID, uuid4
 
+import orjson
+import pytest
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
-from api.main import create_app
 from api.routers import reports as reports_router
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
+# Request bodies are encoded once at import and posted as raw bytes.
+_JSON_HEADERS = {"content-type": "application/json"}
+_FEASIBILITY_PAYLOAD = orjson.dumps(
+    {"city": "Accra", "country": "GH", "business_type": "retail"}
+)
 
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
 
-
-def test_create_feasibility_report_success():
+@pytest.mark.anyio
+async def test_create_feasibility_report_success(app, async_client):
     """`POST /reports/feasibility` enqueues a job with valid auth."""
-    app = create_app()
     expected_tenant_id = uuid4()
     expected_user_id = uuid4()
+    published = []
 
     class FakeReportService:
         """Fake report service asserting input and returning canned job."""
@@ -31,14 +32,18 @@ def test_create_feasibility_report_success():
             request,
             tenant_id: UUID,
             user_id: UUID,
+            background_tasks,
         ):
-            """Return deterministic job response."""
+            """Return deterministic job response with a deferred publish."""
             _ = db_session
-            assert request.city == "Accra"
-            assert request.country == "GH"
-            assert request.business_type == "retail"
-            assert tenant_id == expected_tenant_id
-            assert user_id == expected_user_id
+            background_tasks.add_task(published.append, "job-123")
+            assert (
+                request.city,
+                request.country,
+                request.business_type,
+                tenant_id,
+                user_id,
+            ) == ("Accra", "GH", "retail", expected_tenant_id, expected_user_id)
             return {"job_id": "job-123", "status": "PENDING"}
 
     def override_context():
@@ -47,40 +52,37 @@ def test_create_feasibility_report_success():
             user_id=expected_user_id, tenant_id=expected_tenant_id
         )
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_report_service():
-        """Provide a fake report service."""
-        return FakeReportService()
-
-    app.dependency_overrides[reports_router.get_report_service] = (
-        override_report_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, reports_router.get_report_service, FakeReportService())
 
-    client = TestClient(app)
-    response = client.post(
-        "/reports/feasibility",
-        json={"city": "Accra", "country": "GH", "business_type": "retail"},
+    response = await async_client.post(
+        "/reports/feasibility", content=_FEASIBILITY_PAYLOAD, headers=_JSON_HEADERS
     )
 
     assert response.status_code == 200
     assert response.json() == {"job_id": "job-123", "status": "PENDING"}
+    assert published == ["job-123"]
 
 
-def test_create_feasibility_report_missing_headers_returns_401():
+@pytest.mark.anyio
+async def test_create_feasibility_report_missing_headers_returns_401(app, async_client):
     """Missing auth headers yields 401."""
-    app = create_app()
-    app.dependency_overrides[get_db] = override_db
-
-    from fastapi.testclient import TestClient
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    client = TestClient(app)
-    response = client.post(
-        "/reports/feasibility",
-        json={"city": "Accra", "country": "GH", "business_type": "retail"},
+    response = await async_client.post(
+        "/reports/feasibility", content=_FEASIBILITY_PAYLOAD, headers=_JSON_HEADERS
     )
 
     assert response.status_code == 401
+
+
+def test_get_report_service_is_shared_and_reuses_billing_service():
+    """The report service is built once and shares the billing singleton."""
+    from api.routers import billing as billing_router
+
+    report_service = reports_router.get_report_service()
+
+    assert reports_router.get_report_service() is report_service
+    assert report_service._billing_service is billing_router.get_billing_service()
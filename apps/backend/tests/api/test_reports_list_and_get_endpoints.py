@@ -1,69 +1,55 @@
 """HTTP endpoint tests for listing and fetching reports."""
 
+from types import SimpleNamespace
 from uuid import UUID, uuid4
 
+import pytest
+
 from api.dependencies import CurrentRequestContext, get_current_request_context, get_db
-from api.main import create_app
 from api.routers import reports as reports_router
+from tests.api._overrides import DUMMY_SESSION, use_fake
 
+_JOB_FIELDS = {
+    "city": "Accra",
+    "country": "GH",
+    "business_type": "retail",
+    "status": "PENDING",
+    "pdf_url": None,
+    "error_message": None,
+    "created_at": None,
+    "updated_at": None,
+}
 
-def override_db():
-    """Provide a dummy DB session for dependency overrides."""
-
-    class DummySession:
-        """Stub SQLAlchemy session."""
-
-    yield DummySession()
 
+def fake_job(job_id: UUID) -> SimpleNamespace:
+    """Attribute-style report job, validated like an ORM row by the routes."""
+    return SimpleNamespace(id=job_id, **_JOB_FIELDS)
 
-class FakeJob:
-    """Minimal report job fixture for HTTP response validation."""
 
-    def __init__(self, job_id: UUID):
-        """Create fixture with expected attributes."""
-        self.id = job_id
-        self.city = "Accra"
-        self.country = "GH"
-        self.business_type = "retail"
-        self.status = "PENDING"
-        self.pdf_url = None
-        self.error_message = None
-        self.created_at = None
-        self.updated_at = None
-
-
-def test_list_reports_success():
+@pytest.mark.anyio
+async def test_list_reports_success(app, async_client):
     """`GET /reports` returns jobs for tenant."""
-    app = create_app()
     expected_tenant_id = uuid4()
 
     class FakeReportService:
         """Fake report service returning a canned list."""
 
-        def list_reports(self, _db_session, tenant_id: UUID):
+        def list_reports(self, _db_session, tenant_id: UUID, limit: int, offset: int):
             """Return canned jobs list."""
             assert tenant_id == expected_tenant_id
-            return [FakeJob(uuid4())]
+            assert (limit, offset) == (20, 0)
+            return [fake_job(uuid4())]
 
     def override_context():
         """Provide a fake request context with tenant/user ids."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=expected_tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_report_service():
-        """Provide the fake report service."""
-        return FakeReportService()
-
-    app.dependency_overrides[reports_router.get_report_service] = (
-        override_report_service
-    )
+    use_fake(app, reports_router.get_report_service, FakeReportService())
 
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-    response = client.get("/reports")
+    response = await async_client.get("/reports", params={"limit": 20})
 
     assert response.status_code == 200
     data = response.json()
@@ -71,9 +57,9 @@ def test_list_reports_success():
     assert len(data["reports"]) == 1
 
 
-def test_get_report_success():
+@pytest.mark.anyio
+async def test_get_report_success(app, async_client):
     """`GET /reports/{report_id}` returns report for tenant."""
-    app = create_app()
     expected_tenant_id = uuid4()
     report_id = uuid4()
 
@@ -84,35 +70,26 @@ def test_get_report_success():
             """Return the fixture report."""
             assert requested_report_id == report_id
             assert tenant_id == expected_tenant_id
-            return FakeJob(report_id)
+            return fake_job(report_id)
 
     def override_context():
         """Provide a fake request context with tenant/user ids."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=expected_tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_report_service():
-        """Provide the fake report service."""
-        return FakeReportService()
-
-    app.dependency_overrides[reports_router.get_report_service] = (
-        override_report_service
-    )
-
-    from fastapi.testclient import TestClient
+    use_fake(app, reports_router.get_report_service, FakeReportService())
 
-    client = TestClient(app)
-    response = client.get(f"/reports/{report_id}")
+    response = await async_client.get(f"/reports/{report_id}")
 
     assert response.status_code == 200
     assert response.json()["report"]["id"] == str(report_id)
 
 
-def test_get_report_not_found_returns_404():
+@pytest.mark.anyio
+async def test_get_report_not_found_returns_404(app, async_client):
     """Missing report yields 404."""
-    app = create_app()
     expected_tenant_id = uuid4()
 
     class FakeReportService:
@@ -130,33 +107,21 @@ def test_get_report_not_found_returns_404():
         """Provide a fake request context with tenant/user ids."""
         return CurrentRequestContext(user_id=uuid4(), tenant_id=expected_tenant_id)
 
-    app.dependency_overrides[get_db] = override_db
+    use_fake(app, get_db, DUMMY_SESSION)
     app.dependency_overrides[get_current_request_context] = override_context
 
-    def override_report_service():
-        """Provide the fake report service."""
-        return FakeReportService()
+    use_fake(app, reports_router.get_report_service, FakeReportService())
 
-    app.dependency_overrides[reports_router.get_report_service] = (
-        override_report_service
-    )
-
-    from fastapi.testclient import TestClient
-
-    client = TestClient(app)
-    response = client.get(f"/reports/{uuid4()}")
+    response = await async_client.get(f"/reports/{uuid4()}")
 
     assert response.status_code == 404
 
 
-def test_list_reports_missing_headers_returns_401():
+@pytest.mark.anyio
+async def test_list_reports_missing_headers_returns_401(app, async_client):
     """Missing auth headers yields 401."""
-    app = create_app()
-    app.dependency_overrides[get_db] = override_db
-
-    from fastapi.testclient import TestClient
+    use_fake(app, get_db, DUMMY_SESSION)
 
-    client = TestClient(app)
-    response = client.get("/reports")
+    response = await async_client.get("/reports")
 
     assert response.status_code == 401
@@ -1,30 +1,41 @@
 """Unit tests for request logging middleware."""
 
 import logging
-from contextlib import contextmanager
-from typing import Any
+from collections.abc import Iterator
+from logging.handlers import MemoryHandler
 
+import pytest
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.testclient import TestClient
 
+from api import request_logging_middleware
 from api.config import Settings
 from api.request_logging_middleware import RequestLoggingMiddleware
 
 
-@contextmanager
-def _disable_dotenv_for_settings() -> Any:
-    old_env_file = Settings.model_config.get("env_file")
-    Settings.model_config["env_file"] = None
+@pytest.fixture()
+def middleware_logs() -> Iterator[list[logging.LogRecord]]:
+    """Capture the middleware logger's records directly, bypassing the root."""
+    logger = request_logging_middleware.logger
+    handler = MemoryHandler(capacity=1024)
+    previous_level, previous_propagate = logger.level, logger.propagate
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
     try:
-        yield
+        yield handler.buffer
     finally:
-        Settings.model_config["env_file"] = old_env_file
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+        logger.propagate = previous_propagate
 
 
-def test_request_logging_middleware_adds_request_id_and_logs(caplog) -> None:
+def test_request_logging_middleware_adds_request_id_and_logs(
+    middleware_logs: list[logging.LogRecord],
+) -> None:
     app = FastAPI()
-    with _disable_dotenv_for_settings():
-        settings = Settings(log_request_body=True, log_response_body=True)
+    settings = Settings(log_request_body=True, log_response_body=True)
     app.add_middleware(RequestLoggingMiddleware, settings=settings)
 
     @app.post("/echo")
@@ -32,15 +43,31 @@ def test_request_logging_middleware_adds_request_id_and_logs(caplog) -> None:
         return payload
 
     client = TestClient(app)
-    with caplog.at_level(logging.INFO):
-        resp = client.post("/echo", json={"password": "secret", "x": 1})
+    resp = client.post("/echo", json={"password": "secret", "x": 1})
 
     assert resp.status_code == 200
     assert "X-Request-Id" in resp.headers
     # Ensure we logged a completion line and redacted password in request_body.
-    completed_records = [r for r in caplog.records if r.message == "Request completed"]
-    assert completed_records
-    assert any(
-        (r.__dict__.get("request_body") or {}).get("password") == "***REDACTED***"
-        for r in completed_records
-    )
+    (record,) = [r for r in middleware_logs if r.msg == "Request completed"]
+    assert record.__dict__["request_body"]["password"] == "***REDACTED***"
+
+
+def test_request_logging_middleware_logs_size_of_compressed_bodies(
+    middleware_logs: list[logging.LogRecord],
+) -> None:
+    app = FastAPI()
+    settings = Settings(log_response_body=True)
+    app.add_middleware(GZipMiddleware, minimum_size=1)
+    app.add_middleware(RequestLoggingMiddleware, settings=settings)
+
+    @app.get("/items")
+    def items() -> dict:
+        return {"items": ["x"] * 100}
+
+    client = TestClient(app)
+    resp = client.get("/items", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.json() == {"items": ["x"] * 100}
+    (record,) = [r for r in middleware_logs if r.msg == "Request completed"]
+    assert set(record.__dict__["response_body"]) == {"_bytes"}
@@ -0,0 +1,50 @@
+"""HTTP endpoint tests for Pub/Sub push worker routes."""
+
+import base64
+import json
+
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_db
+from api.main import create_app
+from api.routers import workers as workers_router
+from tests.api._overrides import DUMMY_SESSION, use_fake
+
+
+def _envelope(payload: dict) -> dict:
+    data = base64.b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+    return {"message": {"data": data}}
+
+
+def test_consume_ingestion_job_dispatches_to_injected_worker():
+    """`POST /workers/ingestion` decodes the message and calls the worker."""
+    app = create_app()
+
+    class FakeIngestionWorker:
+        """Fake ingestion worker echoing the consumed payload."""
+
+        def consume(self, *, db_session, payload):
+            """Return the payload dataset."""
+            _ = db_session
+            return {"dataset": payload["dataset"]}
+
+    use_fake(app, get_db, DUMMY_SESSION)
+    use_fake(app, workers_router.get_ingestion_worker, FakeIngestionWorker())
+
+    client = TestClient(app)
+    response = client.post(
+        "/workers/ingestion", json=_envelope({"dataset": "demographics"})
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "OK", "result": {"dataset": "demographics"}}
+
+
+def test_worker_factories_return_shared_instances():
+    """Workers and their jobs are built once and reused across messages."""
+    assert workers_router.get_ingestion_worker() is (
+        workers_router.get_ingestion_worker()
+    )
+    assert workers_router.get_embedding_worker() is (
+        workers_router.get_embedding_worker()
+    )
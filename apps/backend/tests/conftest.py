@@ -1,23 +1,107 @@
 """Pytest configuration and shared fixtures."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+import httpx
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from api.config import Settings
 from api.main import create_app
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "fresh_app: build a new app instead of the memoized `create_app()`"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _isolate_app(request: pytest.FixtureRequest) -> Generator[None, None, None]:
+    """
+    Keep the memoized `create_app()` instance isolated between tests.
+
+    Overrides set on it are cleared after every test; tests marked `fresh_app`
+    get a newly built app and leave no modified app behind.
+    """
+
+    fresh_app = request.node.get_closest_marker("fresh_app") is not None
+    if fresh_app:
+        create_app.cache_clear()
+    yield
+    if fresh_app:
+        create_app.cache_clear()
+    elif create_app.cache_info().currsize:
+        create_app().dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def _no_dotenv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep `Settings()` built in tests from reading a local `.env` file."""
+
+    monkeypatch.setitem(Settings.model_config, "env_file", None)
+
+
 @pytest.fixture(scope="session")
-def app():
-    """Create a fresh FastAPI app instance for tests."""
+def default_settings() -> Settings:
+    """
+    Default `Settings`, validated once per test session with `.env` ignored.
+
+    Shared across tests; build a dedicated `Settings(...)` to vary a field.
+    """
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(Settings.model_config, "env_file", None)
+        return Settings()
+
+
+@pytest.fixture(scope="session")
+def shared_app() -> FastAPI:
+    """Build the FastAPI app once per test session."""
 
     return create_app()
 
 
+@pytest.fixture()
+def app(shared_app: FastAPI) -> Generator[FastAPI, None, None]:
+    """The shared app; dependency overrides set by a test are cleared after it."""
+
+    yield shared_app
+    shared_app.dependency_overrides.clear()
+
+
 @pytest.fixture(scope="session")
-def client(app) -> Generator[TestClient, None, None]:
+def shared_client(shared_app: FastAPI) -> Generator[TestClient, None, None]:
+    """Sync test client for the shared app, opened once per test session."""
+
+    with TestClient(shared_app) as c:
+        yield c
+
+
+@pytest.fixture()
+def client(app: FastAPI, shared_client: TestClient) -> TestClient:
     """Sync test client for calling the API."""
 
-    with TestClient(app) as c:
+    return shared_client
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run `@pytest.mark.anyio` tests on asyncio only."""
+
+    return "asyncio"
+
+
+@pytest.fixture()
+async def async_client(app: FastAPI) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Async client calling the shared app in-process over `httpx.ASGITransport`.
+
+    Requests run on the test's event loop, without `TestClient`'s portal thread
+    bridging each call from sync code. Use from `@pytest.mark.anyio` tests.
+    """
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
@@ -1,8 +1,8 @@
-from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, cast
 
+import numpy as np
 import pytest
 from sqlalchemy.orm import Session
 
@@ -38,19 +38,8 @@ class DemoRow:
     density_score: Any | None = None
 
 
-@contextmanager
-def _disable_dotenv_for_settings() -> Any:
-    old_env_file = Settings.model_config.get("env_file")
-    Settings.model_config["env_file"] = None
-    try:
-        yield
-    finally:
-        Settings.model_config["env_file"] = old_env_file
-
-
 def test_rebuild_embeddings_job_happy_path_upserts_vectors_and_logs() -> None:
-    with _disable_dotenv_for_settings():
-        settings = Settings(openai_embedding_dimensions=8)
+    settings = Settings(openai_embedding_dimensions=8)
 
     class FakeDemographicsRepo:
         def get_for_regions(self, _db, _city, _country):
@@ -100,8 +89,10 @@ def test_rebuild_embeddings_job_happy_path_upserts_vectors_and_logs() -> None:
             return len(rows)
 
     class FakeEmbeddingClient:
-        def embed_texts(self, texts: list[str]) -> list[list[float]]:
-            return [[0.0] * settings.openai_embedding_dimensions for _ in texts]
+        def embed_texts(self, texts: list[str]) -> np.ndarray:
+            return np.zeros(
+                (len(texts), settings.openai_embedding_dimensions), dtype=np.float32
+            )
 
     db = DummySession()
     vector_repo = FakeVectorRepo()
@@ -136,9 +127,8 @@ def test_rebuild_embeddings_job_happy_path_upserts_vectors_and_logs() -> None:
     }
 
 
-def test_rebuild_embeddings_job_dimension_mismatch_fails_and_logs_failed() -> None:
-    with _disable_dotenv_for_settings():
-        settings = Settings(openai_embedding_dimensions=8)
+def test_rebuild_embeddings_job_embedding_error_fails_and_logs_failed() -> None:
+    settings = Settings(openai_embedding_dimensions=8)
 
     class EmptyRepo:
         def get_for_regions(self, *_a, **_kw):
@@ -152,8 +142,8 @@ def test_rebuild_embeddings_job_dimension_mismatch_fails_and_logs_failed() -> No
             raise AssertionError("should not be called")
 
     class BadEmbeddingClient:
-        def embed_texts(self, texts: list[str]) -> list[list[float]]:
-            return [[0.0] * (settings.openai_embedding_dimensions - 1) for _ in texts]
+        def embed_texts(self, texts: list[str]) -> np.ndarray:
+            raise ValueError(f"Expected {len(texts)} embeddings, got 0")
 
     db = DummySession()
     job = RebuildEmbeddingsJob(
@@ -1,7 +1,16 @@
-"""Unit tests for `AdminService` filter pass-through behavior."""
+"""Unit tests for `AdminService` filter pass-through and pagination behavior."""
 
+from datetime import datetime, timezone
 from uuid import uuid4
 
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+import models.core  # noqa: F401  (registers `tenants` for the FK)
+from models.db import Base
+from models.reports import ReportJob
+from repositories.pagination import Page
+from repositories.report_jobs_repository import ReportJobsRepository
 from services.admin_service import AdminService
 from services.dependencies import AdminServiceDependencies
 
@@ -22,6 +31,7 @@ def test_admin_service_list_users_passes_filters():
             tenant_id,
             limit,
             offset,
+            cursor,
         ):
             """Return canned users after asserting filter values."""
             assert db_session is expected_db
@@ -30,12 +40,15 @@ def test_admin_service_list_users_passes_filters():
             assert tenant_id == expected_tenant_id
             assert limit == 5
             assert offset == 10
-            return ["u1"]
+            assert cursor is None
+            return Page(items=["u1"], total=11, next_cursor=None)
 
     class DummyTenantRepository:
         """Stub tenant repository (unused)."""
 
-        def admin_list(self, _db_session, _name_contains, _plan, _limit, _offset):
+        def admin_list(
+            self, _db_session, _name_contains, _plan, _limit, _offset, _cursor
+        ):
             """Not used in this test."""
             raise AssertionError("not used")
 
@@ -59,6 +72,7 @@ def test_admin_service_list_users_passes_filters():
             business_type,
             limit,
             offset,
+            cursor,
         ):
             """Not used in this test."""
             raise AssertionError("not used")
@@ -69,6 +83,7 @@ def test_admin_service_list_users_passes_filters():
             tenant_repository=DummyTenantRepository(),
             data_freshness_repository=DummyDataFreshnessRepository(),
             report_jobs_repository=DummyReportJobsRepository(),
+            admin_dashboard_repository=object(),
         )
     )
     result = service.list_users(
@@ -79,7 +94,7 @@ def test_admin_service_list_users_passes_filters():
         limit=5,
         offset=10,
     )
-    assert result == ["u1"]
+    assert result == {"items": ["u1"], "total": 11, "next_cursor": None}
 
 
 def test_admin_service_list_tenants_passes_filters():
@@ -89,14 +104,15 @@ def test_admin_service_list_tenants_passes_filters():
     class FakeTenantRepository:
         """Fake tenant repository asserting on passed filters."""
 
-        def admin_list(self, db_session, name_contains, plan, limit, offset):
+        def admin_list(self, db_session, name_contains, plan, limit, offset, cursor):
             """Return canned tenants after asserting filter values."""
             assert db_session is expected_db
             assert name_contains == "Acme"
             assert plan == "starter"
             assert limit == 2
             assert offset == 0
-            return ["t1"]
+            assert cursor is None
+            return Page(items=["t1"], total=1, next_cursor=None)
 
     class DummyUserRepository:
         """Stub user repository (unused)."""
@@ -109,6 +125,7 @@ def test_admin_service_list_tenants_passes_filters():
             _tenant_id,
             _limit,
             _offset,
+            _cursor,
         ):
             """Not used in this test."""
             raise AssertionError("not used")
@@ -133,6 +150,7 @@ def test_admin_service_list_tenants_passes_filters():
             _business_type,
             _limit,
             _offset,
+            _cursor,
         ):
             """Not used in this test."""
             raise AssertionError("not used")
@@ -143,12 +161,13 @@ def test_admin_service_list_tenants_passes_filters():
             tenant_repository=FakeTenantRepository(),
             data_freshness_repository=DummyDataFreshnessRepository(),
             report_jobs_repository=DummyReportJobsRepository(),
+            admin_dashboard_repository=object(),
         )
     )
     result = service.list_tenants(
         expected_db, name_contains="Acme", plan="starter", limit=2, offset=0
     )
-    assert result == ["t1"]
+    assert result == {"items": ["t1"], "total": 1, "next_cursor": None}
 
 
 def test_admin_service_list_dataset_freshness_calls_repo():
@@ -174,6 +193,7 @@ def test_admin_service_list_dataset_freshness_calls_repo():
             _tenant_id,
             _limit,
             _offset,
+            _cursor,
         ):
             """Not used in this test."""
             raise AssertionError("not used")
@@ -181,7 +201,9 @@ def test_admin_service_list_dataset_freshness_calls_repo():
     class DummyTenantRepository:
         """Stub tenant repository (unused)."""
 
-        def admin_list(self, _db_session, _name_contains, _plan, _limit, _offset):
+        def admin_list(
+            self, _db_session, _name_contains, _plan, _limit, _offset, _cursor
+        ):
             """Not used in this test."""
             raise AssertionError("not used")
 
@@ -198,6 +220,7 @@ def test_admin_service_list_dataset_freshness_calls_repo():
             _business_type,
             _limit,
             _offset,
+            _cursor,
         ):
             """Not used in this test."""
             raise AssertionError("not used")
@@ -208,6 +231,7 @@ def test_admin_service_list_dataset_freshness_calls_repo():
             tenant_repository=DummyTenantRepository(),
             data_freshness_repository=FakeDataFreshnessRepository(),
             report_jobs_repository=DummyReportJobsRepository(),
+            admin_dashboard_repository=object(),
         )
     )
     result = service.list_dataset_freshness(expected_db)
@@ -215,9 +239,11 @@ def test_admin_service_list_dataset_freshness_calls_repo():
 
 
 def test_admin_service_list_report_jobs_passes_filters():
-    """`AdminService.list_report_jobs` forwards filters to repository."""
+    """`AdminService.list_report_jobs` forwards filters and cursor to repository."""
     expected_db = object()
     expected_tenant_id = uuid4()
+    expected_cursor = (datetime(2026, 1, 2, tzinfo=timezone.utc), uuid4())
+    next_cursor = (datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4())
 
     class FakeReportJobsRepository:
         """Fake report jobs repository asserting on passed filters."""
@@ -232,6 +258,7 @@ def test_admin_service_list_report_jobs_passes_filters():
             business_type,
             limit,
             offset,
+            cursor,
         ):
             """Return canned jobs after asserting filter values."""
             assert db_session is expected_db
@@ -242,7 +269,8 @@ def test_admin_service_list_report_jobs_passes_filters():
             assert business_type == "restaurant"
             assert limit == 10
             assert offset == 0
-            return ["job1"]
+            assert cursor == expected_cursor
+            return Page(items=["job1"], total=None, next_cursor=next_cursor)
 
     class DummyUserRepository:
         """Stub user repository (unused)."""
@@ -255,6 +283,7 @@ def test_admin_service_list_report_jobs_passes_filters():
             _tenant_id,
             _limit,
             _offset,
+            _cursor,
         ):
             """Not used in this test."""
             raise AssertionError("not used")
@@ -262,7 +291,9 @@ def test_admin_service_list_report_jobs_passes_filters():
     class DummyTenantRepository:
         """Stub tenant repository (unused)."""
 
-        def admin_list(self, _db_session, _name_contains, _plan, _limit, _offset):
+        def admin_list(
+            self, _db_session, _name_contains, _plan, _limit, _offset, _cursor
+        ):
             """Not used in this test."""
             raise AssertionError("not used")
 
@@ -279,6 +310,7 @@ def test_admin_service_list_report_jobs_passes_filters():
             tenant_repository=DummyTenantRepository(),
             data_freshness_repository=DummyDataFreshnessRepository(),
             report_jobs_repository=FakeReportJobsRepository(),
+            admin_dashboard_repository=object(),
         )
     )
     result = service.list_report_jobs(
@@ -290,5 +322,61 @@ def test_admin_service_list_report_jobs_passes_filters():
         business_type="restaurant",
         limit=10,
         offset=0,
+        cursor=expected_cursor,
+    )
+    assert result == {"items": ["job1"], "total": None, "next_cursor": next_cursor}
+
+
+def test_admin_service_get_dashboard_combines_counts_and_freshness():
+    """`AdminService.get_dashboard` returns repo counts and dataset freshness."""
+    expected_db = object()
+
+    class FakeAdminDashboardRepository:
+        """Fake dashboard repository returning canned counts."""
+
+        def get_entity_counts(self, db_session):
+            """Return canned counts."""
+            assert db_session is expected_db
+            return {"users": 3, "tenants": 2, "report_jobs": 7}
+
+    class FakeDataFreshnessRepository:
+        """Fake data freshness repository."""
+
+        def list_all(self, db_session):
+            """Return canned freshness list."""
+            assert db_session is expected_db
+            return ["df1"]
+
+    service = AdminService(
+        AdminServiceDependencies(
+            user_repository=object(),
+            tenant_repository=object(),
+            data_freshness_repository=FakeDataFreshnessRepository(),
+            report_jobs_repository=object(),
+            admin_dashboard_repository=FakeAdminDashboardRepository(),
+        )
     )
-    assert result == ["job1"]
+    result = service.get_dashboard(expected_db)
+    assert result == {
+        "counts": {"users": 3, "tenants": 2, "report_jobs": 7},
+        "datasets": ["df1"],
+    }
+
+
+def test_report_jobs_admin_list_reuses_compiled_sql_per_filter_combination():
+    """A filter combination compiles once; new values only rebind parameters."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[ReportJob.__table__])
+    repository = ReportJobsRepository()
+    compiled = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record_compiled(_conn, _cursor, _statement, _params, context, _many):
+        compiled.append(context.compiled)
+
+    with Session(engine) as session:
+        for city, limit in (("Accra", 10), ("Lagos", 20), ("Nairobi", 30)):
+            repository.admin_list(session, status="PENDING", city=city, limit=limit)
+
+    assert len(compiled) == 3
+    assert all(entry is compiled[0] for entry in compiled)
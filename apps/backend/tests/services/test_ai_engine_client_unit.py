@@ -0,0 +1,283 @@
+"""Unit tests for `create_ai_engine_client` and the AI engine LLM helpers."""
+
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+from api.config import Settings
+from services import ai_engine_client
+from services.ai_engine_client import (
+    AiEngineClient,
+    OpenAiEngineClient,
+    StubAiEngineClient,
+    create_ai_engine_client,
+)
+
+
+def _settings(**overrides) -> Settings:
+    """Build settings without reading a local `.env` file."""
+    return Settings(**overrides)
+
+
+def test_clients_with_same_settings_share_openai_client():
+    """Per-request clients reuse one pooled OpenAI client."""
+    settings = _settings(openai_api_key="sk-test-shared")
+
+    first = create_ai_engine_client(settings)
+    second = create_ai_engine_client(settings)
+
+    assert first._openai_client is not None
+    assert first._openai_client is second._openai_client
+
+
+def test_injected_openai_client_is_used_as_is():
+    """An injected client bypasses the shared pool."""
+    injected = object()
+
+    client = create_ai_engine_client(
+        _settings(openai_api_key="sk-test-shared"), openai_client=injected
+    )
+
+    assert client._openai_client is injected
+
+
+def test_no_api_key_leaves_client_unconfigured():
+    """Without an API key the client stays in stub mode."""
+    client = create_ai_engine_client(_settings(openai_api_key=None))
+
+    assert isinstance(client, StubAiEngineClient)
+    assert client._openai_client is None
+
+
+def test_api_key_selects_openai_engine_client():
+    """With an API key the OpenAI-backed implementation is constructed."""
+    client = create_ai_engine_client(_settings(openai_api_key="sk-test-shared"))
+
+    assert isinstance(client, OpenAiEngineClient)
+
+
+def test_stub_client_outputs():
+    """Stub outputs are built from the payload without any LLM call."""
+    client = create_ai_engine_client(_settings(openai_api_key=None))
+
+    assert client.generate_market_summary({"city": "Accra"}) == {
+        "summary": "Market summary for Accra."
+    }
+    assert client.generate_personas({"city": "Accra"}) == {
+        "headline": "Personas for Accra",
+        "personas": [],
+    }
+    assert client.generate_opportunity_commentary([{"geo_id": "g1"}]) == {
+        "commentary": "Opportunities generated.",
+        "region_rationales": [
+            {
+                "geo_id": "g1",
+                "rationale": "Ranked based on composite opportunity score.",
+            }
+        ],
+    }
+
+
+class FakeChunk:
+    """Streamed chat-completion chunk carrying one content delta."""
+
+    def __init__(self, content: str) -> None:
+        self.choices = [SimpleNamespace(delta=SimpleNamespace(content=content))]
+
+
+class FakeStream:
+    """Iterable stream of chunks recording how many were consumed."""
+
+    def __init__(self, content: str, chunk_size: int = 4) -> None:
+        self.chunks = [
+            FakeChunk(content[start : start + chunk_size])
+            for start in range(0, len(content), chunk_size)
+        ]
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeOpenAiClient:
+    """OpenAI-like client recording streamed chat completion calls."""
+
+    def __init__(self, content: str) -> None:
+        self.calls: list[dict] = []
+        self.streams: list[FakeStream] = []
+        fake_client = self
+
+        class Completions:
+            """Fake `chat.completions` namespace."""
+
+            def create(self, **kwargs):
+                """Record the call and return a canned stream."""
+                fake_client.calls.append(kwargs)
+                stream = FakeStream(content)
+                fake_client.streams.append(stream)
+                return stream
+
+        class Chat:
+            """Fake `chat` namespace."""
+
+            completions = Completions()
+
+        self.chat = Chat()
+
+
+def test_identical_llm_requests_are_served_from_cache():
+    """A repeated grounded payload does not trigger a second LLM call."""
+    ai_engine_client._LLM_RESPONSE_CACHE.clear()
+    fake_openai = FakeOpenAiClient('{"summary": "cached"}')
+    client = create_ai_engine_client(_settings(), openai_client=fake_openai)
+
+    first = client.generate_market_summary({"city": "Accra", "country": "GH"})
+    second = client.generate_market_summary({"country": "GH", "city": "Accra"})
+
+    assert first == second == {"summary": "cached"}
+    assert len(fake_openai.calls) == 1
+
+
+def test_cached_responses_are_not_shared_between_callers():
+    """Mutating a returned result does not corrupt the cached entry."""
+    ai_engine_client._LLM_RESPONSE_CACHE.clear()
+    fake_openai = FakeOpenAiClient('{"region_rationales": []}')
+    client = create_ai_engine_client(_settings(), openai_client=fake_openai)
+
+    first = client.generate_opportunity_commentary([{"geo_id": "g1"}])
+    second = client.generate_opportunity_commentary([{"geo_id": "g1"}])
+
+    assert first["commentary"] == "AI commentary generated."
+    assert second == {
+        "region_rationales": [],
+        "commentary": "AI commentary generated.",
+    }
+    assert len(fake_openai.calls) == 1
+
+
+def test_llm_cache_stores_sanitized_compact_bytes():
+    """Cache entries are compact JSON bytes with numeric values already nulled."""
+    ai_engine_client._LLM_RESPONSE_CACHE.clear()
+    fake_openai = FakeOpenAiClient('{\n  "summary": "s",\n  "score": 7\n}')
+    client = create_ai_engine_client(_settings(), openai_client=fake_openai)
+
+    first = client.generate_market_summary({"city": "Accra"})
+    second = client.generate_market_summary({"city": "Accra"})
+
+    (cache_key,) = ai_engine_client._LLM_RESPONSE_CACHE._entries
+    _expires_at, cached = ai_engine_client._LLM_RESPONSE_CACHE._entries[cache_key]
+    assert cached == b'{"summary":"s","score":null}'
+    assert first == second == {"summary": "s", "score": None}
+    assert first is not second
+
+
+def test_llm_cache_can_be_disabled_via_settings():
+    """`LLM_CACHE_ENABLED=false` always calls the model."""
+    ai_engine_client._LLM_RESPONSE_CACHE.clear()
+    fake_openai = FakeOpenAiClient('{"summary": "fresh"}')
+    client = create_ai_engine_client(
+        _settings(llm_cache_enabled=False), openai_client=fake_openai
+    )
+
+    client.generate_market_summary({"city": "Accra"})
+    client.generate_market_summary({"city": "Accra"})
+
+    assert len(fake_openai.calls) == 2
+
+
+def test_llm_stream_is_closed_once_json_object_completes():
+    """Chunks after the closing brace are neither read nor parsed."""
+    ai_engine_client._LLM_RESPONSE_CACHE.clear()
+    fake_openai = FakeOpenAiClient(
+        '{"summary": "a } in \\"text\\""} trailing tokens that are not JSON'
+    )
+    client = create_ai_engine_client(_settings(), openai_client=fake_openai)
+
+    result = client.generate_market_summary({"city": "Accra"})
+
+    stream = fake_openai.streams[0]
+    assert result == {"summary": 'a } in "text"'}
+    assert fake_openai.calls[0]["stream"] is True
+    assert stream.closed
+    assert stream.consumed < len(stream.chunks)
+
+
+def test_strip_numeric_values_nulls_nested_numbers_in_place():
+    """Numeric leaves are nulled in place at every depth."""
+    payload = {
+        "summary": "text",
+        "score": 9.5,
+        "highlights": ["a", 3, {"count": 12, "note": "n"}],
+        "nested": {"deeper": [[1.5, "x"]]},
+    }
+
+    result = AiEngineClient._strip_numeric_values(payload)
+
+    assert result is payload
+    assert result == {
+        "summary": "text",
+        "score": None,
+        "highlights": ["a", None, {"count": None, "note": "n"}],
+        "nested": {"deeper": [[None, "x"]]},
+    }
+
+
+def test_strip_numeric_values_keeps_booleans():
+    """Booleans are not treated as numeric facts."""
+    payload = {"is_recommended": True, "flags": [False, 2]}
+
+    result = AiEngineClient._strip_numeric_values(payload)
+
+    assert result == {"is_recommended": True, "flags": [False, None]}
+
+
+def test_strip_numeric_values_handles_deep_nesting():
+    """Deeply nested responses do not hit the recursion limit."""
+    payload: dict = {"value": 1}
+    for _ in range(5000):
+        payload = {"child": payload}
+
+    AiEngineClient._strip_numeric_values(payload)
+
+    node = payload
+    while "child" in node:
+        node = node["child"]
+    assert node == {"value": None}
+
+
+def test_llm_payload_serializes_decimals_and_uuids():
+    """DB-derived values (Decimal, UUID) are serialized into the user message."""
+    ai_engine_client._LLM_RESPONSE_CACHE.clear()
+    fake_openai = FakeOpenAiClient('{"summary": "ok"}')
+    client = create_ai_engine_client(_settings(), openai_client=fake_openai)
+    tenant_id = uuid4()
+
+    client.generate_market_summary(
+        {"city": "Accra", "tenant_id": tenant_id, "median_income": Decimal("1.5")}
+    )
+
+    user_message = fake_openai.calls[0]["messages"][1]["content"]
+    assert json.loads(user_message) == {
+        "city": "Accra",
+        "median_income": "1.5",
+        "tenant_id": str(tenant_id),
+    }
+
+
+def test_invalid_llm_json_falls_back_to_stub_summary():
+    """Malformed model output yields the fallback summary."""
+    ai_engine_client._LLM_RESPONSE_CACHE.clear()
+    client = create_ai_engine_client(
+        _settings(), openai_client=FakeOpenAiClient("not json")
+    )
+
+    result = client.generate_market_summary({"city": "Accra"})
+
+    assert result == {"summary": "Market summary for Accra is unavailable currently."}
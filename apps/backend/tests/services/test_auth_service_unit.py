@@ -0,0 +1,121 @@
+"""Unit tests for `AuthService.get_current_user_profile`."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from services.auth_service import AuthService
+from services.dependencies import AuthServiceDependencies
+
+
+class DummyTenantRepository:
+    """Stub tenant repository (tenant comes from the joined user row)."""
+
+    def get_by_id(self, _db_session, _tenant_id):
+        """Not used; the tenant is eagerly loaded with the user."""
+        raise AssertionError("not used")
+
+
+def test_get_current_user_profile_uses_joined_tenant():
+    """Profile is built from one joined user+tenant lookup."""
+    expected_db = object()
+    user_id = uuid4()
+    expected_tenant_id = uuid4()
+    now = datetime.now(timezone.utc)
+
+    class FakeTenant:
+        """Minimal tenant row."""
+
+        id = expected_tenant_id
+        name = "Acme"
+        plan = "starter"
+        created_at = now
+        updated_at = now
+
+    class FakeUser:
+        """Minimal user row with eagerly loaded tenant."""
+
+        id = user_id
+        tenant_id = expected_tenant_id
+        email = "test@example.com"
+        name = "Test User"
+        role = "USER"
+        created_at = now
+        tenant = FakeTenant()
+
+    class FakeUserRepository:
+        """Fake user repository returning a user with its tenant."""
+
+        def get_by_id_with_tenant(self, db_session, requested_user_id):
+            """Return the canned user after asserting inputs."""
+            assert db_session is expected_db
+            assert requested_user_id == user_id
+            return FakeUser()
+
+    service = AuthService(
+        AuthServiceDependencies(
+            user_repository=FakeUserRepository(),
+            tenant_repository=DummyTenantRepository(),
+        )
+    )
+
+    result = service.get_current_user_profile(expected_db, user_id)
+
+    assert result["user"].id == user_id
+    assert result["tenant"].id == expected_tenant_id
+    assert result["tenant"].name == "Acme"
+
+
+def test_get_current_user_profile_missing_user_raises_404():
+    """Missing user yields a 404."""
+
+    class FakeUserRepository:
+        """Fake user repository returning no user."""
+
+        def get_by_id_with_tenant(self, _db_session, _user_id):
+            """Return no user."""
+            return None
+
+    service = AuthService(
+        AuthServiceDependencies(
+            user_repository=FakeUserRepository(),
+            tenant_repository=DummyTenantRepository(),
+        )
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.get_current_user_profile(None, uuid4())
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "User not found"
+
+
+def test_get_current_user_profile_missing_tenant_raises_404():
+    """User without a tenant row yields a 404."""
+
+    class FakeUser:
+        """User row whose tenant relationship is empty."""
+
+        tenant = None
+
+    class FakeUserRepository:
+        """Fake user repository returning a user without tenant."""
+
+        def get_by_id_with_tenant(self, _db_session, _user_id):
+            """Return a user with no tenant."""
+            return FakeUser()
+
+    service = AuthService(
+        AuthServiceDependencies(
+            user_repository=FakeUserRepository(),
+            tenant_repository=DummyTenantRepository(),
+        )
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.get_current_user_profile(None, uuid4())
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "Tenant not found"
@@ -5,6 +5,7 @@ from uuid import uuid4
 import pytest
 from fastapi import HTTPException
 
+from api.config import Settings
 from services.billing_service import BillingService
 from services.dependencies import BillingServiceDependencies
 
@@ -169,3 +170,146 @@ def test_create_checkout_session_calls_stripe_client():
         db_session=None, tenant_id=expected_tenant_id, target_plan="starter"
     )
     assert result["checkout_session_id"] == "cs_test"
+
+
+def _quota_settings(quota_by_plan: dict[str, int]) -> Settings:
+    """Build settings with report quotas, ignoring any local `.env` file."""
+    return Settings(report_quota_by_plan=quota_by_plan)
+
+
+class _StarterBillingRepository:
+    """Fake billing repository returning a starter account."""
+
+    def get_billing_account(self, _db_session, _tenant_id):
+        """Return a canned starter billing account."""
+
+        class FakeBillingAccount:
+            plan = "starter"
+            status = "active"
+
+        return FakeBillingAccount()
+
+
+class _CountingUsageRepository:
+    """Fake usage repository returning a fixed monthly report count."""
+
+    def __init__(self, report_count: int) -> None:
+        self.report_count = report_count
+        self.since_values: list = []
+
+    def count_report_jobs_since(self, _db_session, _tenant_id, since):
+        """Record the window start and return the canned count."""
+        self.since_values.append(since)
+        return self.report_count
+
+
+class _DummyStripeClient:
+    """Stub stripe client."""
+
+    def create_checkout_session(self, _tenant_id: str, _target_plan: str):
+        """Return empty session payload."""
+        return {}
+
+
+def test_check_report_quota_is_unlimited_without_configured_quotas():
+    """With no quotas configured, no repository lookups are made."""
+
+    class UnusedBillingRepository:
+        """Billing repository that must not be called."""
+
+        def get_billing_account(self, _db_session, _tenant_id):
+            """Not used in this test."""
+            raise AssertionError("not used")
+
+    service = BillingService(
+        BillingServiceDependencies(
+            billing_repository=UnusedBillingRepository(),
+            usage_repository=_CountingUsageRepository(report_count=999),
+            stripe_client=_DummyStripeClient(),
+        ),
+        settings=_quota_settings({}),
+    )
+
+    assert service.check_report_quota(db_session=None, tenant_id=uuid4()) is True
+
+
+def test_check_report_quota_compares_monthly_count_to_plan_limit():
+    """The plan limit is enforced against this month's report count."""
+    under_limit_usage = _CountingUsageRepository(report_count=2)
+    at_limit_usage = _CountingUsageRepository(report_count=3)
+    settings = _quota_settings({"starter": 3})
+
+    def build_service(usage_repository):
+        return BillingService(
+            BillingServiceDependencies(
+                billing_repository=_StarterBillingRepository(),
+                usage_repository=usage_repository,
+                stripe_client=_DummyStripeClient(),
+            ),
+            settings=settings,
+        )
+
+    assert build_service(under_limit_usage).check_report_quota(None, uuid4()) is True
+    assert build_service(at_limit_usage).check_report_quota(None, uuid4()) is False
+    month_start = under_limit_usage.since_values[0]
+    assert (month_start.day, month_start.hour, month_start.minute) == (1, 0, 0)
+    assert month_start.tzinfo is not None
+
+
+def test_check_report_quota_ignores_plans_without_a_limit():
+    """Plans missing from the quota map are unlimited."""
+    service = BillingService(
+        BillingServiceDependencies(
+            billing_repository=_StarterBillingRepository(),
+            usage_repository=_CountingUsageRepository(report_count=100),
+            stripe_client=_DummyStripeClient(),
+        ),
+        settings=_quota_settings({"pro": 1}),
+    )
+
+    assert service.check_report_quota(db_session=None, tenant_id=uuid4()) is True
+
+
+def test_billing_account_lookup_is_cached_until_invalidated():
+    """Repeated plan lookups hit the repository once per tenant until invalidated."""
+    tenant_id = uuid4()
+    lookups: list = []
+
+    class CountingBillingRepository(_StarterBillingRepository):
+        """Billing repository counting lookups."""
+
+        def get_billing_account(self, db_session, lookup_tenant_id):
+            """Record the lookup and return a starter account."""
+            lookups.append(lookup_tenant_id)
+            return super().get_billing_account(db_session, lookup_tenant_id)
+
+    class FakeUsageRepository:
+        """Fake usage repository."""
+
+        def get_current_usage(self, _db_session, _tenant_id):
+            """Return canned usage."""
+            return {"reports": 1}
+
+    service = BillingService(
+        BillingServiceDependencies(
+            billing_repository=CountingBillingRepository(),
+            usage_repository=FakeUsageRepository(),
+            stripe_client=_DummyStripeClient(),
+        )
+    )
+
+    first = service.get_plan_and_usage(db_session=None, tenant_id=tenant_id)
+    second = service.get_plan_and_usage(db_session=None, tenant_id=tenant_id)
+    BillingService.invalidate_billing_account(tenant_id)
+    service.get_plan_and_usage(db_session=None, tenant_id=tenant_id)
+
+    assert (
+        first
+        == second
+        == {
+            "plan": "starter",
+            "status": "active",
+            "usage": {"reports": 1},
+        }
+    )
+    assert lookups == [tenant_id, tenant_id]
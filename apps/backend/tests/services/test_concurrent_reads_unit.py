@@ -0,0 +1,52 @@
+"""Unit tests for `services.concurrent_reads`."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from services.concurrent_reads import ConcurrentReader
+
+
+def test_concurrent_reader_runs_each_read_in_its_own_worker_session():
+    """Every read gets a fresh session on a worker thread; order is kept."""
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    seen = []
+
+    def read(value):
+        def _read(session):
+            seen.append((session, threading.current_thread()))
+            return session.execute(text(f"SELECT {value}")).scalar_one()
+
+        return _read
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        reader = ConcurrentReader(sessionmaker(bind=engine), executor)
+        results = reader.run(read(1), read(2), read(3))
+
+    assert results == [1, 2, 3]
+    sessions = {id(session) for session, _ in seen}
+    assert len(sessions) == 3
+    assert all(thread is not threading.main_thread() for _, thread in seen)
+
+
+def test_concurrent_reader_closes_worker_sessions():
+    """Each worker session is closed once its read returns."""
+    closed = []
+
+    class FakeSession:
+        """Context-managed session double recording its close."""
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc_info):
+            closed.append(self)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reader = ConcurrentReader(FakeSession, executor)
+        results = reader.run(lambda session: "a", lambda session: "b")
+
+    assert results == ["a", "b"]
+    assert len(closed) == 2
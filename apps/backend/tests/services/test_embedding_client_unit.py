@@ -0,0 +1,184 @@
+"""Unit tests for `EmbeddingClient` stub embeddings."""
+
+import hashlib
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from api.config import Settings
+from services import embedding_client
+from services.embedding_client import EmbeddingClient
+
+
+def _stub_client(dimensions: int) -> EmbeddingClient:
+    """Build a stub-mode client without reading a local `.env` file."""
+    settings = Settings(openai_api_key=None)
+    return EmbeddingClient(settings=settings, dimensions=dimensions)
+
+
+def test_stub_embedding_is_deterministic_and_sized():
+    """Stub embeddings are stable per text and have the configured dimension."""
+    client = _stub_client(dimensions=100)
+
+    embeddings = client.embed_texts(["coffee", "coffee", "bakery"])
+    first, second, other = embeddings
+
+    assert embeddings.shape == (3, 100)
+    assert embeddings.dtype == np.float32
+    assert np.array_equal(first, second)
+    assert not np.array_equal(first, other)
+    assert np.all((embeddings >= -1.0) & (embeddings <= 1.0))
+
+
+def test_stub_embedding_maps_digest_bytes_to_unit_range():
+    """Each dimension maps the repeating sha256 digest bytes onto -1..1."""
+    client = _stub_client(dimensions=40)
+    digest = hashlib.sha256("coffee".encode("utf-8")).digest()
+
+    (embedding,) = client.embed_texts(["coffee"])
+
+    expected = [(digest[idx % len(digest)] / 127.5) - 1.0 for idx in range(40)]
+    assert embedding.tolist() == pytest.approx(expected, abs=1e-6)
+
+
+def test_stub_embeddings_are_memoized_and_copied_into_a_fresh_array():
+    """Repeat texts hit the cache but callers never share the cached vector."""
+    client = _stub_client(dimensions=16)
+    embedding_client._stub_embedding_cached.cache_clear()
+
+    embeddings = client.embed_texts(["coffee", "coffee"])
+    embeddings[0, 0] = 5.0
+    (third,) = client.embed_texts(["coffee"])
+
+    assert np.array_equal(embeddings[1], third)
+    assert third[0] != 5.0
+    info = embedding_client._stub_embedding_cached.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_embed_texts_fills_float32_rows_from_openai_response():
+    """OpenAI embeddings are copied into a `(N, dimensions)` float32 array."""
+
+    class FakeItem:
+        def __init__(self, index, embedding):
+            self.index = index
+            self.embedding = embedding
+
+    class FakeEmbeddings:
+        def create(self, *, model, input, dimensions):
+            assert dimensions == 3
+            data = [FakeItem(index, [0.5, -0.5, 1.0]) for index in range(len(input))]
+            return type("Resp", (), {"data": data})()
+
+    class FakeOpenAi:
+        embeddings = FakeEmbeddings()
+
+    client = EmbeddingClient(
+        settings=_stub_client(dimensions=3)._settings,
+        dimensions=3,
+        openai_client=FakeOpenAi(),
+    )
+
+    embeddings = client.embed_texts(["a", "b"])
+
+    assert embeddings.dtype == np.float32
+    assert embeddings.tolist() == [[0.5, -0.5, 1.0], [0.5, -0.5, 1.0]]
+
+
+def test_clients_with_same_settings_share_openai_client():
+    """Embedding clients built from the same settings reuse one pooled client."""
+    settings = Settings(openai_api_key="sk-test-embeddings")
+
+    first = EmbeddingClient(settings=settings)
+    second = EmbeddingClient(settings=settings)
+
+    assert first._openai_client is not None
+    assert first._openai_client is second._openai_client
+
+
+def test_embed_texts_splits_large_inputs_into_ordered_batches():
+    """Inputs over the batch size are sent in chunks and reassembled in order."""
+    batch_sizes = []
+
+    class FakeItem:
+        def __init__(self, index, embedding):
+            self.index = index
+            self.embedding = embedding
+
+    class FakeEmbeddings:
+        def create(self, *, model, input, dimensions):
+            batch_sizes.append(len(input))
+            data = [
+                FakeItem(index, [float(text)] * dimensions)
+                for index, text in enumerate(input)
+            ]
+            return type("Resp", (), {"data": data})()
+
+    class FakeOpenAi:
+        embeddings = FakeEmbeddings()
+
+    client = EmbeddingClient(
+        settings=_stub_client(dimensions=2)._settings,
+        dimensions=2,
+        openai_client=FakeOpenAi(),
+    )
+
+    embeddings = client.embed_texts([str(index) for index in range(300)])
+
+    assert sorted(batch_sizes) == [44, 128, 128]
+    assert embeddings[:, 0].tolist() == [float(index) for index in range(300)]
+
+
+def _openai_client_returning(data):
+    """Build a fake OpenAI client whose embeddings response carries `data`."""
+
+    class FakeEmbeddings:
+        def create(self, *, model, input, dimensions):
+            return SimpleNamespace(data=data)
+
+    return SimpleNamespace(embeddings=FakeEmbeddings())
+
+
+def test_embed_texts_places_rows_by_response_index():
+    """Rows are written at each item's `index`, whatever the response order."""
+    client = EmbeddingClient(
+        settings=_stub_client(dimensions=2)._settings,
+        dimensions=2,
+        openai_client=_openai_client_returning(
+            [
+                SimpleNamespace(index=1, embedding=[1.0, 1.0]),
+                SimpleNamespace(index=0, embedding=[0.0, 0.0]),
+            ]
+        ),
+    )
+
+    assert client.embed_texts(["a", "b"]).tolist() == [[0.0, 0.0], [1.0, 1.0]]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        [SimpleNamespace(index=0, embedding=[0.0, 0.0])],
+        [
+            SimpleNamespace(index=0, embedding=[0.0, 0.0]),
+            SimpleNamespace(index=1, embedding=[1.0]),
+        ],
+        [
+            SimpleNamespace(index=0, embedding=[0.0, 0.0]),
+            SimpleNamespace(index=0, embedding=[1.0, 1.0]),
+        ],
+    ],
+    ids=["missing-row", "wrong-dimension", "duplicate-index"],
+)
+def test_embed_texts_rejects_incomplete_responses(data):
+    """Short, mis-sized or duplicated responses raise instead of leaving gaps."""
+    client = EmbeddingClient(
+        settings=_stub_client(dimensions=2)._settings,
+        dimensions=2,
+        openai_client=_openai_client_returning(data),
+    )
+
+    with pytest.raises(ValueError):
+        client.embed_texts(["a", "b"])
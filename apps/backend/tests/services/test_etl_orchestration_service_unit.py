@@ -0,0 +1,105 @@
+"""Unit tests for `ETLOrchestrationService.trigger_adhoc_etl` payloads."""
+
+from uuid import uuid4
+
+import orjson
+from fastapi import BackgroundTasks
+
+from services.dependencies import EtlOrchestrationServiceDependencies
+from services.etl_orchestration_service import ETLOrchestrationService
+
+
+class FakePubSubClient:
+    """Fake pubsub client recording published messages per topic."""
+
+    def __init__(self):
+        self.published = []
+
+    def publish_ingestion_job(self, topic, message, raw_message=None):
+        """Record an ingestion job message."""
+        self.published.append((topic, message, raw_message))
+
+    def publish_embedding_job(self, topic, message, raw_message=None):
+        """Record an embedding job message."""
+        self.published.append((topic, message, raw_message))
+
+
+def _service(pubsub_client):
+    return ETLOrchestrationService(
+        EtlOrchestrationServiceDependencies(pubsub_client=pubsub_client)
+    )
+
+
+def test_trigger_adhoc_etl_publishes_ingestion_job():
+    """Regular datasets are queued on the ingestion topic."""
+    pubsub_client = FakePubSubClient()
+    user_id, tenant_id = uuid4(), uuid4()
+
+    result = _service(pubsub_client).trigger_adhoc_etl(
+        object(),
+        dataset=" demographics ",
+        country="CA",
+        city="Toronto",
+        options={"full_refresh": True},
+        triggered_by_user_id=user_id,
+        triggered_by_tenant_id=tenant_id,
+    )
+
+    assert result["status"] == "QUEUED"
+    ((topic, payload, raw_message),) = pubsub_client.published
+    assert topic == "ingestion-jobs"
+    assert payload is result["payload"]
+    assert raw_message is result["payload_json"]
+    assert orjson.loads(raw_message) == payload
+    assert payload["job_name"] == "adhoc-etl-run"
+    assert payload["dataset"] == "demographics"
+    assert payload["force_full_refresh"] is True
+    assert payload["triggered_by_user_id"] == str(user_id)
+    assert payload["triggered_by_tenant_id"] == str(tenant_id)
+
+
+def test_trigger_adhoc_etl_routes_embedding_datasets():
+    """Embedding datasets are queued as rebuild-embeddings jobs."""
+    pubsub_client = FakePubSubClient()
+
+    _service(pubsub_client).trigger_adhoc_etl(
+        object(),
+        dataset="vector_insights",
+        country=None,
+        city="Toronto",
+        options={"regions": ["r1"]},
+        triggered_by_user_id=uuid4(),
+        triggered_by_tenant_id=uuid4(),
+    )
+
+    ((topic, payload, raw_message),) = pubsub_client.published
+    assert topic == "embedding-jobs"
+    assert orjson.loads(raw_message) == payload
+    assert payload["job_name"] == "rebuild-embeddings"
+    assert payload["regions"] == ["r1"]
+    assert "force_full_refresh" not in payload
+
+
+def test_trigger_adhoc_etl_defers_publish_to_background_tasks():
+    """With `background_tasks`, nothing is published until the tasks run."""
+    pubsub_client = FakePubSubClient()
+    background_tasks = BackgroundTasks()
+
+    result = _service(pubsub_client).trigger_adhoc_etl(
+        object(),
+        dataset="demographics",
+        country="CA",
+        city="Toronto",
+        options=None,
+        triggered_by_user_id=uuid4(),
+        triggered_by_tenant_id=uuid4(),
+        background_tasks=background_tasks,
+    )
+
+    assert pubsub_client.published == []
+    (task,) = background_tasks.tasks
+    task.func(*task.args, **task.kwargs)
+    ((topic, payload, raw_message),) = pubsub_client.published
+    assert topic == "ingestion-jobs"
+    assert payload is result["payload"]
+    assert raw_message is result["payload_json"]
@@ -1,10 +1,21 @@
 """Unit tests for `InsightService.generate_market_summary`."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
-
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+import models.core  # noqa: F401  (registers `tenants` for the market table FKs)
+from models.db import Base
+from models.market import Demographics, LabourStats, Spending
+from repositories.demographics_repository import DemographicsRepository
+from repositories.labour_stats_repository import LabourStatsRepository
+from repositories.spending_repository import SpendingRepository
+from services.concurrent_reads import ConcurrentReader
 from services.dependencies import InsightServiceDependencies
 from services.insight_service import InsightService
 
@@ -15,7 +26,7 @@ def test_generate_market_summary_merges_stats_and_ai():
     class FakeDemographicsRepository:
         """Fake demographics repository."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return one demographics row."""
 
             class FakeRow:
@@ -30,14 +41,14 @@ def test_generate_market_summary_merges_stats_and_ai():
     class FakeSpendingRepository:
         """Fake spending repository."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return no spending rows."""
             return []
 
     class FakeLabourStatsRepository:
         """Fake labour stats repository."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return no labour rows."""
             return []
 
@@ -79,6 +90,8 @@ def test_generate_market_summary_merges_stats_and_ai():
     assert result["city"] == "Accra"
     assert result["ai_summary"] == {"summary": "ai"}
     assert "stats_used" in result
+    for section in ("demographics", "spending", "labour_stats"):
+        assert result["stats_used"][section] is result["stats"][section]
 
 
 def test_generate_market_summary_raises_404_when_no_data():
@@ -87,21 +100,21 @@ def test_generate_market_summary_raises_404_when_no_data():
     class EmptyDemographicsRepository:
         """Empty demographics repository."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return empty list."""
             return []
 
     class EmptySpendingRepository:
         """Empty spending repository."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return empty list."""
             return []
 
     class EmptyLabourStatsRepository:
         """Empty labour stats repository."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return empty list."""
             return []
 
@@ -140,3 +153,184 @@ def test_generate_market_summary_raises_404_when_no_data():
         )
 
     assert exc_info.value.status_code == 404
+
+
+def test_generate_market_summary_reads_market_tables_concurrently(tmp_path):
+    """Market table reads run on worker sessions, never the request session."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'market.db'}")
+    Base.metadata.create_all(
+        engine,
+        tables=[Demographics.__table__, Spending.__table__, LabourStats.__table__],
+    )
+    with Session(engine) as seed_session:
+        seed_session.add_all(
+            [
+                Demographics(
+                    geo_id="accra-1",
+                    country="GH",
+                    city="Accra",
+                    population_total=1000,
+                    median_income=200,
+                ),
+                Spending(
+                    geo_id="accra-1",
+                    country="GH",
+                    city="Accra",
+                    category="food",
+                    avg_monthly_spend=50,
+                ),
+                LabourStats(
+                    geo_id="accra-1", country="GH", city="Accra", job_openings=7
+                ),
+            ]
+        )
+        seed_session.commit()
+
+    request_session = Session(engine)
+    reader_sessions = {}
+    read_executor = ThreadPoolExecutor(max_workers=3)
+
+    class RecordingSpendingRepository(SpendingRepository):
+        """Spending repository recording which session/thread served it."""
+
+        def get_for_regions(self, db_session, city, country, geo_ids=None):
+            reader_sessions["spending"] = (db_session, threading.current_thread())
+            return super().get_for_regions(db_session, city, country, geo_ids)
+
+    class FakeAiClient:
+        """Fake AI client."""
+
+        def generate_market_summary(self, _payload):
+            """Return canned AI summary."""
+            return {"summary": "ai"}
+
+    service = InsightService(
+        InsightServiceDependencies(
+            demographics_repository=DemographicsRepository(),
+            spending_repository=RecordingSpendingRepository(),
+            labour_stats_repository=LabourStatsRepository(),
+            opportunity_scores_repository=object(),
+            ai_engine_client=FakeAiClient(),
+            concurrent_reader=ConcurrentReader(
+                sessionmaker(bind=engine), read_executor
+            ),
+        )
+    )
+
+    result = service.generate_market_summary(
+        db_session=request_session,
+        city="Accra",
+        country="GH",
+        tenant_id=uuid4(),
+    )
+    read_executor.shutdown()
+    request_session.close()
+
+    stats = result["stats"]
+    assert stats["demographics"]["population_total"] == [1000]
+    assert stats["spending"]["avg_monthly_spend"] == [50.0]
+    assert stats["labour_stats"]["job_openings"] == [7]
+    spending_session, spending_thread = reader_sessions["spending"]
+    assert spending_session is not request_session
+    assert spending_thread is not threading.main_thread()
+
+
+def test_generate_market_summary_pushes_regions_to_repositories():
+    """Requested regions are passed to each repository as a `geo_ids` filter."""
+    seen_geo_ids = []
+
+    class FilteringRepository:
+        """Fake repository recording the requested `geo_ids`."""
+
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
+            """Record the filter and return no rows."""
+            seen_geo_ids.append(geo_ids)
+            return []
+
+    class FakeDemographicsRepository(FilteringRepository):
+        """Fake demographics repository returning one filtered row."""
+
+        def get_for_regions(self, db_session, city, country, geo_ids=None):
+            """Return a row for the requested region."""
+            super().get_for_regions(db_session, city, country, geo_ids)
+
+            class FakeRow:
+                """Row-like fixture for demographics."""
+
+                geo_id = "accra-2"
+                population_total = 500
+                median_income = None
+
+            return [FakeRow()]
+
+    class FakeAiClient:
+        """Fake AI client."""
+
+        def generate_market_summary(self, _payload):
+            """Return canned AI summary."""
+            return {"summary": "ai"}
+
+    service = InsightService(
+        InsightServiceDependencies(
+            demographics_repository=FakeDemographicsRepository(),
+            spending_repository=FilteringRepository(),
+            labour_stats_repository=FilteringRepository(),
+            opportunity_scores_repository=object(),
+            ai_engine_client=FakeAiClient(),
+        )
+    )
+
+    result = service.generate_market_summary(
+        db_session=None,
+        city="Accra",
+        country=None,
+        tenant_id=uuid4(),
+        regions=["accra-2"],
+    )
+
+    assert seen_geo_ids == [["accra-2"]] * 3
+    assert result["stats"]["demographics"]["geo_id"] == ["accra-2"]
+
+
+def test_generate_market_summary_unmatched_regions_return_empty_sections():
+    """Regions matching no rows in a city with data give empty sections, not 404."""
+    seen_geo_ids = []
+
+    class CityRepository:
+        """Fake repository with data only for the whole city."""
+
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
+            """Record the filter; only the unfiltered read returns rows."""
+            seen_geo_ids.append(geo_ids)
+            return [] if geo_ids else [object()]
+
+    class FakeAiClient:
+        """Fake AI client."""
+
+        def generate_market_summary(self, _payload):
+            """Return canned AI summary."""
+            return {"summary": "ai"}
+
+    service = InsightService(
+        InsightServiceDependencies(
+            demographics_repository=CityRepository(),
+            spending_repository=CityRepository(),
+            labour_stats_repository=CityRepository(),
+            opportunity_scores_repository=object(),
+            ai_engine_client=FakeAiClient(),
+        )
+    )
+
+    result = service.generate_market_summary(
+        db_session=None,
+        city="Accra",
+        country=None,
+        tenant_id=uuid4(),
+        regions=["unknown-region"],
+    )
+
+    assert seen_geo_ids == [["unknown-region"]] * 3 + [None] * 3
+    assert result["stats"]["demographics"]["geo_id"] == []
+    assert result["stats"]["spending"]["category"] == []
+    assert result["stats"]["labour_stats"]["job_openings"] == []
+    assert result["ai_summary"] == {"summary": "ai"}
@@ -225,3 +225,145 @@ def test_find_opportunities_sorts_and_falls_back_when_ai_fails():
         "accra-low",
     ]
     assert "commentary" in result["ai_commentary"]
+
+
+def test_find_opportunities_max_competition_excludes_unscored_rows():
+    """`max_competition_score` drops rows above the cap or without a score."""
+
+    class FakeOpportunityRepository:
+        """Fake opportunity repository returning three rows."""
+
+        def list_by_city_and_business_type(
+            self, _db_session, _city, _country, _business_type
+        ):
+            """Return canned rows."""
+            return [
+                FakeOpportunityRow("accra-1", 0.9, 0.7),
+                FakeOpportunityRow("accra-2", 0.4, 0.1),
+                FakeOpportunityRow("accra-3", 0.8, None),
+            ]
+
+    class FakeAiClient:
+        """Fake AI client returning canned commentary."""
+
+        def generate_opportunity_commentary(self, _ranked_regions):
+            """Return canned commentary."""
+            return {"commentary": "ai"}
+
+    service = InsightService(
+        InsightServiceDependencies(
+            demographics_repository=object(),
+            spending_repository=object(),
+            labour_stats_repository=object(),
+            opportunity_scores_repository=FakeOpportunityRepository(),
+            ai_engine_client=FakeAiClient(),
+        )
+    )
+
+    result = service.find_opportunities(
+        db_session=None,
+        city="Accra",
+        business_type="retail",
+        constraints={"max_competition_score": 0.5},
+        country=None,
+        tenant_id=uuid4(),
+    )
+
+    assert [r["geo_id"] for r in result["opportunities"]] == ["accra-2"]
+
+
+def test_find_opportunities_top_k_returns_best_regions_in_order():
+    """`top_k` keeps only the highest composite scores, ranked descending."""
+
+    class FakeOpportunityRepository:
+        """Fake opportunity repository returning four rows."""
+
+        def list_by_city_and_business_type(
+            self, _db_session, _city, _country, _business_type
+        ):
+            """Return canned rows."""
+            return [
+                FakeOpportunityRow("accra-1", 0.3, 0.1),
+                FakeOpportunityRow("accra-2", 0.9, 0.1),
+                FakeOpportunityRow("accra-3", None, 0.1),
+                FakeOpportunityRow("accra-4", 0.6, 0.1),
+            ]
+
+    class FakeAiClient:
+        """Fake AI client returning canned commentary."""
+
+        def generate_opportunity_commentary(self, ranked_regions):
+            """Return commentary for ranked regions."""
+            assert len(ranked_regions) == 2
+            return {"commentary": "ai"}
+
+    service = InsightService(
+        InsightServiceDependencies(
+            demographics_repository=object(),
+            spending_repository=object(),
+            labour_stats_repository=object(),
+            opportunity_scores_repository=FakeOpportunityRepository(),
+            ai_engine_client=FakeAiClient(),
+        )
+    )
+
+    result = service.find_opportunities(
+        db_session=None,
+        city="Accra",
+        business_type="retail",
+        constraints=None,
+        country=None,
+        tenant_id=uuid4(),
+        top_k=2,
+    )
+
+    assert [r["geo_id"] for r in result["opportunities"]] == ["accra-2", "accra-4"]
+
+
+def test_find_opportunities_stats_used_reports_count_not_regions():
+    """`stats_used` records the region count instead of repeating the list."""
+
+    class FakeOpportunityRepository:
+        """Fake opportunity repository returning two rows."""
+
+        def list_by_city_and_business_type(
+            self, _db_session, _city, _country, _business_type
+        ):
+            """Return canned rows."""
+            return [
+                FakeOpportunityRow("accra-1", 0.9, 0.2),
+                FakeOpportunityRow("accra-2", 0.4, 0.1),
+            ]
+
+    class FakeAiClient:
+        """Fake AI client returning canned commentary."""
+
+        def generate_opportunity_commentary(self, _ranked_regions):
+            """Return canned commentary."""
+            return {"commentary": "ai"}
+
+    service = InsightService(
+        InsightServiceDependencies(
+            demographics_repository=object(),
+            spending_repository=object(),
+            labour_stats_repository=object(),
+            opportunity_scores_repository=FakeOpportunityRepository(),
+            ai_engine_client=FakeAiClient(),
+        )
+    )
+
+    result = service.find_opportunities(
+        db_session=None,
+        city="Accra",
+        business_type="retail",
+        constraints=None,
+        country=None,
+        tenant_id=uuid4(),
+    )
+
+    assert result["stats_used"] == {
+        "business_type": "retail",
+        "constraints": None,
+        "region_count": 2,
+    }
+    assert len(result["opportunities"]) == 2
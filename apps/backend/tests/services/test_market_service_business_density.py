@@ -10,7 +10,7 @@ from services.market_service import MarketService
 
 
 class FakeBusinessDensityRow:
-    """Row-like fixture representing a business density ORM row."""
+    """Row-like fixture representing a projected business density row."""
 
     def __init__(self):
         """Populate fixture fields."""
@@ -23,14 +23,21 @@ class FakeBusinessDensityRow:
         self.coordinates = None
         self.last_updated = datetime.utcnow()
 
+    @property
+    def _mapping(self):
+        """Column-name mapping, as on a SQLAlchemy `Row`."""
+        return vars(self)
+
 
 def test_get_business_density_maps_rows():
-    """Service maps ORM rows into response dicts."""
+    """Service maps projected rows into response dicts."""
 
     class FakeBusinessDensityRepository:
         """Fake density repository returning one row."""
 
-        def list_by_city_and_type(self, _db_session, _city, _country, _business_type):
+        def list_columns_by_city_and_type(
+            self, _db_session, _city, _country, _business_type, columns
+        ):
             """Return canned density rows."""
             return [FakeBusinessDensityRow()]
 
@@ -41,7 +48,7 @@ def test_get_business_density_maps_rows():
             """Not used in this test."""
             raise AssertionError("not used")
 
-        def list_by_city(self, _db_session, _city, _country):
+        def list_columns_by_city(self, _db_session, _city, _country, columns):
             """Not used in this test."""
             raise AssertionError("not used")
 
@@ -91,7 +98,9 @@ def test_get_business_density_raises_404_when_empty():
     class FakeBusinessDensityRepository:
         """Fake density repository returning no rows."""
 
-        def list_by_city_and_type(self, _db_session, _city, _country, _business_type):
+        def list_columns_by_city_and_type(
+            self, _db_session, _city, _country, _business_type, columns
+        ):
             """Return empty list."""
             return []
 
@@ -102,7 +111,7 @@ def test_get_business_density_raises_404_when_empty():
             """Not used in this test."""
             raise AssertionError("not used")
 
-        def list_by_city(self, _db_session, _city, _country):
+        def list_columns_by_city(self, _db_session, _city, _country, columns):
             """Not used in this test."""
             raise AssertionError("not used")
 
@@ -0,0 +1,109 @@
+"""Unit tests for `MarketService.list_cities` against a real SQL database."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import models.core  # noqa: F401  (registers `tenants` for the market table FKs)
+from models.db import Base
+from models.market import BusinessDensity, Demographics
+from repositories.business_density_repository import BusinessDensityRepository
+from repositories.demographics_repository import DemographicsRepository
+from repositories.labour_stats_repository import LabourStatsRepository
+from repositories.spending_repository import SpendingRepository
+from services.dependencies import MarketServiceDependencies
+from services.market_service import MarketService
+
+
+@pytest.fixture(autouse=True)
+def clear_city_cache():
+    """Start each test with an empty city-list cache."""
+    MarketService.invalidate_market_caches()
+    yield
+    MarketService.invalidate_market_caches()
+
+
+@pytest.fixture
+def db_session():
+    """Yield a session on an in-memory database with the market tables."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine, tables=[Demographics.__table__, BusinessDensity.__table__]
+    )
+    with Session(engine) as session:
+        yield session
+
+
+def _service() -> MarketService:
+    return MarketService(
+        MarketServiceDependencies(
+            demographics_repository=DemographicsRepository(),
+            business_density_repository=BusinessDensityRepository(),
+            spending_repository=SpendingRepository(),
+            labour_stats_repository=LabourStatsRepository(),
+        )
+    )
+
+
+def _demographics(city: str, country: str) -> Demographics:
+    return Demographics(
+        geo_id=f"{city}-1",
+        country=country,
+        city=city,
+        population_total=1,
+        median_income=1,
+    )
+
+
+def _density(city: str, country: str) -> BusinessDensity:
+    return BusinessDensity(
+        geo_id=f"{city}-1", country=country, city=city, business_type="retail"
+    )
+
+
+def test_list_cities_intersects_with_business_density(db_session):
+    """Only demographics cities that also have density rows are listed."""
+    db_session.add_all(
+        [
+            _demographics("Toronto", "CA"),
+            _demographics("Ottawa", "CA"),
+            _demographics("Accra", "GH"),
+            _density("Toronto", "CA"),
+            _density("Toronto", "CA"),
+            _density("Accra", "GH"),
+        ]
+    )
+    db_session.flush()
+
+    assert _service().list_cities(db_session, country=None) == ["Accra", "Toronto"]
+    assert _service().list_cities(db_session, country="CA") == ["Toronto"]
+
+
+def test_list_cities_falls_back_to_demographics_without_density(db_session):
+    """Without density rows for the country, all demographics cities are listed."""
+    db_session.add_all(
+        [
+            _demographics("Toronto", "CA"),
+            _demographics("Ottawa", "CA"),
+            _density("Accra", "GH"),
+        ]
+    )
+    db_session.flush()
+
+    assert _service().list_cities(db_session, country="CA") == ["Ottawa", "Toronto"]
+
+
+def test_list_cities_is_cached_until_invalidated(db_session):
+    """Repeat lookups are served from cache until ingestion invalidates it."""
+    db_session.add(_demographics("Toronto", "CA"))
+    db_session.flush()
+    service = _service()
+
+    assert service.list_cities(db_session, country="CA") == ["Toronto"]
+
+    db_session.add(_demographics("Ottawa", "CA"))
+    db_session.flush()
+    assert service.list_cities(db_session, country="CA") == ["Toronto"]
+
+    MarketService.invalidate_market_caches()
+    assert service.list_cities(db_session, country="CA") == ["Ottawa", "Toronto"]
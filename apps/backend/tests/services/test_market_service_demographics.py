@@ -4,13 +4,19 @@ from datetime import datetime
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
+import models.core  # noqa: F401  (registers `tenants` for the market table FKs)
+from models.db import Base
+from models.market import Demographics
+from repositories.demographics_repository import DemographicsRepository
 from services.dependencies import MarketServiceDependencies
 from services.market_service import MarketService
 
 
 class FakeDemographicsRow:
-    """Row-like fixture representing a demographics ORM row."""
+    """Row-like fixture representing a projected demographics row."""
 
     def __init__(self):
         """Populate fixture fields."""
@@ -26,18 +32,24 @@ class FakeDemographicsRow:
         self.coordinates = None
         self.last_updated = datetime.utcnow()
 
+    @property
+    def _mapping(self):
+        """Column-name mapping, as on a SQLAlchemy `Row`."""
+        return vars(self)
+
 
 def test_get_demographics_by_region_maps_rows():
-    """Service maps ORM rows into response dicts."""
+    """Service maps projected rows into response dicts."""
 
     class FakeDemographicsRepository:
         """Fake demographics repository returning canned rows."""
 
-        def list_by_city(self, db_session, city, country):
+        def list_columns_by_city(self, db_session, city, country, columns):
             """Return one demographics row."""
             _ = db_session
             _ = city
             _ = country
+            _ = columns
             return [FakeDemographicsRow()]
 
     class DummyBusinessDensityRepository:
@@ -47,7 +59,9 @@ def test_get_demographics_by_region_maps_rows():
             """Not used in this test."""
             raise AssertionError("not used")
 
-        def list_by_city_and_type(self, _db_session, _city, _country, _business_type):
+        def list_columns_by_city_and_type(
+            self, _db_session, _city, _country, _business_type, columns
+        ):
             """Not used in this test."""
             raise AssertionError("not used")
 
@@ -97,11 +111,12 @@ def test_get_demographics_by_region_raises_404_when_empty():
     class FakeDemographicsRepository:
         """Fake demographics repository returning no rows."""
 
-        def list_by_city(self, db_session, city, country):
+        def list_columns_by_city(self, db_session, city, country, columns):
             """Return empty list."""
             _ = db_session
             _ = city
             _ = country
+            _ = columns
             return []
 
     class DummyBusinessDensityRepository:
@@ -111,7 +126,9 @@ def test_get_demographics_by_region_raises_404_when_empty():
             """Not used in this test."""
             raise AssertionError("not used")
 
-        def list_by_city_and_type(self, _db_session, _city, _country, _business_type):
+        def list_columns_by_city_and_type(
+            self, _db_session, _city, _country, _business_type, columns
+        ):
             """Not used in this test."""
             raise AssertionError("not used")
 
@@ -154,3 +171,36 @@ def test_get_demographics_by_region_raises_404_when_empty():
         service.get_demographics_by_region(None, "Accra", None)
 
     assert exc_info.value.status_code == 404
+
+
+def test_get_demographics_by_region_reads_numeric_columns_as_float():
+    """Numeric market columns come back from the database as `float`."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Demographics.__table__])
+    with Session(engine) as db_session:
+        db_session.add(
+            Demographics(
+                geo_id="accra-1",
+                country="GH",
+                city="Accra",
+                population_total=1000,
+                median_income="123.45",
+                household_size_avg=3.5,
+            )
+        )
+        db_session.commit()
+
+        service = MarketService(
+            MarketServiceDependencies(
+                demographics_repository=DemographicsRepository(),
+                business_density_repository=object(),
+                spending_repository=object(),
+                labour_stats_repository=object(),
+            )
+        )
+        [row] = service.get_demographics_by_region(db_session, "Accra", "GH")
+
+    assert row["median_income"] == 123.45
+    assert type(row["median_income"]) is float
+    assert type(row["household_size_avg"]) is float
+    assert row["immigration_ratio"] is None
@@ -2,10 +2,20 @@
 
 from uuid import uuid4
 
+import pytest
+
 from services.dependencies import MarketServiceDependencies
 from services.market_service import MarketService
 
 
+@pytest.fixture(autouse=True)
+def clear_market_caches():
+    """Start each test with empty market caches."""
+    MarketService.invalidate_market_caches()
+    yield
+    MarketService.invalidate_market_caches()
+
+
 def test_market_service_get_overview_combines_repository_outputs():
     """Overview combines aggregates from all repositories."""
 
@@ -59,3 +69,42 @@ def test_market_service_get_overview_combines_repository_outputs():
     assert overview["spending"] == {"avg_monthly_spend": 120.0}
     assert overview["labour_stats"] == {"avg_unemployment_rate": 0.05}
     assert overview["business_density"] == {"total_business_count": 200}
+
+
+def test_market_service_get_overview_is_cached_until_invalidated():
+    """Repeat overviews for a city are served from cache until invalidated."""
+    calls = []
+
+    class CountingRepository:
+        """Repository recording each aggregate query."""
+
+        def get_city_aggregates(self, _db_session, city, _country):
+            """Record the call and return canned aggregates."""
+            calls.append(city)
+            return {}
+
+        def get_summary(self, _db_session, city, _country):
+            """Record the call and return a canned summary."""
+            calls.append(city)
+            return {}
+
+    repository = CountingRepository()
+    service = MarketService(
+        MarketServiceDependencies(
+            demographics_repository=repository,
+            business_density_repository=repository,
+            spending_repository=repository,
+            labour_stats_repository=repository,
+        )
+    )
+
+    service.get_overview(None, "Accra", "GH", tenant_id=uuid4())
+    service.get_overview(None, "Accra", "GH", tenant_id=uuid4())
+    assert len(calls) == 4
+
+    service.get_overview(None, "Kumasi", "GH", tenant_id=uuid4())
+    assert len(calls) == 8
+
+    MarketService.invalidate_market_caches()
+    service.get_overview(None, "Accra", "GH", tenant_id=uuid4())
+    assert len(calls) == 12
@@ -0,0 +1,79 @@
+"""Unit tests for `MarketService.get_spending_by_region`."""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import models.core  # noqa: F401  (registers `tenants` for the market table FKs)
+from models.db import Base
+from models.market import Spending
+from repositories.business_density_repository import BusinessDensityRepository
+from repositories.demographics_repository import DemographicsRepository
+from repositories.labour_stats_repository import LabourStatsRepository
+from repositories.spending_repository import SpendingRepository
+from services.dependencies import MarketServiceDependencies
+from services.market_service import MarketService
+
+
+@pytest.fixture
+def db_session():
+    """Yield a session on an in-memory database with seeded spending rows."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Spending.__table__])
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Spending(
+                    geo_id="accra-1",
+                    country="GH",
+                    city="Accra",
+                    category="food",
+                    avg_monthly_spend=50,
+                ),
+                Spending(
+                    geo_id="accra-1",
+                    country="GH",
+                    city="Accra",
+                    category="retail",
+                    avg_monthly_spend=20,
+                ),
+            ]
+        )
+        session.commit()
+        yield session
+
+
+def _service() -> MarketService:
+    return MarketService(
+        MarketServiceDependencies(
+            # Stateless repositories; only spending is queried here.
+            demographics_repository=DemographicsRepository(),
+            business_density_repository=BusinessDensityRepository(),
+            spending_repository=SpendingRepository(),
+            labour_stats_repository=LabourStatsRepository(),
+        )
+    )
+
+
+def test_get_spending_by_region_filters_category_in_query(db_session):
+    """Only rows for the requested category are returned."""
+    result = _service().get_spending_by_region(db_session, "Accra", "GH", "retail")
+
+    assert [row["category"] for row in result] == ["retail"]
+    assert result[0]["avg_monthly_spend"] == 20.0
+
+
+def test_get_spending_by_region_without_category_returns_all(db_session):
+    """No category returns every category for the city."""
+    result = _service().get_spending_by_region(db_session, "Accra", "GH", None)
+
+    assert [row["category"] for row in result] == ["food", "retail"]
+
+
+def test_get_spending_by_region_unknown_category_raises_404(db_session):
+    """A category with no rows yields 404."""
+    with pytest.raises(HTTPException) as exc_info:
+        _service().get_spending_by_region(db_session, "Accra", "GH", "travel")
+
+    assert exc_info.value.status_code == 404
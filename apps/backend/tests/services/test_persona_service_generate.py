@@ -24,14 +24,14 @@ def test_generate_personas_calls_ai_client():
     class FakeDemographicsRepository:
         """Fake demographics repository returning one row."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return canned demographics rows."""
             return [FakeDemographicsRow()]
 
     class EmptyRepository:
         """Stub repository returning no rows."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return empty list."""
             return []
 
@@ -70,7 +70,7 @@ def test_generate_personas_raises_404_when_no_data():
     class EmptyRepository:
         """Stub repository returning no rows."""
 
-        def get_for_regions(self, _db_session, _city, _country):
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
             """Return empty list."""
             return []
 
@@ -101,3 +101,49 @@ def test_generate_personas_raises_404_when_no_data():
         )
 
     assert exc_info.value.status_code == 404
+
+
+def test_generate_personas_pushes_geo_ids_to_repositories():
+    """Requested regions are passed to each repository as a `geo_ids` filter."""
+    seen_geo_ids = []
+
+    class RecordingRepository:
+        """Repository recording the `geo_ids` filter it was called with."""
+
+        def __init__(self, rows):
+            self._rows = rows
+
+        def get_for_regions(self, _db_session, _city, _country, geo_ids=None):
+            """Record the filter and return the canned rows."""
+            seen_geo_ids.append(geo_ids)
+            return self._rows
+
+    class FakeAiClient:
+        """Fake AI client capturing the payload."""
+
+        def generate_personas(self, input_payload):
+            """Return canned personas."""
+            assert [row["geo_id"] for row in input_payload["demographics"]] == [
+                "accra-1"
+            ]
+            return {"headline": "ai", "personas": []}
+
+    service = PersonaService(
+        PersonaServiceDependencies(
+            demographics_repository=RecordingRepository([FakeDemographicsRow()]),
+            spending_repository=RecordingRepository([]),
+            labour_stats_repository=RecordingRepository([]),
+            ai_engine_client=FakeAiClient(),
+        )
+    )
+
+    service.generate_personas(
+        db_session=None,
+        city="Accra",
+        country=None,
+        geo_ids=["accra-1", "accra-2", "accra-1"],
+        business_type=None,
+        tenant_id=uuid4(),
+    )
+
+    assert seen_geo_ids == [("accra-1", "accra-2")] * 3
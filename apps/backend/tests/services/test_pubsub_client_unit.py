@@ -1,29 +1,160 @@
-from contextlib import contextmanager
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any
+from uuid import UUID
 
 from api.config import Settings
 from services.pubsub_client import PubSubClient
 
 
-@contextmanager
-def _disable_dotenv_for_settings() -> Any:
-    old_env_file = Settings.model_config.get("env_file")
-    Settings.model_config["env_file"] = None
-    try:
-        yield
-    finally:
-        Settings.model_config["env_file"] = old_env_file
+def _acked() -> Future:
+    future: Future = Future()
+    future.set_result("message-id")
+    return future
 
 
 def test_pubsub_client_noop_when_disabled() -> None:
-    with _disable_dotenv_for_settings():
-        settings = Settings(pubsub_enabled=False)
-        client = PubSubClient(settings=settings)
-        client.publish_ingestion_job(topic="ingestion-jobs", message={"hello": "world"})
+    settings = Settings(pubsub_enabled=False)
+    client = PubSubClient(settings=settings)
+    client.publish_ingestion_job(topic="ingestion-jobs", message={"hello": "world"})
 
 
 def test_pubsub_client_noop_when_library_missing() -> None:
-    with _disable_dotenv_for_settings():
-        settings = Settings(pubsub_enabled=True, gcp_project_id="proj")
-        client = PubSubClient(settings=settings)
-        client.publish_ingestion_job(topic="ingestion-jobs", message={"hello": "world"})
+    settings = Settings(pubsub_enabled=True, gcp_project_id="proj")
+    client = PubSubClient(settings=settings)
+    client.publish_ingestion_job(topic="ingestion-jobs", message={"hello": "world"})
+
+
+def test_pubsub_client_publishes_pre_encoded_message_as_is(monkeypatch) -> None:
+    published: list[tuple[str, bytes]] = []
+
+    class FakePublisher:
+        def topic_path(self, project_id: str, topic: str) -> str:
+            return f"projects/{project_id}/topics/{topic}"
+
+        def publish(self, topic_path: str, data: bytes) -> Future:
+            published.append((topic_path, data))
+            return _acked()
+
+    monkeypatch.setattr("services.pubsub_client._try_import_pubsub", lambda: object())
+    settings = Settings(pubsub_enabled=True, gcp_project_id="proj")
+    client = PubSubClient(settings=settings, publisher_client=FakePublisher())
+
+    client.publish_ingestion_job(
+        topic="ingestion-jobs", message={"hello": "world"}, raw_message=b"RAW"
+    )
+    client.publish_ingestion_job(topic="ingestion-jobs", message={"hello": "world"})
+
+    assert published == [
+        ("projects/proj/topics/ingestion-jobs", b"RAW"),
+        ("projects/proj/topics/ingestion-jobs", b'{"hello":"world"}'),
+    ]
+
+
+def test_pubsub_client_encodes_uuid_datetime_and_decimal(monkeypatch) -> None:
+    published: list[bytes] = []
+
+    class FakePublisher:
+        def topic_path(self, project_id: str, topic: str) -> str:
+            return f"projects/{project_id}/topics/{topic}"
+
+        def publish(self, topic_path: str, data: bytes) -> Future:
+            published.append(data)
+            return _acked()
+
+    monkeypatch.setattr("services.pubsub_client._try_import_pubsub", lambda: object())
+    settings = Settings(pubsub_enabled=True, gcp_project_id="proj")
+    client = PubSubClient(settings=settings, publisher_client=FakePublisher())
+
+    client.publish_report_job(
+        topic="report-jobs",
+        message={
+            "job_id": UUID("00000000-0000-0000-0000-000000000001"),
+            "requested_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            "score": Decimal("1.5"),
+        },
+    )
+
+    assert published == [
+        b'{"job_id":"00000000-0000-0000-0000-000000000001",'
+        b'"requested_at":"2024-01-02T03:04:05+00:00","score":"1.5"}'
+    ]
+
+
+def test_pubsub_clients_share_one_publisher_and_cache_topic_paths(
+    monkeypatch,
+) -> None:
+    created: list[object] = []
+    topic_path_calls: list[str] = []
+
+    class FakePublisher:
+        def __init__(self, batch_settings: object) -> None:
+            created.append(batch_settings)
+
+        def topic_path(self, project_id: str, topic: str) -> str:
+            topic_path_calls.append(topic)
+            return f"projects/{project_id}/topics/{topic}"
+
+        def publish(self, topic_path: str, data: bytes) -> Future:
+            return _acked()
+
+    class FakeTypes:
+        @staticmethod
+        def BatchSettings(**kwargs: Any) -> dict[str, Any]:
+            return kwargs
+
+    class FakePubSubModule:
+        PublisherClient = FakePublisher
+        types = FakeTypes
+
+    monkeypatch.setattr(
+        "services.pubsub_client._try_import_pubsub", lambda: FakePubSubModule
+    )
+    monkeypatch.setattr("services.pubsub_client._shared_publisher", None)
+    settings = Settings(pubsub_enabled=True, gcp_project_id="proj")
+    first = PubSubClient(settings=settings)
+    second = PubSubClient(settings=settings)
+
+    first.publish_ingestion_job(topic="ingestion-jobs", message={"n": 1})
+    first.publish_ingestion_job(topic="ingestion-jobs", message={"n": 2})
+    first.publish_embedding_job(topic="embedding-jobs", message={"n": 3})
+    second.publish_ingestion_job(topic="ingestion-jobs", message={"n": 4})
+
+    assert created == [{"max_messages": 100, "max_bytes": 1 << 20, "max_latency": 0.05}]
+    assert topic_path_calls == ["ingestion-jobs", "embedding-jobs", "ingestion-jobs"]
+
+
+def test_try_import_pubsub_is_memoized() -> None:
+    from services.pubsub_client import _try_import_pubsub
+
+    assert _try_import_pubsub() is _try_import_pubsub()
+    assert _try_import_pubsub.cache_info().hits >= 1
+
+
+def test_pubsub_client_logs_unacknowledged_publish_without_raising(
+    monkeypatch, caplog
+) -> None:
+    pending: Future = Future()
+
+    class FakePublisher:
+        def topic_path(self, project_id: str, topic: str) -> str:
+            return f"projects/{project_id}/topics/{topic}"
+
+        def publish(self, topic_path: str, data: bytes) -> Future:
+            return pending
+
+    monkeypatch.setattr("services.pubsub_client._try_import_pubsub", lambda: object())
+    settings = Settings(pubsub_enabled=True, gcp_project_id="proj")
+    client = PubSubClient(settings=settings, publisher_client=FakePublisher())
+
+    client.publish_report_job(topic="report-jobs", message={"report_job_id": "j1"})
+    assert not pending.done()
+
+    with caplog.at_level("ERROR", logger="services.pubsub_client"):
+        pending.set_exception(RuntimeError("broker unavailable"))
+
+    errors = [record for record in caplog.records if record.levelname == "ERROR"]
+    assert [record.getMessage() for record in errors] == [
+        "Pub/Sub publish was not acknowledged"
+    ]
@@ -1,11 +1,21 @@
 """Unit tests for `ReportService.create_feasibility_report`."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 from uuid import uuid4
 
 import pytest
-from fastapi import HTTPException
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
 
+import models.core  # noqa: F401  (registers `tenants` for the FK)
 from api.schemas.reports import FeasibilityReportRequest
+from models.db import Base
+from models.reports import ReportJob
+from repositories.report_jobs_repository import ReportJobsRepository
 from services.dependencies import ReportServiceDependencies
 from services.report_service import ReportService
 
@@ -19,16 +29,29 @@ class FakeJob:
         self.status = "PENDING"
 
 
+class FakeSession:
+    """Session double recording commits into a shared event log."""
+
+    def __init__(self, events: list[str]):
+        """Create a session appending to `events`."""
+        self._events = events
+
+    def commit(self):
+        """Record the commit."""
+        self._events.append("commit")
+
+
 def test_create_feasibility_report_creates_job_and_publishes():
-    """Happy path creates job and publishes a Pub/Sub message."""
+    """Happy path commits the job, then publishes a Pub/Sub message."""
     published_messages = []
+    events: list[str] = []
 
     class FakeBillingService:
-        """Fake billing service allowing quota."""
+        """Fake billing service for an unlimited tenant."""
 
-        def check_report_quota(self, _db_session, _tenant_id):
-            """Return True to allow report creation."""
-            return True
+        def get_report_quota(self, _db_session, _tenant_id):
+            """Return None: no report limit applies."""
+            return None
 
     class FakeJobsRepository:
         """Fake report jobs repository returning a pending job."""
@@ -54,6 +77,7 @@ def test_create_feasibility_report_creates_job_and_publishes():
 
         def publish_report_job(self, topic, message):
             """Append published message."""
+            events.append("publish")
             published_messages.append((topic, message))
 
     service = ReportService(
@@ -65,7 +89,7 @@ def test_create_feasibility_report_creates_job_and_publishes():
     )
 
     result = service.create_feasibility_report(
-        db_session=None,
+        db_session=FakeSession(events),
         request=FeasibilityReportRequest(
             city="Accra", country="GH", business_type="retail"
         ),
@@ -75,36 +99,81 @@ def test_create_feasibility_report_creates_job_and_publishes():
 
     assert result["status"] == "PENDING"
     assert len(published_messages) == 1
+    assert events == ["commit", "publish"]
+
+
+def test_create_feasibility_report_defers_publish_to_background_tasks():
+    """With `background_tasks`, the publish runs only when the tasks run."""
+    events: list[str] = []
+
+    class FakeBillingService:
+        """Fake billing service for an unlimited tenant."""
+
+        def get_report_quota(self, _db_session, _tenant_id):
+            """Return None: no report limit applies."""
+            return None
+
+    class FakeJobsRepository:
+        """Fake report jobs repository returning a pending job."""
+
+        def create_pending_job(self, _db_session, **_job_fields):
+            """Return a canned pending job."""
+            return FakeJob("job-1")
+
+    class FakePubSubClient:
+        """Fake Pub/Sub client recording publishes."""
+
+        def publish_report_job(self, topic, message):
+            """Record the published job id."""
+            events.append(f"publish {topic} {message['report_job_id']}")
+
+    service = ReportService(
+        ReportServiceDependencies(
+            report_jobs_repository=FakeJobsRepository(),
+            billing_service=FakeBillingService(),
+            pubsub_client=FakePubSubClient(),
+        )
+    )
+    background_tasks = BackgroundTasks()
+
+    result = service.create_feasibility_report(
+        db_session=FakeSession(events),
+        request=FeasibilityReportRequest(
+            city="Accra", country="GH", business_type="retail"
+        ),
+        tenant_id=uuid4(),
+        user_id=uuid4(),
+        background_tasks=background_tasks,
+    )
+
+    assert result == {"job_id": "job-1", "status": "PENDING"}
+    assert events == ["commit"]
+
+    asyncio.run(background_tasks())
+
+    assert events == ["commit", "publish report-jobs job-1"]
 
 
 def test_create_feasibility_report_raises_when_quota_exceeded():
     """Quota exceeded raises HTTP 402 and does not publish."""
 
     class FakeBillingService:
-        """Fake billing service denying quota."""
+        """Fake billing service for a tenant on a limited plan."""
 
-        def check_report_quota(self, _db_session, _tenant_id):
-            """Return False to deny report creation."""
-            return False
+        def get_report_quota(self, _db_session, _tenant_id):
+            """Return a limit of 5 reports this month."""
+            return 5, datetime(2024, 1, 1, tzinfo=timezone.utc)
 
-    class DummyJobsRepository:
-        """Stub report jobs repository (unused)."""
+    class FullQuotaJobsRepository:
+        """Fake report jobs repository whose quota-guarded insert is a no-op."""
 
-        def create_pending_job(
-            self,
-            _db_session,
-            *,
-            tenant_id,
-            city,
-            country,
-            business_type,
+        def create_pending_job_within_quota(
+            self, _db_session, *, report_limit, since, **_job_fields
         ):
-            """Not used in this test."""
-            _ = tenant_id
-            _ = city
-            _ = country
-            _ = business_type
-            raise AssertionError("should not be called")
+            """Return None as if the tenant had already used its quota."""
+            assert report_limit == 5
+            assert since == datetime(2024, 1, 1, tzinfo=timezone.utc)
+            return None
 
     class DummyPubSubClient:
         """Stub Pub/Sub client (unused)."""
@@ -115,7 +184,7 @@ def test_create_feasibility_report_raises_when_quota_exceeded():
 
     service = ReportService(
         ReportServiceDependencies(
-            report_jobs_repository=DummyJobsRepository(),
+            report_jobs_repository=FullQuotaJobsRepository(),
             billing_service=FakeBillingService(),
             pubsub_client=DummyPubSubClient(),
         )
@@ -132,3 +201,68 @@ def test_create_feasibility_report_raises_when_quota_exceeded():
         )
 
     assert exc_info.value.status_code == 402
+
+
+def test_create_pending_job_within_quota_stops_at_report_limit():
+    """The guarded insert adds jobs until the period's count reaches the limit."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[ReportJob.__table__])
+    repository = ReportJobsRepository()
+    tenant_id = uuid4()
+    period_start = datetime.now(timezone.utc) - timedelta(days=1)
+
+    with Session(engine) as session:
+        created = [
+            repository.create_pending_job_within_quota(
+                session,
+                tenant_id=tenant_id,
+                city="Accra",
+                country="GH",
+                business_type="retail",
+                report_limit=2,
+                since=period_start,
+            )
+            for _ in range(3)
+        ]
+        session.commit()
+        stored_ids = set(session.scalars(select(ReportJob.id)))
+
+    assert [row is None for row in created] == [False, False, True]
+    assert created[0].status == "PENDING"
+    assert stored_ids == {created[0].id, created[1].id}
+
+
+def test_create_pending_job_within_quota_locks_tenant_on_postgresql():
+    """On PostgreSQL the tenant's advisory lock is taken before the insert."""
+
+    class RecordingSession:
+        """Session double on a PostgreSQL bind that records statements."""
+
+        def __init__(self):
+            """Start with no executed statements."""
+            self.statements: list[str] = []
+
+        def get_bind(self):
+            """Return a bind whose dialect is PostgreSQL."""
+            return SimpleNamespace(dialect=postgresql.dialect())
+
+        def execute(self, statement):
+            """Record the compiled statement and return no rows."""
+            self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+            return SimpleNamespace(first=lambda: None)
+
+    session = RecordingSession()
+    queued = ReportJobsRepository().create_pending_job_within_quota(
+        session,
+        tenant_id=uuid4(),
+        city="Accra",
+        country="GH",
+        business_type="retail",
+        report_limit=1,
+        since=datetime.now(timezone.utc),
+    )
+
+    assert queued is None
+    assert len(session.statements) == 2
+    assert "pg_advisory_xact_lock(hashtext(" in session.statements[0]
+    assert session.statements[1].startswith("INSERT INTO report_jobs")
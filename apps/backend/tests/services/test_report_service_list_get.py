@@ -1,10 +1,18 @@
 """Unit tests for `ReportService` list/get behaviors."""
 
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
-
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+import models.core  # noqa: F401  (registers `tenants` for the FK)
+from api.schemas.reports import ReportJobRead
+from models.db import Base
+from models.reports import ReportJob
+from repositories.report_jobs_repository import ReportJobsRepository
 from services.dependencies import ReportServiceDependencies
 from services.report_service import ReportService
 
@@ -25,9 +33,10 @@ def test_list_reports_returns_jobs_for_tenant():
     class FakeRepo:
         """Fake report jobs repository."""
 
-        def list_by_tenant(self, _db_session, requested_tenant_id):
+        def list_by_tenant(self, _db_session, requested_tenant_id, limit, offset):
             """Return canned jobs."""
             assert requested_tenant_id == tenant_id
+            assert (limit, offset) == (20, 40)
             return jobs
 
     class DummyBillingService:
@@ -51,7 +60,9 @@ def test_list_reports_returns_jobs_for_tenant():
             pubsub_client=DummyPubSubClient(),
         )
     )
-    result = service.list_reports(db_session=None, tenant_id=tenant_id)
+    result = service.list_reports(
+        db_session=None, tenant_id=tenant_id, limit=20, offset=40
+    )
 
     assert result == jobs
 
@@ -92,3 +103,74 @@ def test_get_report_raises_404_when_missing():
         service.get_report(db_session=None, report_id=uuid4(), tenant_id=uuid4())
 
     assert exc_info.value.status_code == 404
+
+
+def test_list_reports_pages_in_one_query():
+    """A page of report jobs is loaded and serialized with a single SELECT."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[ReportJob.__table__])
+    tenant_id = uuid4()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with Session(engine) as session:
+        session.add_all(
+            ReportJob(
+                tenant_id=tenant_id,
+                city=f"City {n}",
+                country="GH",
+                business_type="retail",
+                status="PENDING",
+                created_at=start + timedelta(days=n),
+                updated_at=start,
+            )
+            for n in range(5)
+        )
+        session.commit()
+
+    service = ReportService(
+        ReportServiceDependencies(
+            report_jobs_repository=ReportJobsRepository(),
+            billing_service=object(),
+            pubsub_client=object(),
+        )
+    )
+    statements: list[str] = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    with Session(engine) as session:
+        jobs = service.list_reports(session, tenant_id, limit=2, offset=1)
+        rows = [ReportJobRead.model_validate(job) for job in jobs]
+
+    assert [row.city for row in rows] == ["City 3", "City 2"]
+    assert len(statements) == 1
+
+
+def test_get_for_tenant_is_scoped_to_tenant():
+    """A job is only returned for its own tenant."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[ReportJob.__table__])
+    tenant_id = uuid4()
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    with Session(engine) as session:
+        job = ReportJob(
+            tenant_id=tenant_id,
+            city="Accra",
+            country="GH",
+            business_type="retail",
+            status="PENDING",
+            created_at=now,
+            updated_at=now,
+        )
+        session.add(job)
+        session.commit()
+        job_id = job.id
+
+    repository = ReportJobsRepository()
+    with Session(engine) as session:
+        found = repository.get_for_tenant(session, job_id, tenant_id)
+        other_tenant = repository.get_for_tenant(session, job_id, uuid4())
+
+    assert found is not None and found.id == job_id
+    assert other_tenant is None
@@ -0,0 +1,49 @@
+"""Unit tests for the in-process `SingleFlight` request coalescer."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.singleflight import SingleFlight
+
+
+def test_concurrent_calls_for_same_key_share_one_execution():
+    """Callers arriving while a call is in flight get its result."""
+    flight: SingleFlight[str] = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_lookup():
+        calls.append("lookup")
+        release.wait(timeout=5)
+        return "profile"
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(flight.do, "user-1", slow_lookup)
+        while len(flight) == 0:
+            time.sleep(0.001)
+        followers = [pool.submit(flight.do, "user-1", slow_lookup) for _ in range(2)]
+        # Give the followers time to reach the in-flight future before release.
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result(), *(f.result() for f in followers)]
+
+    assert results == ["profile", "profile", "profile"]
+    assert calls == ["lookup"]
+    assert len(flight) == 0
+
+
+def test_exception_is_raised_and_key_is_released():
+    """A failing call raises for its caller and does not pin the key."""
+    flight: SingleFlight[int] = SingleFlight()
+
+    def failing_lookup():
+        raise LookupError("not found")
+
+    with pytest.raises(LookupError):
+        flight.do("user-1", failing_lookup)
+
+    assert flight.do("user-1", lambda: 7) == 7
+    assert len(flight) == 0
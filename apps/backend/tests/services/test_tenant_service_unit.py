@@ -0,0 +1,83 @@
+"""Unit tests for `TenantService.get_current_tenant`."""
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from services.dependencies import TenantServiceDependencies
+from services.tenant_service import TenantService
+
+
+@pytest.fixture(autouse=True)
+def clear_tenant_cache():
+    """Start each test with an empty tenant cache."""
+    TenantService.invalidate_tenant_cache()
+    yield
+    TenantService.invalidate_tenant_cache()
+
+
+class FakeTenant:
+    """Minimal tenant row fixture."""
+
+    def __init__(self, tenant_id):
+        """Create fixture with tenant columns."""
+        self.id = tenant_id
+        self.name = "Acme"
+        self.plan = "starter"
+        self.created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.updated_at = None
+
+
+class RecordingTenantRepository:
+    """Fake tenant repository counting lookups."""
+
+    def __init__(self, tenants):
+        """Serve `tenants` keyed by id."""
+        self._tenants = tenants
+        self.calls = 0
+
+    def get_by_id(self, _db_session, tenant_id):
+        """Return the tenant for `tenant_id`, or None."""
+        self.calls += 1
+        return self._tenants.get(tenant_id)
+
+
+def test_get_current_tenant_caches_snapshot_until_invalidated():
+    """Repeat lookups are served from cache until the tenant is invalidated."""
+    tenant_id = uuid4()
+    repository = RecordingTenantRepository({tenant_id: FakeTenant(tenant_id)})
+    service = TenantService(TenantServiceDependencies(tenant_repository=repository))
+
+    first = service.get_current_tenant(None, tenant_id)
+    second = service.get_current_tenant(None, tenant_id)
+
+    assert first.model_dump() == {
+        "id": tenant_id,
+        "name": "Acme",
+        "plan": "starter",
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+        "updated_at": None,
+    }
+    assert second is first
+    assert repository.calls == 1
+
+    TenantService.invalidate_tenant_cache(tenant_id)
+    service.get_current_tenant(None, tenant_id)
+
+    assert repository.calls == 2
+
+
+def test_get_current_tenant_missing_raises_404_and_is_not_cached():
+    """Unknown tenants raise 404 on every lookup."""
+    repository = RecordingTenantRepository({})
+    service = TenantService(TenantServiceDependencies(tenant_repository=repository))
+    tenant_id = uuid4()
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            service.get_current_tenant(None, tenant_id)
+        assert exc_info.value.status_code == 404
+
+    assert repository.calls == 2
@@ -0,0 +1,64 @@
+"""Unit tests for the in-process `TTLCache`."""
+
+from services.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_value_until_ttl_expires():
+    """Entries are served until their TTL elapses."""
+    clock = FakeClock()
+    cache: TTLCache[str] = TTLCache(maxsize=4, ttl_s=10, clock=clock)
+
+    cache.set("k", "v")
+    clock.now = 9.9
+    assert cache.get("k") == "v"
+
+    clock.now = 10.0
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used_entry():
+    """Exceeding `maxsize` evicts the least recently used key."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl_s=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_clear_drops_all_entries():
+    """`clear` empties the cache."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl_s=60)
+    cache.set("a", 1)
+
+    cache.clear()
+
+    assert cache.get("a") is None
+
+
+def test_delete_removes_single_entry():
+    """`delete` drops one key and ignores missing keys."""
+    cache: TTLCache[int] = TTLCache(maxsize=2, ttl_s=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    cache.delete("missing")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2